@@ -3,55 +3,163 @@
 from __future__ import annotations
 
 import logging
-
-from acond_heat_pump import AcondHeatPump
+from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
-
-from .const import DEFAULT_PORT, DOMAIN, PLATFORMS
-from .coordinator import AcondCoordinator
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.importlib import async_import_module
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    CONF_HUB,
+    CONF_MAX_IN_FLIGHT,
+    CONF_REPLAY_FILE,
+    CONF_REPLAY_SPEED,
+    CONF_TRAFFIC_LOG,
+    CONF_TRANSPORT,
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_PORT,
+    DEFAULT_REPLAY_SPEED,
+    DEFAULT_TRAFFIC_LOG,
+    DEFAULT_TRANSPORT,
+    DOMAIN,
+    HUB_PLATFORMS,
+    PLATFORMS,
+    STORAGE_VERSION,
+)
+from .hub import AcondHub, async_get_hub
+
+if TYPE_CHECKING:
+    from .coordinator import AcondCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 type AcondConfigEntry = ConfigEntry[AcondCoordinator]
+type AcondHubConfigEntry = ConfigEntry[AcondHub]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register the integration's services."""
+    services_module = await async_import_module(hass, f"{__name__}.services")
+    services_module.async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: AcondConfigEntry) -> bool:
     """Set up Acond Heat Pump from a config entry."""
+    hub = async_get_hub(hass)
+    if entry.data.get(CONF_HUB):
+        return await _async_setup_hub_entry(hass, entry, hub)
+
     host = entry.data[CONF_HOST]
     port = entry.data.get(CONF_PORT, DEFAULT_PORT)
-    client = AcondHeatPump(host, port)
-
-    try:
-        connected = await hass.async_add_executor_job(client.connect)
-    except Exception as err:
-        raise ConfigEntryNotReady(
-            f"Could not connect to heat pump at {host}:{port}"
-        ) from err
-
-    if not connected:
-        raise ConfigEntryNotReady(
-            f"Could not connect to heat pump at {host}:{port}"
+    transport = entry.options.get(CONF_TRANSPORT, DEFAULT_TRANSPORT)
+
+    # The device library loads with the first heat pump, in the executor,
+    # instead of whenever Home Assistant loads the integration
+    connection_module = await async_import_module(hass, f"{__name__}.connection")
+    coordinator_module = await async_import_module(hass, f"{__name__}.coordinator")
+
+    recorder = replay = None
+    if (replay_file := entry.options.get(CONF_REPLAY_FILE)) is not None:
+        traffic_module = await async_import_module(hass, f"{__name__}.traffic")
+        try:
+            replay = await hass.async_add_executor_job(
+                traffic_module.TrafficReplay,
+                replay_file,
+                entry.options.get(CONF_REPLAY_SPEED, DEFAULT_REPLAY_SPEED),
+            )
+        except (OSError, ValueError) as err:
+            raise ConfigEntryNotReady(f"Could not open {replay_file}: {err}") from err
+    elif entry.options.get(CONF_TRAFFIC_LOG, DEFAULT_TRAFFIC_LOG):
+        traffic_module = await async_import_module(hass, f"{__name__}.traffic")
+        recorder = traffic_module.TrafficRecorder(
+            hass, hass.config.path(f"{DOMAIN}.{entry.entry_id}.frames")
         )
 
-    coordinator = AcondCoordinator(hass, client, entry)
-    await coordinator.async_config_entry_first_refresh()
+    connection = connection_module.AcondConnection(
+        hass,
+        host,
+        port,
+        transport,
+        hub.limiter,
+        entry.options.get(CONF_MAX_IN_FLIGHT, DEFAULT_MAX_IN_FLIGHT),
+        recorder,
+        replay,
+    )
+
+    coordinator = coordinator_module.AcondCoordinator(hass, connection, entry)
+    restored = await coordinator.async_restore_snapshot()
+    if not restored:
+        try:
+            connected = await connection.async_connect()
+        except Exception as err:
+            raise ConfigEntryNotReady(
+                f"Could not connect to heat pump at {host}:{port}"
+            ) from err
+
+        if not connected:
+            raise ConfigEntryNotReady(
+                f"Could not connect to heat pump at {host}:{port}"
+            )
+
+        await coordinator.async_config_entry_first_refresh()
 
     entry.runtime_data = coordinator
+    entry.async_on_unload(hub.async_add_unit(entry.entry_id, coordinator))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    coordinator.scheduler.async_start()
+
+    if restored:
+        # Entities start from the last known data; connect and poll off the
+        # startup path
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} refresh {host}"
+        )
+
     return True
 
 
+async def _async_setup_hub_entry(
+    hass: HomeAssistant, entry: AcondHubConfigEntry, hub: AcondHub
+) -> bool:
+    """Set up the hub config entry carrying the aggregate sensors."""
+    await hub.async_refresh()
+    entry.runtime_data = hub
+    await hass.config_entries.async_forward_entry_setups(entry, HUB_PLATFORMS)
+    return True
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: AcondConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: AcondConfigEntry) -> None:
+    """Delete the stored snapshot of a removed heat pump."""
+    if not entry.data.get(CONF_HUB):
+        await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: AcondConfigEntry) -> bool:
     """Unload a config entry."""
+    if entry.data.get(CONF_HUB):
+        return await hass.config_entries.async_unload_platforms(entry, HUB_PLATFORMS)
+
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        await hass.async_add_executor_job(entry.runtime_data.client.close)
+        await entry.runtime_data.async_shutdown()
+        await entry.runtime_data.connection.async_close()
 
     return unload_ok
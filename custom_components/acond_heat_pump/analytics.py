@@ -0,0 +1,135 @@
+"""Compressor cycle and defrost analytics for the Acond Heat Pump integration."""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from typing import Any
+
+from acond_heat_pump import HeatPumpStatus
+
+_LOGGER = logging.getLogger(__name__)
+
+# Polls further apart than this break the observed cycle: an edge across the
+# gap is still counted, but durations spanning it are not [s]
+MAX_GAP = 900
+
+# Window of the starts per hour rate [s]
+STARTS_WINDOW = 3600
+
+
+class CycleTracker:
+    """Count the on edges of a status bit and time its on and off phases.
+
+    Edges are timed at the poll that observes them, so durations are accurate
+    to one polling interval.
+    """
+
+    __slots__ = (
+        "count",
+        "last_off",
+        "last_on",
+        "on_time",
+        "since",
+        "state",
+        "updated_at",
+    )
+
+    def __init__(self) -> None:
+        """Initialize a tracker that has not seen the signal yet."""
+        self.count = 0
+        """On edges observed."""
+        self.on_time = 0.0
+        """Total time on [s]."""
+        self.last_on: float | None = None
+        """Duration of the last completed on phase [s]."""
+        self.last_off: float | None = None
+        """Duration of the last completed off phase [s]."""
+        self.state: bool | None = None
+        self.since: float | None = None
+        """Time of the last edge; None if the current phase began unobserved."""
+        self.updated_at: float | None = None
+
+    def update(self, timestamp: float, state: bool) -> bool:
+        """Add a sample; return True on an on edge."""
+        previous, updated_at = self.state, self.updated_at
+        self.state, self.updated_at = state, timestamp
+        if previous is None or updated_at is None:
+            return False
+        gap = timestamp - updated_at
+        if not 0 <= gap <= MAX_GAP:
+            # Cycles within the gap went unobserved
+            self.since = None
+        else:
+            if previous:
+                self.on_time += gap
+            if state != previous:
+                if self.since is not None:
+                    if state:
+                        self.last_off = timestamp - self.since
+                    else:
+                        self.last_on = timestamp - self.since
+                self.since = timestamp
+        started = state and not previous
+        if started:
+            self.count += 1
+        return started
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state to persist."""
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def restore(self, stored: dict[str, Any]) -> None:
+        """Restore a persisted state."""
+        for slot in self.__slots__:
+            if slot in stored:
+                setattr(self, slot, stored[slot])
+
+
+class CycleAnalytics:
+    """Compressor cycle and defrost statistics, updated in O(1) per poll."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.compressor = CycleTracker()
+        self.defrost = CycleTracker()
+        self._recent_starts: deque[float] = deque()
+        """Compressor start times within STARTS_WINDOW of the last poll."""
+
+    def update(self, timestamp: float, status: HeatPumpStatus) -> None:
+        """Fold in the status bits of a successful poll."""
+        if self.compressor.update(timestamp, status.running):
+            self._recent_starts.append(timestamp)
+        self.defrost.update(timestamp, status.defrost)
+        while self._recent_starts and (
+            self._recent_starts[0] <= timestamp - STARTS_WINDOW
+        ):
+            self._recent_starts.popleft()
+
+    @property
+    def starts_per_hour(self) -> int | None:
+        """Return the compressor starts within the last hour."""
+        if self.compressor.updated_at is None:
+            return None
+        return len(self._recent_starts)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state to persist."""
+        return {
+            "compressor": self.compressor.as_dict(),
+            "defrost": self.defrost.as_dict(),
+            "recent_starts": list(self._recent_starts),
+        }
+
+    def restore(self, stored: dict[str, Any]) -> None:
+        """Restore a persisted state, ignoring it if malformed."""
+        compressor, defrost = CycleTracker(), CycleTracker()
+        try:
+            compressor.restore(stored["compressor"])
+            defrost.restore(stored["defrost"])
+            recent_starts = deque(float(start) for start in stored["recent_starts"])
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.debug("Ignoring invalid cycle analytics %s", stored)
+            return
+        self.compressor, self.defrost = compressor, defrost
+        self._recent_starts = recent_starts
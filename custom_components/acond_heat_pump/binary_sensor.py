@@ -25,6 +25,7 @@ from .entity import AcondEntity
 class AcondBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes an Acond binary sensor entity."""
 
+    data_key: str
     value_fn: Callable[[HeatPumpStatus], bool]
 
 
@@ -34,6 +35,7 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[AcondBinarySensorEntityDescription, ...] = (
         translation_key="running",
         icon="mdi:heat-pump",
         device_class=BinarySensorDeviceClass.RUNNING,
+        data_key="status.running",
         value_fn=lambda status: status.running,
     ),
     AcondBinarySensorEntityDescription(
@@ -41,6 +43,7 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[AcondBinarySensorEntityDescription, ...] = (
         translation_key="fault",
         icon="mdi:alert-octagon",
         device_class=BinarySensorDeviceClass.PROBLEM,
+        data_key="status.fault",
         value_fn=lambda status: status.fault,
     ),
     AcondBinarySensorEntityDescription(
@@ -48,6 +51,7 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[AcondBinarySensorEntityDescription, ...] = (
         translation_key="defrost",
         icon="mdi:snowflake-melt",
         entity_category=EntityCategory.DIAGNOSTIC,
+        data_key="status.defrost",
         value_fn=lambda status: status.defrost,
     ),
     AcondBinarySensorEntityDescription(
@@ -55,6 +59,7 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[AcondBinarySensorEntityDescription, ...] = (
         translation_key="dhw_heating",
         icon="mdi:water-boiler",
         device_class=BinarySensorDeviceClass.RUNNING,
+        data_key="status.heating_dhw",
         value_fn=lambda status: status.heating_dhw,
     ),
     AcondBinarySensorEntityDescription(
@@ -63,12 +68,14 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[AcondBinarySensorEntityDescription, ...] = (
         icon="mdi:pump",
         device_class=BinarySensorDeviceClass.RUNNING,
         entity_category=EntityCategory.DIAGNOSTIC,
+        data_key="status.pump_circuit1",
         value_fn=lambda status: status.pump_circuit1,
     ),
     AcondBinarySensorEntityDescription(
         key="summer_mode",
         translation_key="summer_mode",
         icon="mdi:weather-sunny",
+        data_key="status.summer_mode",
         value_fn=lambda status: status.summer_mode,
     ),
     AcondBinarySensorEntityDescription(
@@ -76,6 +83,7 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[AcondBinarySensorEntityDescription, ...] = (
         translation_key="power",
         icon="mdi:power",
         device_class=BinarySensorDeviceClass.POWER,
+        data_key="status.on",
         value_fn=lambda status: status.on,
     ),
     AcondBinarySensorEntityDescription(
@@ -84,6 +92,7 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[AcondBinarySensorEntityDescription, ...] = (
         icon="mdi:pump",
         device_class=BinarySensorDeviceClass.RUNNING,
         entity_category=EntityCategory.DIAGNOSTIC,
+        data_key="status.pump_circuit2",
         value_fn=lambda status: status.pump_circuit2,
     ),
     AcondBinarySensorEntityDescription(
@@ -92,6 +101,7 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[AcondBinarySensorEntityDescription, ...] = (
         icon="mdi:solar-power",
         device_class=BinarySensorDeviceClass.RUNNING,
         entity_category=EntityCategory.DIAGNOSTIC,
+        data_key="status.solar_pump",
         value_fn=lambda status: status.solar_pump,
     ),
     AcondBinarySensorEntityDescription(
@@ -100,6 +110,7 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[AcondBinarySensorEntityDescription, ...] = (
         icon="mdi:pool",
         device_class=BinarySensorDeviceClass.RUNNING,
         entity_category=EntityCategory.DIAGNOSTIC,
+        data_key="status.pool_pump",
         value_fn=lambda status: status.pool_pump,
     ),
     AcondBinarySensorEntityDescription(
@@ -108,6 +119,7 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[AcondBinarySensorEntityDescription, ...] = (
         icon="mdi:fire",
         device_class=BinarySensorDeviceClass.RUNNING,
         entity_category=EntityCategory.DIAGNOSTIC,
+        data_key="status.bivalence_running",
         value_fn=lambda status: status.bivalence_running,
     ),
     AcondBinarySensorEntityDescription(
@@ -116,6 +128,7 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[AcondBinarySensorEntityDescription, ...] = (
         icon="mdi:pump",
         device_class=BinarySensorDeviceClass.RUNNING,
         entity_category=EntityCategory.DIAGNOSTIC,
+        data_key="status.brine_pump",
         value_fn=lambda status: status.brine_pump,
     ),
     AcondBinarySensorEntityDescription(
@@ -124,6 +137,7 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[AcondBinarySensorEntityDescription, ...] = (
         icon="mdi:snowflake",
         device_class=BinarySensorDeviceClass.RUNNING,
         entity_category=EntityCategory.DIAGNOSTIC,
+        data_key="status.cooling_running",
         value_fn=lambda status: status.cooling_running,
     ),
 )
@@ -137,8 +151,13 @@ async def async_setup_entry(
     """Set up the Acond binary sensor entities."""
     coordinator = entry.runtime_data
     async_add_entities(
-        AcondBinarySensor(coordinator, entry.entry_id, description)
-        for description in BINARY_SENSOR_DESCRIPTIONS
+        [
+            *(
+                AcondBinarySensor(coordinator, entry.entry_id, description)
+                for description in BINARY_SENSOR_DESCRIPTIONS
+            ),
+            AcondStaleBinarySensor(coordinator, entry.entry_id),
+        ]
     )
 
 
@@ -157,8 +176,34 @@ class AcondBinarySensor(AcondEntity, BinarySensorEntity):
         super().__init__(coordinator, entry_id)
         self.entity_description = description
         self._attr_unique_id = f"{entry_id}_binary_sensor_{description.key}"
+        self._data_keys = frozenset({description.data_key})
 
     @property
     def is_on(self) -> bool:
         """Return true if the binary sensor is on."""
         return self.entity_description.value_fn(self.coordinator.data.status)
+
+
+class AcondStaleBinarySensor(AcondEntity, BinarySensorEntity):
+    """On while the data shown is a snapshot restored from the last run."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_translation_key = "stale_data"
+    _attr_icon = "mdi:history"
+    # Only changes on the first update after startup, when every entity updates
+    _data_keys: frozenset[str] = frozenset()
+
+    def __init__(self, coordinator: AcondCoordinator, entry_id: str) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, entry_id)
+        self._attr_unique_id = f"{entry_id}_binary_sensor_stale_data"
+
+    @property
+    def available(self) -> bool:
+        """Staleness is known even while the heat pump is unreachable."""
+        return True
+
+    @property
+    def is_on(self) -> bool:
+        """Return true if no poll has succeeded since startup."""
+        return self.coordinator.stale
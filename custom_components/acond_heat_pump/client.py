@@ -0,0 +1,768 @@
+"""Modbus TCP transports for the Acond Heat Pump integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import socket
+import struct
+import time
+from collections.abc import Callable, Iterable
+from contextlib import nullcontext
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from acond_heat_pump import (
+    AcondHeatPump,
+    HeatPumpConnectionError,
+    HeatPumpMode,
+    HeatPumpResponse,
+    RegulationMode,
+)
+
+from .const import DEFAULT_PORT, TRANSPORT_EXECUTOR
+from .stats import AcondStats
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .traffic import TrafficRecorder, TrafficReplay
+
+_LOGGER = logging.getLogger(__name__)
+
+DEVICE_ID = 1
+DEFAULT_TIMEOUT = 5.0
+
+# TCP keep-alive: probe an idle connection after KEEPALIVE_IDLE seconds, every
+# KEEPALIVE_INTERVAL seconds, and drop it after KEEPALIVE_COUNT lost probes
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 10
+KEEPALIVE_COUNT = 3
+
+# Modbus function codes
+READ_HOLDING_REGISTERS = 0x03
+READ_INPUT_REGISTERS = 0x04
+WRITE_SINGLE_REGISTER = 0x06
+WRITE_MULTIPLE_REGISTERS = 0x10
+
+# Input registers 30001-30024 hold the whole HeatPumpResponse, one field each
+INPUT_FIELDS: tuple[str, ...] = (
+    "indoor1_temp_set",
+    "indoor1_temp_actual",
+    "indoor2_temp_set",
+    "indoor2_temp_actual",
+    "dhw_temp_set",
+    "dhw_temp_actual",
+    "status",
+    "water_back_temp_set",
+    "water_back_temp_actual",
+    "outdoor_temp_actual",
+    "solar_temp_actual",
+    "pool_temp_actual",
+    "pool_temp_set",
+    "heat_pump_mode",
+    "regulation_mode",
+    "brine_temp",
+    "heart_beat",
+    "water_outlet_temp_actual",
+    "water_outlet_temp_set",
+    "compressor_capacity_max",
+    "err_number",
+    "err_number_SECMono",
+    "err_number_driver",
+    "compressor_capacity_actual",
+)
+INPUT_REGISTER_COUNT = len(INPUT_FIELDS)
+INPUT_REGISTER_BY_FIELD: dict[str, int] = {
+    field: register for register, field in enumerate(INPUT_FIELDS)
+}
+
+# Merge read spans separated by at most this many unwanted registers; a gap
+# costs 2 bytes per register, a separate request about 21 bytes of framing.
+# Registers of a group that isn't due are never bridged, so that slow groups
+# aren't read on every poll anyway
+MAX_SPAN_GAP = 10
+
+
+class HeatPumpProtocolError(HeatPumpConnectionError):
+    """The heat pump answered with an error; the connection is still usable."""
+
+
+@dataclass(frozen=True, kw_only=True)
+class RegisterGroup:
+    """A contiguous block of input registers polled at its own interval."""
+
+    name: str
+    start: int
+    count: int
+    interval: timedelta | None = None
+    """Minimum time between reads; None reads the group on every poll."""
+    pro_only: bool = False
+    """Only meaningful on PRO units; polled at SLOW_GROUP_INTERVAL otherwise."""
+
+    @property
+    def end(self) -> int:
+        """Return the address after the last register of the group."""
+        return self.start + self.count
+
+
+SLOW_GROUP_INTERVAL = timedelta(minutes=5)
+
+REGISTER_GROUPS: tuple[RegisterGroup, ...] = (
+    # Temperatures, status bits, modes and the setpoints interleaved with them
+    RegisterGroup(name="live", start=0, count=18),
+    # Cooling setpoint, max capacity and error codes rarely change
+    RegisterGroup(name="limits", start=18, count=5, interval=SLOW_GROUP_INTERVAL),
+    RegisterGroup(name="power", start=23, count=1, pro_only=True),
+)
+
+# Holding register addresses (40001 offset)
+REG_INDOOR1_TEMP_SET = 0
+REG_INDOOR2_TEMP_SET = 2
+REG_DHW_TEMP_SET = 4
+REG_TC_SET = 5
+REG_REGULATION_MODE = 6
+REG_WATER_BACK_TEMP_SET = 7
+REG_POOL_TEMP_SET = 11
+REG_WATER_COOL_TEMP_SET = 12
+
+# Temperature setpoint register -> accepted range [°C]
+SETPOINT_RANGES: dict[int, tuple[float, float]] = {
+    REG_INDOOR1_TEMP_SET: (10.0, 30.0),
+    REG_INDOOR2_TEMP_SET: (10.0, 30.0),
+    REG_DHW_TEMP_SET: (10.0, 50.0),
+    REG_WATER_BACK_TEMP_SET: (10.0, 65.0),
+    REG_POOL_TEMP_SET: (10.0, 50.0),
+    REG_WATER_COOL_TEMP_SET: (15.0, 30.0),
+}
+
+# Temperature setpoint register -> HeatPumpResponse field reporting it
+SETPOINT_FIELDS: dict[int, str] = {
+    REG_INDOOR1_TEMP_SET: "indoor1_temp_set",
+    REG_INDOOR2_TEMP_SET: "indoor2_temp_set",
+    REG_DHW_TEMP_SET: "dhw_temp_set",
+    REG_WATER_BACK_TEMP_SET: "water_back_temp_set",
+    REG_POOL_TEMP_SET: "pool_temp_set",
+    REG_WATER_COOL_TEMP_SET: "water_outlet_temp_set",
+}
+
+# Temperature input register field -> plausible range [°C]; readings outside
+# it are reported as None
+TEMPERATURE_RANGES: dict[str, tuple[float | None, float | None]] = {
+    "indoor1_temp_set": (10.0, 30.0),
+    "indoor1_temp_actual": (0.0, 50.0),
+    "indoor2_temp_set": (10.0, 30.0),
+    "indoor2_temp_actual": (0.0, 50.0),
+    "dhw_temp_set": (10.0, 50.0),
+    "dhw_temp_actual": (0.0, 90.0),
+    "water_back_temp_set": (20.0, 60.0),
+    "water_back_temp_actual": (-10.0, 90.0),
+    "outdoor_temp_actual": (-50.0, 50.0),
+    "solar_temp_actual": (-50.0, 300.0),
+    "pool_temp_actual": (0.0, 50.0),
+    "pool_temp_set": (None, None),
+    "brine_temp": (-30.0, 50.0),
+    "water_outlet_temp_actual": (-10.0, 90.0),
+    "water_outlet_temp_set": (10.0, 25.0),
+}
+
+_MBAP_HEADER = struct.Struct(">HHHB")
+
+# Frame sizes used to account traffic of the blocking client [bytes]
+_READ_REQUEST_SIZE = _MBAP_HEADER.size + 5
+_READ_RESPONSE_OVERHEAD = _MBAP_HEADER.size + 2
+_WRITE_MULTIPLE_OVERHEAD = _MBAP_HEADER.size + 6
+_WRITE_FRAME_SIZE = _MBAP_HEADER.size + 5
+
+
+def decode_temperature(raw: int, field: str) -> float | None:
+    """Decode the temperature register of a field, None if out of its range."""
+    return AcondHeatPump._read_temp_register(raw, *TEMPERATURE_RANGES[field])
+
+
+def decode_registers(registers: list[int]) -> HeatPumpResponse:
+    """Decode the input register block into a HeatPumpResponse."""
+    return HeatPumpResponse(
+        **{
+            field: decode_temperature(registers[INPUT_REGISTER_BY_FIELD[field]], field)
+            for field in TEMPERATURE_RANGES
+        },
+        status=AcondHeatPump._parse_status_bits(registers[6]),
+        heat_pump_mode=HeatPumpMode(registers[13]),
+        regulation_mode=RegulationMode(registers[14]),
+        heart_beat=registers[16],
+        compressor_capacity_max=registers[19],
+        err_number=registers[20],
+        err_number_SECMono=registers[21],
+        err_number_driver=registers[22],
+        compressor_capacity_actual=registers[23],
+    )
+
+
+def plan_reads(
+    groups: Iterable[RegisterGroup], skipped: Iterable[RegisterGroup] = ()
+) -> list[tuple[int, int]]:
+    """Return (start, count) read requests covering the given groups.
+
+    Gaps overlapping a skipped group are not bridged.
+    """
+    skipped = list(skipped)
+    spans: list[list[int]] = []
+    for group in sorted(groups, key=lambda group: group.start):
+        if (
+            spans
+            and group.start - spans[-1][1] <= MAX_SPAN_GAP
+            and not any(
+                other.start < group.start and spans[-1][1] < other.end
+                for other in skipped
+            )
+        ):
+            spans[-1][1] = max(spans[-1][1], group.end)
+        else:
+            spans.append([group.start, group.end])
+    return [(start, end - start) for start, end in spans]
+
+
+def encode_setpoint(register: int, temperature: float) -> int:
+    """Validate a temperature setpoint and scale it to its register value."""
+    low, high = SETPOINT_RANGES[register]
+    if not low <= temperature <= high:
+        raise ValueError(f"Temperature must be between {low} and {high} °C")
+    return round(temperature * 10)
+
+
+def indoor_setpoint_register(circuit: int) -> int:
+    """Return the indoor temperature setpoint register for a circuit."""
+    if circuit == 1:
+        return REG_INDOOR1_TEMP_SET
+    if circuit == 2:
+        return REG_INDOOR2_TEMP_SET
+    raise ValueError("Invalid circuit number. Use 1 or 2.")
+
+
+def contiguous_runs(values: dict[int, int]) -> list[tuple[int, list[int]]]:
+    """Group register values into runs of consecutive addresses."""
+    runs: list[tuple[int, list[int]]] = []
+    for address in sorted(values):
+        if runs and runs[-1][0] + len(runs[-1][1]) == address:
+            runs[-1][1].append(values[address])
+        else:
+            runs.append((address, [values[address]]))
+    return runs
+
+
+def enable_keepalive(sock: Any) -> None:
+    """Turn on TCP keep-alive so half-open connections are detected."""
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    for option, value in (
+        ("TCP_KEEPIDLE", KEEPALIVE_IDLE),
+        ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL),
+        ("TCP_KEEPCNT", KEEPALIVE_COUNT),
+    ):
+        if hasattr(socket, option):
+            sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+
+
+class AcondAsyncClient:
+    """Modbus TCP client talking to the heat pump over asyncio streams.
+
+    Mirrors the API of the blocking AcondHeatPump client, but every call is
+    awaited directly on the event loop instead of hopping to the executor.
+    Up to max_in_flight requests are pipelined on the connection; a reader
+    task matches responses to requests by their MBAP transaction id. A shared
+    limiter, if given, is also held for every request. With a recorder, the
+    raw frames of every exchange are logged.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = DEFAULT_PORT,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_in_flight: int = 1,
+        stats: AcondStats | None = None,
+        recorder: TrafficRecorder | None = None,
+        limiter: asyncio.Semaphore | None = None,
+    ) -> None:
+        """Initialize the client."""
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.stats = stats or AcondStats()
+        self._recorder = recorder
+        self._limiter = limiter
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._pending: dict[int, asyncio.Future[bytes]] = {}
+        self._transaction_id = 0
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the TCP connection is open."""
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def connect(self) -> bool:
+        """Open the TCP connection to the heat pump."""
+        if self.connected:
+            return True
+        try:
+            reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout
+            )
+        except (OSError, TimeoutError) as err:
+            _LOGGER.debug("Connecting to %s:%s failed: %s", self.host, self.port, err)
+            return False
+        if (sock := self._writer.get_extra_info("socket")) is not None:
+            enable_keepalive(sock)
+        self._reader_task = asyncio.create_task(
+            self._read_responses(reader, self._writer),
+            name=f"acond_heat_pump reader {self.host}:{self.port}",
+        )
+        return True
+
+    async def close(self) -> None:
+        """Close the TCP connection, failing requests still in flight."""
+        reader_task, self._reader_task = self._reader_task, None
+        writer, self._writer = self._writer, None
+        if reader_task is not None and reader_task is not asyncio.current_task():
+            reader_task.cancel()
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(
+                    HeatPumpConnectionError(
+                        f"Connection to {self.host}:{self.port} closed"
+                    )
+                )
+        if writer is None:
+            return
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+    async def _read_responses(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Read response frames and resolve the matching requests."""
+        try:
+            while True:
+                header = await reader.readexactly(_MBAP_HEADER.size)
+                transaction_id, _, length, _ = _MBAP_HEADER.unpack(header)
+                if length < 2:
+                    # Not even a function code follows the unit id; the
+                    # stream can't be resynchronized
+                    raise ValueError(f"Invalid MBAP length {length}")
+                pdu = await reader.readexactly(length - 1)
+                self.stats.bytes_received += len(header) + len(pdu)
+                future = self._pending.pop(transaction_id, None)
+                if future is None:
+                    # Late answer to a request that already timed out
+                    _LOGGER.debug("Dropping response %s", transaction_id)
+                elif not future.done():
+                    future.set_result(header + pdu)
+        except (OSError, ValueError, asyncio.IncompleteReadError) as err:
+            _LOGGER.debug("Connection to %s:%s lost: %r", self.host, self.port, err)
+            if self._writer is writer:
+                await self.close()
+
+    async def _request(self, function_code: int, payload: bytes) -> bytes:
+        """Send one Modbus request and return the response PDU data."""
+        pdu = await self._exchange(function_code, payload)
+        if len(pdu) < 2:
+            raise HeatPumpProtocolError(f"Truncated response PDU {pdu.hex()}")
+        if pdu[0] == function_code | 0x80:
+            raise HeatPumpProtocolError(
+                f"Modbus exception {pdu[1]} for function {function_code:#04x}"
+            )
+        if pdu[0] != function_code:
+            raise HeatPumpProtocolError(
+                f"Unexpected function code {pdu[0]:#04x} in response"
+            )
+        return pdu[1:]
+
+    async def _exchange(self, function_code: int, payload: bytes) -> bytes:
+        """Send one Modbus request frame and return the response PDU."""
+        async with self._in_flight, self._limiter or nullcontext():
+            if (writer := self._writer) is None or writer.is_closing():
+                raise HeatPumpConnectionError(
+                    f"Not connected to heat pump at {self.host}:{self.port}"
+                )
+            self._transaction_id = (self._transaction_id + 1) & 0xFFFF
+            transaction_id = self._transaction_id
+            future = self._pending[transaction_id] = (
+                asyncio.get_running_loop().create_future()
+            )
+            frame = (
+                _MBAP_HEADER.pack(transaction_id, 0, len(payload) + 2, DEVICE_ID)
+                + bytes((function_code,))
+                + payload
+            )
+            try:
+                writer.write(frame)
+                self.stats.bytes_sent += len(frame)
+                await writer.drain()
+                response = await asyncio.wait_for(future, self.timeout)
+            except HeatPumpConnectionError:
+                # The connection was lost while waiting for the response
+                self._record(frame, b"")
+                raise
+            except (OSError, TimeoutError) as err:
+                self._record(frame, b"")
+                await self.close()
+                raise HeatPumpConnectionError(
+                    f"Error communicating with {self.host}:{self.port}: {err!r}"
+                ) from err
+            finally:
+                self._pending.pop(transaction_id, None)
+        self._record(frame, response)
+        return response[_MBAP_HEADER.size :]
+
+    def _record(self, request: bytes, response: bytes) -> None:
+        """Log an exchange if traffic is recorded."""
+        if self._recorder is not None:
+            self._recorder.record(request, response)
+
+    async def _read_registers(
+        self, function_code: int, address: int, count: int
+    ) -> list[int]:
+        """Read a block of 16-bit registers."""
+        data = await self._request(function_code, struct.pack(">HH", address, count))
+        if data[0] != count * 2 or len(data) != 1 + count * 2:
+            raise HeatPumpProtocolError(
+                f"Expected {count * 2} data bytes, got {len(data) - 1} "
+                f"with byte count {data[0]}"
+            )
+        return list(struct.unpack(f">{count}H", data[1:]))
+
+    async def read_input_registers(self, address: int, count: int) -> list[int]:
+        """Read input registers."""
+        return await self._read_registers(READ_INPUT_REGISTERS, address, count)
+
+    async def read_input_spans(
+        self, spans: Iterable[tuple[int, int]]
+    ) -> list[list[int]]:
+        """Read several (start, count) spans of input registers, pipelined."""
+        return await asyncio.gather(
+            *(self.read_input_registers(start, count) for start, count in spans)
+        )
+
+    async def read_holding_registers(self, address: int, count: int) -> list[int]:
+        """Read holding registers."""
+        return await self._read_registers(READ_HOLDING_REGISTERS, address, count)
+
+    async def write_register(self, address: int, value: int) -> None:
+        """Write a single holding register."""
+        await self._request(
+            WRITE_SINGLE_REGISTER, struct.pack(">HH", address, value & 0xFFFF)
+        )
+
+    async def write_registers(self, address: int, values: list[int]) -> None:
+        """Write a run of consecutive holding registers in one request."""
+        if len(values) == 1:
+            await self.write_register(address, values[0])
+            return
+        payload = struct.pack(
+            f">HHB{len(values)}H",
+            address,
+            len(values),
+            len(values) * 2,
+            *(value & 0xFFFF for value in values),
+        )
+        await self._request(WRITE_MULTIPLE_REGISTERS, payload)
+
+    async def read_data(self) -> HeatPumpResponse:
+        """Read all input registers and parse them into a HeatPumpResponse."""
+        registers = await self.read_input_registers(0, INPUT_REGISTER_COUNT)
+        return decode_registers(registers)
+
+    async def set_indoor_temperature(
+        self, temperature: float, circuit: int = 1
+    ) -> None:
+        """Set the desired indoor temperature for a given circuit (1 or 2)."""
+        register = indoor_setpoint_register(circuit)
+        await self.write_register(register, encode_setpoint(register, temperature))
+
+    async def set_dhw_temperature(self, temperature: float) -> None:
+        """Set the desired domestic hot water temperature."""
+        await self.write_register(
+            REG_DHW_TEMP_SET, encode_setpoint(REG_DHW_TEMP_SET, temperature)
+        )
+
+    async def set_water_back_temperature(self, temperature: float) -> None:
+        """Set the desired return water temperature."""
+        await self.write_register(
+            REG_WATER_BACK_TEMP_SET,
+            encode_setpoint(REG_WATER_BACK_TEMP_SET, temperature),
+        )
+
+    async def set_pool_temperature(self, temperature: float) -> None:
+        """Set the desired pool water temperature."""
+        await self.write_register(
+            REG_POOL_TEMP_SET, encode_setpoint(REG_POOL_TEMP_SET, temperature)
+        )
+
+    async def set_water_cool_temperature(self, temperature: float) -> None:
+        """Set the desired water outlet temperature in cooling mode."""
+        await self.write_register(
+            REG_WATER_COOL_TEMP_SET,
+            encode_setpoint(REG_WATER_COOL_TEMP_SET, temperature),
+        )
+
+    async def set_regulation_mode(self, mode: RegulationMode) -> None:
+        """Set the regulation mode."""
+        await self.write_register(REG_REGULATION_MODE, mode.value)
+
+    async def change_setting(self, mode: HeatPumpMode) -> None:
+        """Set the heat pump operating mode, preserving non-mode TC_set bits."""
+        (current,) = await self.read_holding_registers(REG_TC_SET, 1)
+        bit = AcondHeatPump._MODE_BIT_POSITION[mode]
+        mask = AcondHeatPump._MODE_BITS_MASK
+        await self.write_register(REG_TC_SET, (current & ~mask) | (1 << bit))
+
+    async def set_summer_mode(self, summer: bool) -> None:
+        """Set or clear the summer mode bit in TC_set."""
+        (current,) = await self.read_holding_registers(REG_TC_SET, 1)
+        bit = 1 << AcondHeatPump._SUMMER_MODE_BIT
+        await self.write_register(
+            REG_TC_SET, current | bit if summer else current & ~bit
+        )
+
+
+class AcondReplayClient(AcondAsyncClient):
+    """Transport answering requests from a recorded traffic log.
+
+    The frames go through the same parsing as live ones. A recorded failure
+    drops the connection, so reconnects are replayed too. Writes that were
+    not recorded are acknowledged.
+    """
+
+    def __init__(self, replay: TrafficReplay, stats: AcondStats | None = None) -> None:
+        """Initialize the client."""
+        super().__init__(replay.path, 0, stats=stats)
+        self._replay = replay
+        self._connected = False
+
+    @property
+    def connected(self) -> bool:
+        """Return True while the replayed connection is open."""
+        return self._connected
+
+    async def connect(self) -> bool:
+        """Open the replayed connection."""
+        self._connected = True
+        return True
+
+    async def close(self) -> None:
+        """Close the replayed connection."""
+        self._connected = False
+
+    async def _exchange(self, function_code: int, payload: bytes) -> bytes:
+        """Return the recorded response PDU to a request."""
+        if not self._connected:
+            raise HeatPumpConnectionError(f"Not connected to replay of {self.host}")
+        request = bytes((function_code,)) + payload
+        self.stats.bytes_sent += _MBAP_HEADER.size + len(request)
+        if (response := self._replay.response(request)) is None:
+            if function_code == WRITE_SINGLE_REGISTER:
+                return request
+            if function_code == WRITE_MULTIPLE_REGISTERS:
+                return request[:5]
+            raise HeatPumpProtocolError(f"No recorded response to {request.hex()}")
+        if not response:
+            self._connected = False
+            raise HeatPumpConnectionError(f"Replayed failure from {self.host}")
+        self.stats.bytes_received += len(response)
+        return response[_MBAP_HEADER.size :]
+
+
+class AcondExecutorClient:
+    """Fallback transport running the blocking AcondHeatPump in the executor."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        port: int = DEFAULT_PORT,
+        stats: AcondStats | None = None,
+        limiter: asyncio.Semaphore | None = None,
+    ) -> None:
+        """Initialize the client."""
+        self.hass = hass
+        self.host = host
+        self.port = port
+        self.stats = stats or AcondStats()
+        self._client = AcondHeatPump(host, port)
+        self._limiter = limiter
+
+    async def _run[T](self, method: Callable[..., T], *args: Any) -> T:
+        """Run a blocking call in the executor, recording the queue wait.
+
+        The blocking client sends one request at a time, so holding the
+        shared limiter for the call holds it for every request.
+        """
+        submitted = time.perf_counter()
+
+        def job() -> tuple[float, T]:
+            return time.perf_counter(), method(*args)
+
+        async with self._limiter or nullcontext():
+            started, result = await self.hass.async_add_executor_job(job)
+        self.stats.executor_wait.record(started - submitted)
+        return result
+
+    async def _call_setter(
+        self,
+        method: Callable[..., bool],
+        *args: Any,
+        request_size: int = _WRITE_FRAME_SIZE,
+    ) -> None:
+        """Run a blocking setter and raise if the heat pump rejected it."""
+        self.stats.bytes_sent += request_size
+        if not await self._run(method, *args):
+            raise HeatPumpProtocolError(
+                f"Heat pump at {self.host}:{self.port} rejected {method.__name__}"
+            )
+        self.stats.bytes_received += _WRITE_FRAME_SIZE
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the TCP connection is open."""
+        return self._client.client.connected
+
+    def _connect(self) -> bool:
+        """Connect to the heat pump (runs in executor)."""
+        if not self._client.connect():
+            return False
+        if (sock := self._client.client.socket) is not None:
+            enable_keepalive(sock)
+        return True
+
+    async def connect(self) -> bool:
+        """Connect to the heat pump."""
+        return await self._run(self._connect)
+
+    async def close(self) -> None:
+        """Close the connection to the heat pump."""
+        await self._run(self._client.close)
+
+    def _read_input_registers(self, address: int, count: int) -> list[int]:
+        """Read input registers (runs in executor)."""
+        result = self._client.client.read_input_registers(
+            address, count=count, device_id=1
+        )
+        if result.isError():
+            raise HeatPumpProtocolError("Error reading input registers")
+        return result.registers
+
+    async def read_input_registers(self, address: int, count: int) -> list[int]:
+        """Read input registers."""
+        (registers,) = await self.read_input_spans([(address, count)])
+        return registers
+
+    def _read_input_spans(self, spans: list[tuple[int, int]]) -> list[list[int]]:
+        """Read several spans of input registers (runs in executor)."""
+        return [self._read_input_registers(start, count) for start, count in spans]
+
+    async def read_input_spans(
+        self, spans: Iterable[tuple[int, int]]
+    ) -> list[list[int]]:
+        """Read several (start, count) spans of input registers in one job."""
+        spans = list(spans)
+        self.stats.bytes_sent += _READ_REQUEST_SIZE * len(spans)
+        result = await self._run(self._read_input_spans, spans)
+        self.stats.bytes_received += sum(
+            _READ_RESPONSE_OVERHEAD + 2 * count for _, count in spans
+        )
+        return result
+
+    def _write_registers(self, address: int, values: list[int]) -> bool:
+        """Write a run of consecutive holding registers (runs in executor)."""
+        result = self._client.client.write_registers(address, values, device_id=1)
+        return not result.isError()
+
+    async def write_registers(self, address: int, values: list[int]) -> None:
+        """Write a run of consecutive holding registers in one request."""
+        await self._call_setter(
+            self._write_registers,
+            address,
+            values,
+            request_size=_WRITE_MULTIPLE_OVERHEAD + 2 * len(values),
+        )
+
+    async def read_data(self) -> HeatPumpResponse:
+        """Read all input registers and parse them into a HeatPumpResponse."""
+        return await self._run(self._client.read_data)
+
+    async def set_indoor_temperature(
+        self, temperature: float, circuit: int = 1
+    ) -> None:
+        """Set the desired indoor temperature for a given circuit (1 or 2)."""
+        await self._call_setter(
+            self._client.set_indoor_temperature, temperature, circuit
+        )
+
+    async def set_dhw_temperature(self, temperature: float) -> None:
+        """Set the desired domestic hot water temperature."""
+        await self._call_setter(self._client.set_dhw_temperature, temperature)
+
+    async def set_water_back_temperature(self, temperature: float) -> None:
+        """Set the desired return water temperature."""
+        await self._call_setter(self._client.set_water_back_temperature, temperature)
+
+    async def set_pool_temperature(self, temperature: float) -> None:
+        """Set the desired pool water temperature."""
+        await self._call_setter(self._client.set_pool_temperature, temperature)
+
+    async def set_water_cool_temperature(self, temperature: float) -> None:
+        """Set the desired water outlet temperature in cooling mode."""
+        await self._call_setter(self._client.set_water_cool_temperature, temperature)
+
+    async def set_regulation_mode(self, mode: RegulationMode) -> None:
+        """Set the regulation mode."""
+        await self._call_setter(self._client.set_regulation_mode, mode)
+
+    async def change_setting(self, mode: HeatPumpMode) -> None:
+        """Set the heat pump operating mode."""
+        await self._call_setter(self._client.change_setting, mode)
+
+    async def set_summer_mode(self, summer: bool) -> None:
+        """Set or clear summer mode."""
+        await self._call_setter(self._client.set_summer_mode, summer)
+
+
+type AcondClient = AcondAsyncClient | AcondExecutorClient
+
+
+def create_client(
+    hass: HomeAssistant,
+    host: str,
+    port: int,
+    transport: str,
+    max_in_flight: int = 1,
+    stats: AcondStats | None = None,
+    recorder: TrafficRecorder | None = None,
+    replay: TrafficReplay | None = None,
+    limiter: asyncio.Semaphore | None = None,
+) -> AcondClient:
+    """Create a client for the configured transport, or replaying a log.
+
+    max_in_flight and recorder only apply to the asyncio transport; the
+    blocking client cannot pipeline requests and doesn't expose its frames.
+    limiter is held for every request on the network.
+    """
+    if replay is not None:
+        return AcondReplayClient(replay, stats)
+    if transport == TRANSPORT_EXECUTOR:
+        return AcondExecutorClient(hass, host, port, stats, limiter)
+    return AcondAsyncClient(
+        host,
+        port,
+        max_in_flight=max_in_flight,
+        stats=stats,
+        recorder=recorder,
+        limiter=limiter,
+    )
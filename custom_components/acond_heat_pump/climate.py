@@ -17,8 +17,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import AcondConfigEntry
+from .client import REG_INDOOR1_TEMP_SET, REG_INDOOR2_TEMP_SET
 from .coordinator import AcondCoordinator
-from .entity import AcondEntity
+from .entity import AcondSetpointEntity
 
 # HeatPumpMode -> HVACMode (read mapping)
 _MODE_TO_HVAC: dict[HeatPumpMode, HVACMode] = {
@@ -29,6 +30,18 @@ _MODE_TO_HVAC: dict[HeatPumpMode, HVACMode] = {
     HeatPumpMode.COOLING: HVACMode.COOL,
 }
 
+# Data keys shared by both circuits: HVAC mode, action and supported features
+_COMMON_DATA_KEYS = frozenset(
+    {
+        "heat_pump_mode",
+        "regulation_mode",
+        "status.on",
+        "status.running",
+        "status.cooling_running",
+        "status.defrost",
+    }
+)
+
 # HVACMode -> HeatPumpMode (write mapping)
 _HVAC_TO_MODE: dict[HVACMode, HeatPumpMode] = {
     HVACMode.AUTO: HeatPumpMode.AUTOMATIC,
@@ -52,7 +65,7 @@ async def async_setup_entry(
     )
 
 
-class AcondClimate(AcondEntity, ClimateEntity):
+class AcondClimate(AcondSetpointEntity, ClimateEntity):
     """Representation of the Acond heat pump Circuit I climate entity."""
 
     _attr_hvac_modes = [HVACMode.AUTO, HVACMode.HEAT, HVACMode.COOL, HVACMode.OFF]
@@ -63,6 +76,8 @@ class AcondClimate(AcondEntity, ClimateEntity):
     _attr_icon = "mdi:heat-pump-outline"
     _attr_translation_key = "circuit1"
     _enable_turn_on_off_backwards_compatibility = False
+    _data_keys = _COMMON_DATA_KEYS | {"indoor1_temp_actual", "indoor1_temp_set"}
+    _setpoint_register = REG_INDOOR1_TEMP_SET
 
     def __init__(self, coordinator: AcondCoordinator, entry_id: str) -> None:
         """Initialize the climate entity."""
@@ -113,22 +128,16 @@ class AcondClimate(AcondEntity, ClimateEntity):
         """Set new target temperature."""
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
             return
-        await self.hass.async_add_executor_job(
-            self.coordinator.client.set_indoor_temperature, temperature, 1
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_setpoint(self._setpoint_register, temperature)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new HVAC mode."""
         if (mode := _HVAC_TO_MODE.get(hvac_mode)) is None:
             return
-        await self.hass.async_add_executor_job(
-            self.coordinator.client.change_setting, mode
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_heat_pump_mode(mode)
 
 
-class AcondClimateCircuit2(AcondEntity, ClimateEntity):
+class AcondClimateCircuit2(AcondSetpointEntity, ClimateEntity):
     """Representation of the Acond heat pump Circuit II climate entity."""
 
     _attr_hvac_modes = [HVACMode.AUTO, HVACMode.HEAT, HVACMode.COOL, HVACMode.OFF]
@@ -139,6 +148,8 @@ class AcondClimateCircuit2(AcondEntity, ClimateEntity):
     _attr_icon = "mdi:heat-pump-outline"
     _attr_translation_key = "circuit2"
     _enable_turn_on_off_backwards_compatibility = False
+    _data_keys = _COMMON_DATA_KEYS | {"indoor2_temp_actual", "indoor2_temp_set"}
+    _setpoint_register = REG_INDOOR2_TEMP_SET
 
     def __init__(self, coordinator: AcondCoordinator, entry_id: str) -> None:
         """Initialize the climate entity."""
@@ -189,16 +200,10 @@ class AcondClimateCircuit2(AcondEntity, ClimateEntity):
         """Set new target temperature for circuit 2."""
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
             return
-        await self.hass.async_add_executor_job(
-            self.coordinator.client.set_indoor_temperature, temperature, 2
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_setpoint(self._setpoint_register, temperature)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new HVAC mode."""
         if (mode := _HVAC_TO_MODE.get(hvac_mode)) is None:
             return
-        await self.hass.async_add_executor_job(
-            self.coordinator.client.change_setting, mode
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_heat_pump_mode(mode)
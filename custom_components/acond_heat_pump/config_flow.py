@@ -3,34 +3,93 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 
-from acond_heat_pump import AcondHeatPump, HeatPumpConnectionError
-
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
+from homeassistant.core import callback
+from homeassistant.helpers.importlib import async_import_module
 from homeassistant.helpers.selector import (
+    BooleanSelector,
     NumberSelector,
     NumberSelectorConfig,
     NumberSelectorMode,
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
     TextSelector,
 )
 
-from .const import DEFAULT_PORT, DOMAIN
+from .const import (
+    CONF_CARNOT_EFFICIENCY,
+    CONF_DIAGNOSTIC_PUBLISH_INTERVAL,
+    CONF_FLOW_RATE,
+    CONF_HEAT_CAPACITY,
+    CONF_HUB,
+    CONF_LOCAL_STATISTICS,
+    CONF_MAX_IN_FLIGHT,
+    CONF_MAX_PUBLISH_INTERVAL,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_POWER_DEADBAND,
+    CONF_SCAN_INTERVAL,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_TRAFFIC_LOG,
+    CONF_TRANSPORT,
+    DEFAULT_CARNOT_EFFICIENCY,
+    DEFAULT_DIAGNOSTIC_PUBLISH_INTERVAL,
+    DEFAULT_FLOW_RATE,
+    DEFAULT_HEAT_CAPACITY,
+    DEFAULT_LOCAL_STATISTICS,
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_MAX_PUBLISH_INTERVAL,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_PORT,
+    DEFAULT_POWER_DEADBAND,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DEFAULT_TRAFFIC_LOG,
+    DEFAULT_TRANSPORT,
+    DOMAIN,
+    MAX_MAX_IN_FLIGHT,
+    TRANSPORT_OPTIONS,
+)
+
+if TYPE_CHECKING:
+    from .discovery import DiscoveredUnit
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_NAME = "Acond Heat Pump"
+HUB_NAME = "Acond Heat Pump hub"
+
+INTERVAL_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=5, max=3600, step=1, mode=NumberSelectorMode.BOX, unit_of_measurement="s"
+    )
+)
+
+PUBLISH_INTERVAL_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=0, max=3600, step=1, mode=NumberSelectorMode.BOX, unit_of_measurement="s"
+    )
+)
 
 DATA_SCHEMA = vol.Schema(
     {
-        vol.Required(CONF_HOST): TextSelector(),
+        vol.Optional(CONF_HOST): TextSelector(),
         vol.Optional(CONF_PORT, default=DEFAULT_PORT): NumberSelector(
-            NumberSelectorConfig(
-                min=1, max=65535, step=1, mode=NumberSelectorMode.BOX
-            )
+            NumberSelectorConfig(min=1, max=65535, step=1, mode=NumberSelectorMode.BOX)
         ),
         vol.Optional(CONF_NAME, default=DEFAULT_NAME): TextSelector(),
     }
@@ -42,45 +101,301 @@ class AcondHeatPumpConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._name = DEFAULT_NAME
+        self._discovered: dict[str, DiscoveredUnit] = {}
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> AcondHeatPumpOptionsFlow:
+        """Get the options flow for this handler."""
+        return AcondHeatPumpOptionsFlow()
+
+    @classmethod
+    @callback
+    def async_supports_options_flow(cls, config_entry: ConfigEntry) -> bool:
+        """Return options flow support; the hub entry has no options."""
+        return not config_entry.data.get(CONF_HUB)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
-        """Handle the initial step."""
+        """Handle the initial step.
+
+        Once a heat pump is configured, offer the hub with aggregate sensors.
+        """
+        entries = self._async_current_entries()
+        if entries and not any(entry.data.get(CONF_HUB) for entry in entries):
+            return self.async_show_menu(step_id="user", menu_options=["unit", "hub"])
+        return await self.async_step_unit()
+
+    async def async_step_hub(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Create the hub entry."""
+        await self.async_set_unique_id(CONF_HUB)
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(title=HUB_NAME, data={CONF_HUB: True})
+
+    async def async_step_unit(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Configure a heat pump; without a host, search the local network."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            host = user_input[CONF_HOST]
+            host = user_input.get(CONF_HOST, "").strip()
             port = int(user_input.get(CONF_PORT, DEFAULT_PORT))
+            self._name = user_input.get(CONF_NAME, DEFAULT_NAME)
+
+            if not host:
+                if await self._async_discover(port):
+                    return await self.async_step_pick_device()
+                return self.async_show_form(
+                    step_id="unit",
+                    data_schema=DATA_SCHEMA,
+                    errors={"base": "no_devices_found"},
+                )
 
             await self.async_set_unique_id(host)
             self._abort_if_unique_id_configured()
 
             try:
-                await self._test_connection(host, port)
-            except HeatPumpConnectionError:
-                errors["base"] = "cannot_connect"
+                connected = await self._test_connection(host, port)
             except Exception:  # noqa: BLE001
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
-                return self.async_create_entry(
-                    title=user_input.get(CONF_NAME, DEFAULT_NAME),
-                    data={CONF_HOST: host, CONF_PORT: port},
-                )
+                if connected:
+                    return self.async_create_entry(
+                        title=self._name, data={CONF_HOST: host, CONF_PORT: port}
+                    )
+                errors["base"] = "cannot_connect"
 
         return self.async_show_form(
-            step_id="user",
+            step_id="unit",
             data_schema=DATA_SCHEMA,
             errors=errors,
         )
 
-    async def _test_connection(self, host: str, port: int) -> None:
-        """Test if we can connect to the heat pump."""
-        client = AcondHeatPump(host, port)
+    async def async_step_pick_device(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Pick one of the heat pumps found on the local network."""
+        if user_input is not None:
+            unit = self._discovered[user_input[CONF_HOST]]
+            await self.async_set_unique_id(unit.host)
+            self._abort_if_unique_id_configured()
+            return self.async_create_entry(
+                title=self._name, data={CONF_HOST: unit.host, CONF_PORT: unit.port}
+            )
+
+        options = [
+            SelectOptionDict(value=host, label=f"{host}:{unit.port}")
+            for host, unit in self._discovered.items()
+        ]
+        return self.async_show_form(
+            step_id="pick_device",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_HOST): SelectSelector(
+                        SelectSelectorConfig(options=options)
+                    )
+                }
+            ),
+        )
+
+    async def _async_discover(self, port: int) -> bool:
+        """Scan the local network; return True if new heat pumps were found."""
+        discovery = await async_import_module(self.hass, f"{__package__}.discovery")
+        configured = self._async_current_ids()
+        self._discovered = {
+            unit.host: unit
+            for unit in await discovery.async_discover(self.hass, port)
+            if unit.host not in configured
+        }
+        return bool(self._discovered)
+
+    async def _test_connection(self, host: str, port: int) -> bool:
+        """Test if we can connect to the heat pump.
+
+        The client, and with it the device library, is only imported here so
+        that loading the config flow stays cheap.
+        """
+        client_module = await async_import_module(self.hass, f"{__package__}.client")
+        client = client_module.AcondAsyncClient(host, port)
         try:
-            connected = await self.hass.async_add_executor_job(client.connect)
-            if not connected:
-                raise HeatPumpConnectionError(f"Cannot connect to {host}:{port}")
-            await self.hass.async_add_executor_job(client.read_data)
+            if not await client.connect():
+                return False
+            await client.read_data()
+        except client_module.HeatPumpConnectionError:
+            return False
         finally:
-            await self.hass.async_add_executor_job(client.close)
+            await client.close()
+        return True
+
+
+class AcondHeatPumpOptionsFlow(OptionsFlow):
+    """Handle options for Acond Heat Pump."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            for key in (
+                CONF_MAX_IN_FLIGHT,
+                CONF_SCAN_INTERVAL,
+                CONF_MIN_SCAN_INTERVAL,
+                CONF_MAX_SCAN_INTERVAL,
+                CONF_MIN_PUBLISH_INTERVAL,
+                CONF_MAX_PUBLISH_INTERVAL,
+                CONF_DIAGNOSTIC_PUBLISH_INTERVAL,
+            ):
+                user_input[key] = int(user_input[key])
+            if not (
+                user_input[CONF_MIN_SCAN_INTERVAL]
+                <= user_input[CONF_SCAN_INTERVAL]
+                <= user_input[CONF_MAX_SCAN_INTERVAL]
+            ):
+                errors["base"] = "invalid_intervals"
+            elif (
+                max_publish := user_input[CONF_MAX_PUBLISH_INTERVAL]
+            ) and max_publish < user_input[CONF_MIN_PUBLISH_INTERVAL]:
+                errors["base"] = "invalid_publish_intervals"
+            else:
+                return self.async_create_entry(data=user_input)
+
+        options = user_input or self.config_entry.options
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_TRANSPORT,
+                    default=options.get(CONF_TRANSPORT, DEFAULT_TRANSPORT),
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=TRANSPORT_OPTIONS, translation_key=CONF_TRANSPORT
+                    )
+                ),
+                vol.Optional(
+                    CONF_MAX_IN_FLIGHT,
+                    default=options.get(CONF_MAX_IN_FLIGHT, DEFAULT_MAX_IN_FLIGHT),
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=1,
+                        max=MAX_MAX_IN_FLIGHT,
+                        step=1,
+                        mode=NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(
+                    CONF_TRAFFIC_LOG,
+                    default=options.get(CONF_TRAFFIC_LOG, DEFAULT_TRAFFIC_LOG),
+                ): BooleanSelector(),
+                vol.Optional(
+                    CONF_SCAN_INTERVAL,
+                    default=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                ): INTERVAL_SELECTOR,
+                vol.Optional(
+                    CONF_MIN_SCAN_INTERVAL,
+                    default=options.get(
+                        CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+                    ),
+                ): INTERVAL_SELECTOR,
+                vol.Optional(
+                    CONF_MAX_SCAN_INTERVAL,
+                    default=options.get(
+                        CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+                    ),
+                ): INTERVAL_SELECTOR,
+                vol.Optional(
+                    CONF_TEMPERATURE_DEADBAND,
+                    default=options.get(
+                        CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND
+                    ),
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0,
+                        max=5,
+                        step=0.1,
+                        mode=NumberSelectorMode.BOX,
+                        unit_of_measurement="°C",
+                    )
+                ),
+                vol.Optional(
+                    CONF_POWER_DEADBAND,
+                    default=options.get(CONF_POWER_DEADBAND, DEFAULT_POWER_DEADBAND),
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0,
+                        max=50,
+                        step=1,
+                        mode=NumberSelectorMode.BOX,
+                        unit_of_measurement="%",
+                    )
+                ),
+                vol.Optional(
+                    CONF_MIN_PUBLISH_INTERVAL,
+                    default=options.get(
+                        CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL
+                    ),
+                ): PUBLISH_INTERVAL_SELECTOR,
+                vol.Optional(
+                    CONF_MAX_PUBLISH_INTERVAL,
+                    default=options.get(
+                        CONF_MAX_PUBLISH_INTERVAL, DEFAULT_MAX_PUBLISH_INTERVAL
+                    ),
+                ): PUBLISH_INTERVAL_SELECTOR,
+                vol.Optional(
+                    CONF_FLOW_RATE,
+                    default=options.get(CONF_FLOW_RATE, DEFAULT_FLOW_RATE),
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0,
+                        max=500,
+                        step=0.1,
+                        mode=NumberSelectorMode.BOX,
+                        unit_of_measurement="l/min",
+                    )
+                ),
+                vol.Optional(
+                    CONF_HEAT_CAPACITY,
+                    default=options.get(CONF_HEAT_CAPACITY, DEFAULT_HEAT_CAPACITY),
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=3,
+                        max=4.3,
+                        step=0.01,
+                        mode=NumberSelectorMode.BOX,
+                        unit_of_measurement="kJ/(l·K)",
+                    )
+                ),
+                vol.Optional(
+                    CONF_CARNOT_EFFICIENCY,
+                    default=options.get(
+                        CONF_CARNOT_EFFICIENCY, DEFAULT_CARNOT_EFFICIENCY
+                    ),
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0.1, max=0.8, step=0.01, mode=NumberSelectorMode.BOX
+                    )
+                ),
+                vol.Optional(
+                    CONF_LOCAL_STATISTICS,
+                    default=options.get(
+                        CONF_LOCAL_STATISTICS, DEFAULT_LOCAL_STATISTICS
+                    ),
+                ): BooleanSelector(),
+                vol.Optional(
+                    CONF_DIAGNOSTIC_PUBLISH_INTERVAL,
+                    default=options.get(
+                        CONF_DIAGNOSTIC_PUBLISH_INTERVAL,
+                        DEFAULT_DIAGNOSTIC_PUBLISH_INTERVAL,
+                    ),
+                ): PUBLISH_INTERVAL_SELECTOR,
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
@@ -0,0 +1,189 @@
+"""Connection lifecycle management for the Acond Heat Pump integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant
+
+from acond_heat_pump import HeatPumpConnectionError
+
+from .client import AcondClient, HeatPumpProtocolError, create_client
+from .stats import AcondStats
+
+if TYPE_CHECKING:
+    from .traffic import TrafficRecorder, TrafficReplay
+
+_LOGGER = logging.getLogger(__name__)
+
+# Consecutive transport failures before the circuit breaker opens
+BREAKER_THRESHOLD = 3
+
+# Breaker open time after the threshold is reached; doubles with every further
+# failure up to BACKOFF_MAX; a random 50-100 % of it is used [s]
+BACKOFF_BASE = 10.0
+BACKOFF_MAX = 600.0
+
+
+class AcondConnection:
+    """Own the heat pump client and keep it connected.
+
+    Protocol errors (the heat pump answered, but with an error) keep the
+    socket. Transport errors drop it; the call is retried once on a fresh
+    connection. After BREAKER_THRESHOLD consecutive transport failures the
+    circuit breaker opens and calls fail fast, without touching the network,
+    until an exponentially growing, jittered backoff expires. The first call
+    after that is a probe: success closes the breaker, failure reopens it.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        port: int,
+        transport: str,
+        limiter: asyncio.Semaphore | None = None,
+        max_in_flight: int = 1,
+        recorder: TrafficRecorder | None = None,
+        replay: TrafficReplay | None = None,
+    ) -> None:
+        """Initialize the connection manager.
+
+        limiter, if given, is held for every Modbus request, bounding the
+        requests in flight across all connections sharing it. max_in_flight
+        is the pipeline depth of the asyncio transport. recorder
+        logs the raw traffic; replay answers from a log instead of the network.
+        """
+        self.hass = hass
+        self.host = host
+        self.port = port
+        self.transport = transport
+        self.max_in_flight = max_in_flight
+        self.stats = AcondStats()
+        self.recorder = recorder
+        self.replay = replay
+        self.client: AcondClient = create_client(
+            hass,
+            host,
+            port,
+            transport,
+            max_in_flight,
+            self.stats,
+            recorder=recorder,
+            replay=replay,
+            limiter=limiter,
+        )
+        self._limiter = limiter
+        self.failures = 0
+        """Consecutive transport failures."""
+        self.retry_at = 0.0
+        """Monotonic time until which the circuit breaker stays open."""
+
+    @property
+    def breaker_open(self) -> bool:
+        """Return True while calls fail fast."""
+        return time.monotonic() < self.retry_at
+
+    async def async_connect(self) -> bool:
+        """Connect the client for the first time."""
+        return await self.client.connect()
+
+    async def async_close(self) -> None:
+        """Close the client connection and write out the traffic log."""
+        await self.client.close()
+        if self.recorder is not None:
+            await self.recorder.async_close()
+        if self.replay is not None:
+            self.replay.close()
+
+    async def async_call[T](self, func: Callable[[AcondClient], Awaitable[T]]) -> T:
+        """Run func with a connected client, reconnecting once on failure."""
+        self._check_breaker()
+        reconnect = not self.client.connected
+        try:
+            return await self._async_attempt(func, reconnect=reconnect)
+        except HeatPumpProtocolError:
+            raise
+        except Exception:
+            if reconnect:
+                raise
+            self._check_breaker()
+        self.stats.retries += 1
+        return await self._async_attempt(func, reconnect=True)
+
+    def _check_breaker(self) -> None:
+        """Fail fast while the circuit breaker is open."""
+        if (remaining := self.retry_at - time.monotonic()) > 0:
+            raise HeatPumpConnectionError(
+                f"Heat pump at {self.host}:{self.port} is unreachable, "
+                f"next attempt in {remaining:.0f} s"
+            )
+
+    async def _async_attempt[T](
+        self, func: Callable[[AcondClient], Awaitable[T]], *, reconnect: bool
+    ) -> T:
+        """Run func once, recording the outcome for the circuit breaker."""
+        try:
+            if reconnect:
+                await self._async_reconnect()
+            result = await func(self.client)
+        except HeatPumpProtocolError:
+            self._record_success()
+            raise
+        except Exception:
+            self._record_failure()
+            raise
+        self._record_success()
+        return result
+
+    async def _async_reconnect(self) -> None:
+        """Replace the client with a freshly connected one."""
+        try:
+            await self.client.close()
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Error closing connection to %s: %s", self.host, err)
+        self.stats.reconnects += 1
+        self.client = create_client(
+            self.hass,
+            self.host,
+            self.port,
+            self.transport,
+            self.max_in_flight,
+            self.stats,
+            recorder=self.recorder,
+            replay=self.replay,
+            limiter=self._limiter,
+        )
+        if not await self.client.connect():
+            raise HeatPumpConnectionError(
+                f"Could not connect to heat pump at {self.host}:{self.port}"
+            )
+
+    def _record_success(self) -> None:
+        """Close the circuit breaker."""
+        if self.failures >= BREAKER_THRESHOLD:
+            _LOGGER.info("Connection to heat pump at %s restored", self.host)
+        self.failures = 0
+        self.retry_at = 0.0
+
+    def _record_failure(self) -> None:
+        """Count a transport failure and open the breaker past the threshold."""
+        self.failures += 1
+        if self.failures < BREAKER_THRESHOLD:
+            return
+        exponent = min(self.failures - BREAKER_THRESHOLD, 16)
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * 2**exponent)
+        delay *= random.uniform(0.5, 1.0)
+        self.retry_at = time.monotonic() + delay
+        log = _LOGGER.warning if self.failures == BREAKER_THRESHOLD else _LOGGER.debug
+        log(
+            "Heat pump at %s unreachable after %d attempts, retrying in %.0f s",
+            self.host,
+            self.failures,
+            delay,
+        )
@@ -2,11 +2,28 @@
 
 from homeassistant.const import Platform
 
-from acond_heat_pump import HeatPumpMode, RegulationMode
-
 DOMAIN = "acond_heat_pump"
 DEFAULT_PORT = 502
 
+CONF_TRANSPORT = "transport"
+TRANSPORT_ASYNC = "asyncio"
+TRANSPORT_EXECUTOR = "executor"
+TRANSPORT_OPTIONS: list[str] = [TRANSPORT_ASYNC, TRANSPORT_EXECUTOR]
+DEFAULT_TRANSPORT = TRANSPORT_ASYNC
+
+# Requests pipelined on one connection by the asyncio transport
+CONF_MAX_IN_FLIGHT = "max_in_flight"
+DEFAULT_MAX_IN_FLIGHT = 1
+MAX_MAX_IN_FLIGHT = 8
+
+# Polling intervals [s]: normal, during transients, and when idle
+CONF_SCAN_INTERVAL = "scan_interval"
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+DEFAULT_SCAN_INTERVAL = 30
+DEFAULT_MIN_SCAN_INTERVAL = 10
+DEFAULT_MAX_SCAN_INTERVAL = 300
+
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
     Platform.CLIMATE,
@@ -15,30 +32,56 @@ PLATFORMS: list[Platform] = [
     Platform.SENSOR,
 ]
 
-# HeatPumpMode -> translation key
-HEAT_PUMP_MODE_KEYS: dict[HeatPumpMode, str] = {
-    HeatPumpMode.AUTOMATIC: "automatic",
-    HeatPumpMode.HEAT_PUMP_ONLY: "heat_pump",
-    HeatPumpMode.BIVALENT_ONLY: "bivalency_source",
-    HeatPumpMode.COOLING: "cooling",
-    HeatPumpMode.OFF: "off",
+# Publishing of noisy measurements: changes smaller than the deadband are held
+# back, published states are at least min and, while the reading keeps moving
+# inside the deadband, at most max publish interval apart [°C, %, s, s]
+CONF_TEMPERATURE_DEADBAND = "temperature_deadband"
+CONF_POWER_DEADBAND = "power_deadband"
+CONF_MIN_PUBLISH_INTERVAL = "min_publish_interval"
+CONF_MAX_PUBLISH_INTERVAL = "max_publish_interval"
+DEFAULT_TEMPERATURE_DEADBAND = 0.2
+DEFAULT_POWER_DEADBAND = 5
+DEFAULT_MIN_PUBLISH_INTERVAL = 0
+DEFAULT_MAX_PUBLISH_INTERVAL = 900
+DEADBAND_DEFAULTS: dict[str, float] = {
+    CONF_TEMPERATURE_DEADBAND: DEFAULT_TEMPERATURE_DEADBAND,
+    CONF_POWER_DEADBAND: DEFAULT_POWER_DEADBAND,
 }
 
-# Translation key -> HeatPumpMode (reverse lookup)
-HEAT_PUMP_MODE_BY_KEY: dict[str, HeatPumpMode] = {
-    v: k for k, v in HEAT_PUMP_MODE_KEYS.items()
-}
+# Heat output estimation: heating water flow (0 estimates the output from the
+# temperature lift instead), its volumetric heat capacity and the share of the
+# Carnot COP reached by the refrigerant cycle [l/min, kJ/(l·K), -]
+CONF_FLOW_RATE = "flow_rate"
+CONF_HEAT_CAPACITY = "heat_capacity"
+CONF_CARNOT_EFFICIENCY = "carnot_efficiency"
+DEFAULT_FLOW_RATE = 0.0
+DEFAULT_HEAT_CAPACITY = 4.18
+DEFAULT_CARNOT_EFFICIENCY = 0.45
 
-# RegulationMode -> translation key
-REGULATION_MODE_KEYS: dict[RegulationMode, str] = {
-    RegulationMode.ACOND_THERM: "smart_therm",
-    RegulationMode.EQUITHERMAL: "ekviterm",
-    RegulationMode.MANUAL: "standard",
-}
+# Long-term statistics of the measured values are aggregated locally from
+# every poll and imported hourly, instead of compiled by the recorder from
+# their states; diagnostic statistics are written at most every diagnostic
+# publish interval (0 writes them every poll) [s]
+CONF_LOCAL_STATISTICS = "local_statistics"
+CONF_DIAGNOSTIC_PUBLISH_INTERVAL = "diagnostic_publish_interval"
+DEFAULT_LOCAL_STATISTICS = False
+DEFAULT_DIAGNOSTIC_PUBLISH_INTERVAL = 0
 
-# Translation key -> RegulationMode (reverse lookup)
-REGULATION_MODE_BY_KEY: dict[str, RegulationMode] = {
-    v: k for k, v in REGULATION_MODE_KEYS.items()
-}
+# The raw Modbus frames of the asyncio transport are appended to a traffic
+# log in the configuration directory. A log set as replay file is served
+# instead of the network, as fast as polled (speed 0) or at speed times the
+# recorded pace; the replay options are set by tools.replay, not in the UI
+CONF_TRAFFIC_LOG = "traffic_log"
+CONF_REPLAY_FILE = "replay_file"
+CONF_REPLAY_SPEED = "replay_speed"
+DEFAULT_TRAFFIC_LOG = False
+DEFAULT_REPLAY_SPEED = 0.0
+
+# Last good register block persisted per config entry
+STORAGE_VERSION = 1
+
+# The hub config entry only carries the aggregate sensors
+CONF_HUB = "hub"
+HUB_PLATFORMS: list[Platform] = [Platform.SENSOR]
 
 OPERATION_MODE_OPTIONS: list[str] = ["winter", "summer"]
@@ -2,21 +2,134 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import fields, replace
 from datetime import timedelta
+from functools import partial
 import logging
+import time
+from typing import Any
 
-from acond_heat_pump import AcondHeatPump, HeatPumpConnectionError, HeatPumpResponse
+from acond_heat_pump import (
+    HeatPumpConnectionError,
+    HeatPumpMode,
+    HeatPumpResponse,
+    HeatPumpStatus,
+    RegulationMode,
+)
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import DEFAULT_PORT
+from .analytics import CycleAnalytics
+from .client import (
+    INPUT_REGISTER_BY_FIELD,
+    INPUT_REGISTER_COUNT,
+    REGISTER_GROUPS,
+    SETPOINT_FIELDS,
+    SLOW_GROUP_INTERVAL,
+    AcondClient,
+    RegisterGroup,
+    contiguous_runs,
+    decode_registers,
+    encode_setpoint,
+    plan_reads,
+)
+from .connection import AcondConnection
+from .const import (
+    CONF_CARNOT_EFFICIENCY,
+    CONF_FLOW_RATE,
+    CONF_HEAT_CAPACITY,
+    CONF_LOCAL_STATISTICS,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_CARNOT_EFFICIENCY,
+    DEFAULT_FLOW_RATE,
+    DEFAULT_HEAT_CAPACITY,
+    DEFAULT_LOCAL_STATISTICS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    STORAGE_VERSION,
+)
+from .history import HistoryBuffer
+from .long_term_statistics import LongTermStatistics
+from .optimizer import ThermalStore, plan_setpoint
+from .performance import PerformanceEstimator, PerformanceParameters
+from .scheduler import Plan, Program, SetpointScheduler
+from .thermal_model import ThermalModel
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(seconds=30)
+# Status bits whose transitions switch to the fast polling interval
+TRANSITION_KEYS = ("status.running", "status.defrost", "status.heating_dhw")
+
+# Keep polling fast for this long after a transition [s]
+FAST_POLL_WINDOW = 120
+
+# Switch to the idle interval after the unit has been OFF and unchanged this long [s]
+IDLE_AFTER = 600
+
+# Setpoint writes arriving within this window are coalesced into one flush
+WRITE_COOLDOWN = 1.0
+
+# Prefix of HeatPumpStatus fields in data keys, e.g. "status.summer_mode"
+STATUS_PREFIX = "status."
+
+# Notify every entity at least this often, even without changes [s]
+FORCED_UPDATE_INTERVAL = 600
+
+# The last good register block is saved at most this often [s]
+SNAPSHOT_SAVE_DELAY = 300
+
+_RESPONSE_FIELDS = tuple(
+    field.name for field in fields(HeatPumpResponse) if field.name != "status"
+)
+_STATUS_FIELDS = tuple(field.name for field in fields(HeatPumpStatus))
+
+
+def get_field(data: HeatPumpResponse, key: str) -> Any:
+    """Return the value of a HeatPumpResponse field or status bit."""
+    if key.startswith(STATUS_PREFIX):
+        return getattr(data.status, key.removeprefix(STATUS_PREFIX))
+    return getattr(data, key)
+
+
+def diff_keys(previous: HeatPumpResponse, data: HeatPumpResponse) -> frozenset[str]:
+    """Return the data keys whose values differ between two snapshots."""
+    if previous == data:
+        return frozenset()
+    changed = {
+        name
+        for name in _RESPONSE_FIELDS
+        if getattr(previous, name) != getattr(data, name)
+    }
+    if previous.status != data.status:
+        changed.update(
+            STATUS_PREFIX + name
+            for name in _STATUS_FIELDS
+            if getattr(previous.status, name) != getattr(data.status, name)
+        )
+    return frozenset(changed)
+
+
+def apply_changes(data: HeatPumpResponse, changes: dict[str, Any]) -> HeatPumpResponse:
+    """Return a copy of data with the given fields and status bits replaced."""
+    fields = {k: v for k, v in changes.items() if not k.startswith(STATUS_PREFIX)}
+    status = {
+        k.removeprefix(STATUS_PREFIX): v
+        for k, v in changes.items()
+        if k.startswith(STATUS_PREFIX)
+    }
+    if status:
+        fields["status"] = replace(data.status, **status)
+    return replace(data, **fields)
 
 
 class AcondCoordinator(DataUpdateCoordinator[HeatPumpResponse]):
@@ -25,48 +138,437 @@ class AcondCoordinator(DataUpdateCoordinator[HeatPumpResponse]):
     def __init__(
         self,
         hass: HomeAssistant,
-        client: AcondHeatPump,
+        connection: AcondConnection,
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the coordinator."""
+        options = config_entry.options
+        self._scan_interval = timedelta(
+            seconds=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+        self._min_scan_interval = timedelta(
+            seconds=options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL)
+        )
+        self._max_scan_interval = timedelta(
+            seconds=options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)
+        )
         super().__init__(
             hass,
             _LOGGER,
             name="Acond Heat Pump",
-            update_interval=SCAN_INTERVAL,
+            update_interval=self._scan_interval,
             config_entry=config_entry,
         )
-        self.client = client
+        self.connection = connection
+        self.stats = connection.stats
+        self._last_transition = float("-inf")
+        self._last_change = time.monotonic()
+        self._registers: list[int] | None = None
+        self._group_read_at: dict[str, float] = {}
+        self._notified_data: HeatPumpResponse | None = None
+        self._forced_update_at = float("-inf")
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{config_entry.entry_id}"
+        )
+        self.stale = False
+        """True while data is a snapshot restored from storage."""
+        self.history = HistoryBuffer()
+        """Register blocks of recent successful polls."""
+        self.analytics = CycleAnalytics()
+        """Compressor cycle and defrost statistics, persisted with the snapshot."""
+        self.performance = PerformanceEstimator(
+            PerformanceParameters(
+                flow_rate=options.get(CONF_FLOW_RATE, DEFAULT_FLOW_RATE),
+                heat_capacity=options.get(CONF_HEAT_CAPACITY, DEFAULT_HEAT_CAPACITY),
+                carnot_efficiency=options.get(
+                    CONF_CARNOT_EFFICIENCY, DEFAULT_CARNOT_EFFICIENCY
+                ),
+            )
+        )
+        """Heat output and COP; the energy totals are persisted with the snapshot."""
+        self.thermal_model = ThermalModel()
+        """Building model fitted online, persisted with the snapshot."""
+        self.statistics: LongTermStatistics | None = None
+        """Hourly statistics aggregated from every poll, if enabled."""
+        if options.get(CONF_LOCAL_STATISTICS, DEFAULT_LOCAL_STATISTICS):
+            self.statistics = LongTermStatistics()
+        self.scheduler = SetpointScheduler(hass, self._async_apply_scheduled)
+        """Weekly setpoint programs and price plans, persisted with the snapshot."""
+        self.changed_keys: frozenset[str] | None = None
+        """Data keys changed by the current update; None means all of them."""
+        self._pending_writes: dict[int, int] = {}
+        self._flushing_writes: dict[int, int] = {}
+        self._optimistic: dict[str, Any] = {}
+        self._write_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=WRITE_COOLDOWN,
+            immediate=False,
+            function=self._async_write_pending,
+        )
 
-    def _reconnect(self) -> None:
-        """Create a fresh client and connect."""
-        try:
-            self.client.close()
-        except Exception:  # noqa: BLE001
-            pass
+    @callback
+    def async_update_listeners(self) -> None:
+        """Work out which data keys changed, then notify listeners.
+
+        Entities skip state writes when none of their keys changed. Every key
+        counts as changed after a failure or recovery, and periodically so
+        that all entities are refreshed now and then.
+        """
+        data = self.data if self.last_update_success else None
+        previous, self._notified_data = self._notified_data, data
+        now = time.monotonic()
+        if (
+            data is None
+            or previous is None
+            or now - self._forced_update_at >= FORCED_UPDATE_INTERVAL
+        ):
+            self.changed_keys = None
+            self._forced_update_at = now
+        else:
+            self.changed_keys = diff_keys(previous, data)
+        super().async_update_listeners()
+
+    async def async_restore_snapshot(self) -> bool:
+        """Restore the last good register block and statistics of a previous run.
+
+        The data is marked stale until the first successful poll; all register
+        groups are read again by that poll.
+        """
+        if (stored := await self._store.async_load()) is None:
+            return False
+        if (analytics := stored.get("analytics")) is not None:
+            self.analytics.restore(analytics)
+        if (performance := stored.get("performance")) is not None:
+            self.performance.restore(performance)
+        if (thermal_model := stored.get("thermal_model")) is not None:
+            self.thermal_model.restore(thermal_model)
+        if (schedules := stored.get("schedules")) is not None:
+            self.scheduler.restore(schedules)
+        if (
+            self.statistics is not None
+            and (statistics := stored.get("statistics")) is not None
+        ):
+            self.statistics.restore(statistics)
+        registers = stored.get("registers")
+        if not isinstance(registers, list) or len(registers) != INPUT_REGISTER_COUNT:
+            _LOGGER.debug("Ignoring invalid snapshot %s", stored)
+            return False
+        self._registers = registers
+        self.data = decode_registers(registers)
+        self.stale = True
+        if read_at := stored.get("read_at"):
+            self.stats.last_success = dt_util.parse_datetime(read_at)
+        return True
+
+    @callback
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the register block to persist."""
+        read_at = self.stats.last_success
+        return {
+            "registers": self._registers,
+            "read_at": read_at.isoformat() if read_at else None,
+            "analytics": self.analytics.as_dict(),
+            "performance": self.performance.as_dict(),
+            "thermal_model": self.thermal_model.as_dict(),
+            "schedules": self.scheduler.as_dict(),
+            "statistics": self.statistics.as_dict() if self.statistics else None,
+        }
+
+    @callback
+    def async_delay_next_refresh(self, delay: timedelta) -> None:
+        """Postpone the first scheduled poll, shifting the polling phase.
+
+        Only effective before the first listener subscribes; the regular
+        interval is restored by _adapt_interval after that poll.
+        """
+        if delay and self.update_interval:
+            self.update_interval += delay
 
-        host = self.config_entry.data[CONF_HOST]
-        port = self.config_entry.data.get(CONF_PORT, DEFAULT_PORT)
-        self.client = AcondHeatPump(host, port)
+    @callback
+    def _async_apply_optimistic(self, changes: dict[str, Any]) -> None:
+        """Show written values immediately, pending confirmation by a poll."""
+        if self.data is None or not self.last_update_success:
+            return
+        self._optimistic.update(changes)
+        # A user action counts as a transition: confirm it with a fast poll
+        self._last_transition = time.monotonic()
+        self.update_interval = self._min_scan_interval
+        self.async_set_updated_data(apply_changes(self.data, changes))
 
-        if not self.client.connect():
-            raise HeatPumpConnectionError(
-                f"Could not connect to heat pump at {host}:{port}"
+    async def async_set_setpoint(self, register: int, temperature: float) -> None:
+        """Queue a temperature setpoint write.
+
+        Only the last value per register is kept; queued registers are written
+        together once the cooldown expires. The new value is shown right away
+        and confirmed by the next scheduled poll.
+        """
+        value = encode_setpoint(register, temperature)
+        self._pending_writes[register] = value
+        self._async_apply_optimistic({SETPOINT_FIELDS[register]: value / 10})
+        await self._write_debouncer.async_call()
+
+    @callback
+    def async_set_schedule(self, register: int, program: Program) -> None:
+        """Run a weekly program of a setpoint register."""
+        self.scheduler.async_set_program(register, program)
+        self._store.async_delay_save(self._snapshot, WRITE_COOLDOWN)
+
+    @callback
+    def async_clear_schedule(self, register: int) -> None:
+        """Stop the weekly program and price plan of a setpoint register."""
+        self.scheduler.async_clear_program(register)
+        self._store.async_delay_save(self._snapshot, WRITE_COOLDOWN)
+
+    async def async_optimize_setpoint(
+        self,
+        register: int,
+        prices: list[float],
+        *,
+        interval: int,
+        minimum: float,
+        maximum: float,
+        store: ThermalStore,
+        power: float,
+    ) -> Plan:
+        """Plan a setpoint for the cheapest energy and run the plan.
+
+        The first price applies to the current interval [s]. When the plan
+        ends, the setpoint returns to its weekly program or, without one, to
+        its value before planning.
+        """
+        if (data := self.data) is None:
+            raise ValueError("The heat pump hasn't been read yet")
+        start = time.perf_counter()
+        setpoints = await self.hass.async_add_executor_job(
+            partial(
+                plan_setpoint,
+                register,
+                data,
+                prices,
+                interval=interval,
+                minimum=minimum,
+                maximum=maximum,
+                store=store,
+                power=power,
+                carnot_efficiency=self.performance.parameters.carnot_efficiency,
             )
+        )
+        _LOGGER.debug(
+            "Planned %d %s setpoints in %.3f s",
+            len(setpoints),
+            SETPOINT_FIELDS[register],
+            time.perf_counter() - start,
+        )
+        if previous := self.scheduler.plans.get(register):
+            fallback = previous[-1][1]
+        elif (fallback := get_field(data, SETPOINT_FIELDS[register])) is None:
+            fallback = setpoints[-1]
+        now = dt_util.now()
+        begin = now.replace(
+            minute=now.minute - now.minute % (interval // 60), second=0, microsecond=0
+        ).timestamp()
+        plan = [
+            (begin + index * interval, setpoint)
+            for index, setpoint in enumerate(setpoints)
+        ]
+        plan.append((begin + len(setpoints) * interval, fallback))
+        self.scheduler.async_set_plan(register, plan)
+        self._store.async_delay_save(self._snapshot, WRITE_COOLDOWN)
+        return plan
+
+    async def _async_apply_scheduled(self, register: int, temperature: float) -> None:
+        """Write a scheduled setpoint unless the heat pump already holds it.
+
+        Restored snapshot data may be days old, so it is not trusted to tell
+        what the heat pump holds until the first live poll.
+        """
+        field = SETPOINT_FIELDS[register]
+        if (
+            self.data is not None
+            and not self.stale
+            and (current := get_field(self.data, field)) is not None
+            and round(current * 10) == round(temperature * 10)
+        ):
+            return
+        _LOGGER.debug("Scheduled %s: %s", field, temperature)
+        await self.async_set_setpoint(register, temperature)
+
+    async def async_set_heat_pump_mode(self, mode: HeatPumpMode) -> None:
+        """Set the heat pump operating mode."""
+        await self._async_write(lambda client: client.change_setting(mode))
+        self._async_apply_optimistic({"heat_pump_mode": mode})
+
+    async def async_set_regulation_mode(self, mode: RegulationMode) -> None:
+        """Set the regulation mode."""
+        await self._async_write(lambda client: client.set_regulation_mode(mode))
+        self._async_apply_optimistic({"regulation_mode": mode})
+
+    async def async_set_summer_mode(self, summer: bool) -> None:
+        """Set or clear summer mode."""
+        await self._async_write(lambda client: client.set_summer_mode(summer))
+        self._async_apply_optimistic({f"{STATUS_PREFIX}summer_mode": summer})
+
+    async def _async_write(
+        self, func: Callable[[AcondClient], Awaitable[None]]
+    ) -> None:
+        """Run a write through the connection, recording its latency."""
+        start = time.perf_counter()
+        await self.connection.async_call(func)
+        self.stats.write_latency.record(time.perf_counter() - start)
 
-    def _sync_read(self) -> HeatPumpResponse:
-        """Read data, reconnecting only on failure (runs in executor)."""
+    async def _async_write_pending(self) -> None:
+        """Write all queued setpoints."""
+        writes, self._pending_writes = self._pending_writes, {}
+        if not writes:
+            return
+        self._flushing_writes = writes
         try:
-            return self.client.read_data()
+            await self._async_write(
+                lambda client: self._async_write_runs(client, writes)
+            )
+            self._invalidate_groups(SETPOINT_FIELDS[register] for register in writes)
         except Exception:
-            self._reconnect()
-            return self.client.read_data()
+            _LOGGER.exception("Error writing setpoints to heat pump")
+            for register in writes:
+                self._optimistic.pop(SETPOINT_FIELDS[register], None)
+            await self.async_request_refresh()
+        finally:
+            self._flushing_writes = {}
+
+    @staticmethod
+    async def _async_write_runs(client: AcondClient, writes: dict[int, int]) -> None:
+        """Write queued registers, one request per run of consecutive ones."""
+        for address, values in contiguous_runs(writes):
+            await client.write_registers(address, values)
+
+    async def async_shutdown(self) -> None:
+        """Write queued setpoints and cancel listeners."""
+        self.scheduler.async_stop()
+        self._write_debouncer.async_cancel()
+        await self._async_write_pending()
+        await super().async_shutdown()
+
+    def _reconcile(self, data: HeatPumpResponse) -> HeatPumpResponse:
+        """Confirm or roll back optimistic values against polled data.
+
+        Values whose write has not reached the heat pump yet stay applied.
+        """
+        unwritten = {
+            SETPOINT_FIELDS[register]
+            for register in (*self._pending_writes, *self._flushing_writes)
+        }
+        keep: dict[str, Any] = {}
+        for key, expected in list(self._optimistic.items()):
+            if key in unwritten:
+                keep[key] = expected
+                continue
+            del self._optimistic[key]
+            if (actual := get_field(data, key)) != expected:
+                _LOGGER.debug(
+                    "Heat pump reports %s=%s, rolling back written value %s",
+                    key,
+                    actual,
+                    expected,
+                )
+        return apply_changes(data, keep) if keep else data
+
+    def _adapt_interval(self, data: HeatPumpResponse) -> None:
+        """Choose the next polling interval from the heat pump state.
+
+        Polls fast around running/defrost/DHW transitions and while defrosting,
+        and slow once the unit has been OFF with no status change for a while.
+        """
+        now = time.monotonic()
+        if (previous := self.data) is not None and not self.stale:
+            if any(
+                get_field(previous, k) != get_field(data, k) for k in TRANSITION_KEYS
+            ):
+                self._last_transition = now
+            if (
+                previous.status != data.status
+                or previous.heat_pump_mode != data.heat_pump_mode
+            ):
+                self._last_change = now
+
+        if data.status.defrost or now - self._last_transition < FAST_POLL_WINDOW:
+            interval = self._min_scan_interval
+        elif (
+            data.heat_pump_mode == HeatPumpMode.OFF
+            and now - self._last_change >= IDLE_AFTER
+        ):
+            interval = self._max_scan_interval
+        else:
+            interval = self._scan_interval
+
+        if interval != self.update_interval:
+            _LOGGER.debug("Polling interval changed to %s", interval)
+            self.update_interval = interval
+
+    def _invalidate_groups(self, fields: Iterable[str]) -> None:
+        """Force the groups holding the given fields to be read next poll."""
+        registers = {INPUT_REGISTER_BY_FIELD[field] for field in fields}
+        for group in REGISTER_GROUPS:
+            if any(group.start <= register < group.end for register in registers):
+                self._group_read_at.pop(group.name, None)
+
+    def _group_due(self, group: RegisterGroup, now: float) -> bool:
+        """Return True if a register group should be read this poll."""
+        if (read_at := self._group_read_at.get(group.name)) is None:
+            return True
+        interval = group.interval
+        if group.pro_only and self.data and not self.data.compressor_capacity_max:
+            interval = SLOW_GROUP_INTERVAL
+        return interval is None or now - read_at >= interval.total_seconds()
+
+    async def _async_read_registers(self, client: AcondClient) -> list[int]:
+        """Read the due register groups and merge them into the cached block."""
+        now = time.monotonic()
+        due = [group for group in REGISTER_GROUPS if self._group_due(group, now)]
+        registers = list(self._registers or [0] * INPUT_REGISTER_COUNT)
+        spans = plan_reads(
+            due, [group for group in REGISTER_GROUPS if group not in due]
+        )
+        for (start, count), values in zip(
+            spans, await client.read_input_spans(spans), strict=True
+        ):
+            registers[start : start + count] = values
+        for group in REGISTER_GROUPS:
+            if any(
+                start <= group.start and group.end <= start + count
+                for start, count in spans
+            ):
+                self._group_read_at[group.name] = now
+        self._registers = registers
+        return registers
+
+    async def _async_read(self) -> HeatPumpResponse:
+        """Read data through the connection manager."""
+        registers = await self.connection.async_call(self._async_read_registers)
+        return decode_registers(registers)
 
     async def _async_update_data(self) -> HeatPumpResponse:
         """Fetch data from the heat pump."""
+        start = time.perf_counter()
         try:
-            return await self.hass.async_add_executor_job(self._sync_read)
+            data = await self._async_read()
         except HeatPumpConnectionError as err:
+            self.stats.failed_polls += 1
             raise UpdateFailed(f"Error communicating with heat pump: {err}") from err
         except Exception as err:
+            self.stats.failed_polls += 1
             raise UpdateFailed(f"Error communicating with heat pump: {err}") from err
+        self.stats.poll_latency.record(time.perf_counter() - start)
+        self.stats.last_success = dt_util.utcnow()
+        timestamp = self.stats.last_success.timestamp()
+        self.history.append(timestamp, self._registers)
+        self.analytics.update(timestamp, data.status)
+        self.performance.update(timestamp, data)
+        self.thermal_model.update(timestamp, data)
+        if self.statistics is not None and self.statistics.add(timestamp, data):
+            self.statistics.async_import(self.hass)
+        data = self._reconcile(data)
+        self._adapt_interval(data)
+        self.stale = False
+        self._store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+        return data
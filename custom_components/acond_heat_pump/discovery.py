@@ -0,0 +1,119 @@
+"""Local network discovery of Acond heat pumps."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from ipaddress import IPv4Address, ip_interface, ip_network
+
+from homeassistant.components import network
+from homeassistant.core import HomeAssistant
+
+from acond_heat_pump import HeatPumpConnectionError, HeatPumpResponse
+
+from .client import INPUT_REGISTER_COUNT, AcondAsyncClient, decode_registers
+
+_LOGGER = logging.getLogger(__name__)
+
+# Hosts probed at once
+SCAN_CONCURRENCY = 128
+
+# Connect and fingerprint read timeout per host [s]; a unit on the LAN
+# answers within milliseconds, an unused address never does
+PROBE_TIMEOUT = 1.0
+
+# Networks larger than this are only scanned in the block around our address
+MIN_SCAN_PREFIX = 24
+
+
+@dataclass(frozen=True, kw_only=True)
+class DiscoveredUnit:
+    """A heat pump answering with a plausible Acond register block."""
+
+    host: str
+    port: int
+    data: HeatPumpResponse
+
+
+async def async_discover(hass: HomeAssistant, port: int) -> list[DiscoveredUnit]:
+    """Scan the local IPv4 networks for Acond heat pumps."""
+    hosts = await async_get_scan_hosts(hass)
+    _LOGGER.debug("Scanning %d hosts for Acond heat pumps on port %s", len(hosts), port)
+    return await async_scan_hosts(hosts, port)
+
+
+async def async_get_scan_hosts(hass: HomeAssistant) -> list[str]:
+    """Return the addresses of the enabled adapters' networks, except our own."""
+    own: set[IPv4Address] = set()
+    networks = []
+    for adapter in await network.async_get_adapters(hass):
+        if not adapter["enabled"]:
+            continue
+        for ipv4 in adapter["ipv4"]:
+            interface = ip_interface(f"{ipv4['address']}/{ipv4['network_prefix']}")
+            if interface.is_loopback or interface.is_link_local:
+                continue
+            own.add(interface.ip)
+            prefix = max(interface.network.prefixlen, MIN_SCAN_PREFIX)
+            networks.append(ip_network(f"{interface.ip}/{prefix}", strict=False))
+    hosts = dict.fromkeys(
+        host for subnet in networks for host in subnet.hosts() if host not in own
+    )
+    return [str(host) for host in hosts]
+
+
+async def async_scan_hosts(
+    hosts: Iterable[str],
+    port: int,
+    *,
+    concurrency: int = SCAN_CONCURRENCY,
+    timeout: float = PROBE_TIMEOUT,
+) -> list[DiscoveredUnit]:
+    """Probe hosts concurrently; return the Acond units among them."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def probe(host: str) -> DiscoveredUnit | None:
+        async with semaphore:
+            return await async_probe(host, port, timeout)
+
+    results = await asyncio.gather(*(probe(host) for host in hosts))
+    return [unit for unit in results if unit is not None]
+
+
+async def async_probe(host: str, port: int, timeout: float) -> DiscoveredUnit | None:
+    """Return the unit at host if it serves a plausible Acond register block."""
+    client = AcondAsyncClient(host, port, timeout)
+    try:
+        if not await client.connect():
+            return None
+        registers = await client.read_input_registers(0, INPUT_REGISTER_COUNT)
+    except (HeatPumpConnectionError, OSError, TimeoutError):
+        return None
+    except Exception:
+        # Any device may listen on the Modbus port; one that answers with
+        # garbage must not abort the scan
+        _LOGGER.debug("Unexpected reply from %s:%s", host, port, exc_info=True)
+        return None
+    finally:
+        await client.close()
+    if (data := fingerprint(registers)) is None:
+        _LOGGER.debug("Modbus device at %s:%s is not an Acond heat pump", host, port)
+        return None
+    return DiscoveredUnit(host=host, port=port, data=data)
+
+
+def fingerprint(registers: list[int]) -> HeatPumpResponse | None:
+    """Decode registers if they look like an Acond input register block.
+
+    The mode registers must hold known modes and the heating setpoints, which
+    every unit has configured, must lie within their ranges.
+    """
+    try:
+        data = decode_registers(registers)
+    except (IndexError, ValueError):
+        return None
+    if data.indoor1_temp_set is None or data.water_back_temp_set is None:
+        return None
+    return data
@@ -2,17 +2,29 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+from typing import Any
+
+from homeassistant.const import ATTR_TEMPERATURE
+from homeassistant.core import callback
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .client import encode_setpoint
 from .const import DOMAIN
 from .coordinator import AcondCoordinator
+from .hub import AcondHub
+from .optimizer import STORES
+from .scheduler import Plan, build_program
 
 
 class AcondEntity(CoordinatorEntity[AcondCoordinator]):
     """Base class for Acond Heat Pump entities."""
 
     _attr_has_entity_name = True
+    _data_keys: frozenset[str] | None = None
+    """Coordinator data keys the state depends on; None updates on every poll."""
 
     def __init__(self, coordinator: AcondCoordinator, entry_id: str) -> None:
         """Initialize the entity."""
@@ -22,3 +34,130 @@ class AcondEntity(CoordinatorEntity[AcondCoordinator]):
             manufacturer="Acond",
             model="Heat Pump",
         )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if data this entity depends on has changed."""
+        changed = self.coordinator.changed_keys
+        if (
+            changed is not None
+            and self._data_keys is not None
+            and changed.isdisjoint(self._data_keys)
+        ):
+            return
+        super()._handle_coordinator_update()
+
+
+class AcondDerivedEntity(AcondEntity):
+    """Base class for entities derived from a model fed by every poll.
+
+    Changed data keys don't tell whether a model's output moved, so the value
+    is computed once per poll and state is written only if the value or the
+    availability changed.
+    """
+
+    _value: Any = None
+    _written: tuple[Any, bool] | None = None
+
+    def _compute_value(self) -> Any:
+        """Return the value derived from the coordinator's model."""
+        raise NotImplementedError
+
+    async def async_added_to_hass(self) -> None:
+        """Compute the initial value."""
+        await super().async_added_to_hass()
+        self._value = self._compute_value()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if the value or the availability changed."""
+        self._value = self._compute_value()
+        if (written := (self._value, self.available)) == self._written:
+            return
+        self._written = written
+        super()._handle_coordinator_update()
+
+
+class AcondSetpointEntity(AcondEntity):
+    """Base class for entities controlling a temperature setpoint register."""
+
+    _setpoint_register: int
+
+    async def async_set_schedule(self, program: list[dict[str, Any]]) -> None:
+        """Run a weekly program of this setpoint."""
+        for transition in program:
+            try:
+                encode_setpoint(self._setpoint_register, transition[ATTR_TEMPERATURE])
+            except ValueError as err:
+                raise ServiceValidationError(str(err)) from err
+        self.coordinator.async_set_schedule(
+            self._setpoint_register, build_program(program)
+        )
+
+    async def async_clear_schedule(self) -> None:
+        """Stop the weekly program and price plan of this setpoint."""
+        self.coordinator.async_clear_schedule(self._setpoint_register)
+
+    async def async_optimize_setpoint(
+        self,
+        prices: list[float],
+        *,
+        interval: int,
+        minimum: float,
+        maximum: float,
+        power: float | None = None,
+        thermal_capacity: float | None = None,
+        heat_loss: float | None = None,
+    ) -> Plan:
+        """Plan this setpoint for the cheapest energy and run the plan."""
+        register = self._setpoint_register
+        if (store := STORES.get(register)) is None:
+            raise ServiceValidationError(
+                "Only the circuit and DHW setpoints can be optimized"
+            )
+        if minimum > maximum:
+            raise ServiceValidationError(
+                "The minimum temperature must not exceed the maximum"
+            )
+        try:
+            encode_setpoint(register, minimum)
+            encode_setpoint(register, maximum)
+        except ValueError as err:
+            raise ServiceValidationError(str(err)) from err
+        if power is None:
+            power = self.coordinator.data.compressor_capacity_max
+        if not power:
+            raise ServiceValidationError(
+                "The heat pump doesn't report its compressor power; enter it"
+            )
+        if thermal_capacity is not None:
+            store = replace(store, capacity=thermal_capacity)
+        if heat_loss is not None:
+            store = replace(store, heat_loss=heat_loss)
+        try:
+            return await self.coordinator.async_optimize_setpoint(
+                register,
+                prices,
+                interval=interval,
+                minimum=minimum,
+                maximum=maximum,
+                store=store,
+                power=power,
+            )
+        except ValueError as err:
+            raise ServiceValidationError(str(err)) from err
+
+
+class AcondHubEntity(CoordinatorEntity[AcondHub]):
+    """Base class for entities aggregating all heat pump units."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, hub: AcondHub, entry_id: str) -> None:
+        """Initialize the entity."""
+        super().__init__(hub)
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            manufacturer="Acond",
+            model="Hub",
+        )
@@ -0,0 +1,188 @@
+"""In-memory history of recent heat pump readings."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import fields
+from functools import partial
+
+from acond_heat_pump import HeatPumpStatus
+
+from .client import (
+    INPUT_REGISTER_BY_FIELD,
+    INPUT_REGISTER_COUNT,
+    TEMPERATURE_RANGES,
+    decode_temperature,
+)
+
+# Samples kept per unit: 24 h at the fastest 10 s polling interval; a sample
+# takes 56 bytes (a float timestamp and the 24 raw registers), about 470 KiB
+HISTORY_CAPACITY = 8640
+
+# Status bit of each HeatPumpStatus field, e.g. "running" -> 1
+STATUS_BITS: dict[str, int] = {
+    field.name: bit for bit, field in enumerate(fields(HeatPumpStatus))
+}
+_STATUS_REGISTER = INPUT_REGISTER_BY_FIELD["status"]
+
+type Value = float | int | bool | None
+
+
+def _status_decoder(bit: int) -> Callable[[int], bool]:
+    """Return a decoder of one status bit."""
+    mask = 1 << bit
+    return lambda raw: bool(raw & mask)
+
+
+def _column(key: str) -> tuple[int, Callable[[int], Value]]:
+    """Return the register and decoder of a data key."""
+    if key.startswith("status."):
+        return _STATUS_REGISTER, _status_decoder(STATUS_BITS[key[7:]])
+    if key in TEMPERATURE_RANGES:
+        return INPUT_REGISTER_BY_FIELD[key], partial(decode_temperature, field=key)
+    return INPUT_REGISTER_BY_FIELD[key], int
+
+
+class HistoryBuffer:
+    """Fixed-size ring buffer of timestamped raw input register blocks.
+
+    Samples are stored column-compact in two preallocated arrays, so the
+    memory use is fixed at creation and appending is O(1). Values are only
+    decoded when queried, by the same data keys the coordinator uses for
+    change detection, e.g. "outdoor_temp_actual" or "status.running".
+    Timestamps are POSIX seconds.
+    """
+
+    __slots__ = ("_head", "_registers", "_size", "_times", "capacity")
+
+    def __init__(self, capacity: int = HISTORY_CAPACITY) -> None:
+        """Initialize an empty buffer."""
+        self.capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._registers = array("H", bytes(2 * INPUT_REGISTER_COUNT * capacity))
+        self._head = 0
+        """Slot the next sample is written to."""
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory held by the sample arrays."""
+        return sum(
+            samples.itemsize * len(samples)
+            for samples in (self._times, self._registers)
+        )
+
+    @property
+    def last_timestamp(self) -> float | None:
+        """Return the time of the newest sample."""
+        if not self._size:
+            return None
+        return self._times[(self._head - 1) % self.capacity]
+
+    def append(self, timestamp: float, registers: Sequence[int]) -> None:
+        """Add a sample, overwriting the oldest one when full."""
+        slot = self._head
+        self._times[slot] = timestamp
+        offset = slot * INPUT_REGISTER_COUNT
+        self._registers[offset : offset + INPUT_REGISTER_COUNT] = array("H", registers)
+        self._head = (slot + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        self._head = 0
+        self._size = 0
+
+    def _first(self, since: float | None) -> int:
+        """Return the logical index of the oldest sample taken at or after since.
+
+        Logical indexes run up to self._head and are taken modulo the capacity.
+        """
+        first = self._head - self._size
+        if since is not None:
+            # Timestamps are assumed non-decreasing; bisect in logical order
+            low, high = 0, self._size
+            while low < high:
+                middle = (low + high) // 2
+                if self._times[(first + middle) % self.capacity] < since:
+                    low = middle + 1
+                else:
+                    high = middle
+            first += low
+        return first
+
+    def _slots(self, since: float | None) -> Iterator[int]:
+        """Yield the slots of the samples taken at or after since, oldest first."""
+        for index in range(self._first(since), self._head):
+            yield index % self.capacity
+
+    def timestamps(self, since: float | None = None) -> list[float]:
+        """Return the sample timestamps, oldest first."""
+        return [self._times[slot] for slot in self._slots(since)]
+
+    def series(self, key: str, since: float | None = None) -> list[tuple[float, Value]]:
+        """Return (timestamp, value) pairs of a data key, oldest first."""
+        register, decode = _column(key)
+        registers = self._registers
+        return [
+            (
+                self._times[slot],
+                decode(registers[slot * INPUT_REGISTER_COUNT + register]),
+            )
+            for slot in self._slots(since)
+        ]
+
+    def latest(self, key: str) -> tuple[float, Value] | None:
+        """Return the newest (timestamp, value) pair of a data key."""
+        if not self._size:
+            return None
+        register, decode = _column(key)
+        slot = (self._head - 1) % self.capacity
+        return (
+            self._times[slot],
+            decode(self._registers[slot * INPUT_REGISTER_COUNT + register]),
+        )
+
+    def values(self, key: str, since: float | None = None) -> list[Value]:
+        """Return the values of a data key, oldest first.
+
+        Cheaper than series: the register column is sliced out in one step,
+        and each distinct raw value is decoded once.
+        """
+        register, decode = _column(key)
+        first = self._first(since)
+        if first == self._head:
+            return []
+        column = self._registers[register::INPUT_REGISTER_COUNT]
+        start, stop = first % self.capacity, self._head % self.capacity
+        raw = column[start:stop] if start < stop else column[start:] + column[:stop]
+        decoded = {value: decode(value) for value in set(raw)}
+        return list(map(decoded.__getitem__, raw))
+
+    def mean(self, key: str, since: float | None = None) -> float | None:
+        """Return the mean of the known values of a data key."""
+        values = [value for value in self.values(key, since) if value is not None]
+        return sum(values) / len(values) if values else None
+
+    def rate(self, key: str, since: float | None = None) -> float | None:
+        """Return the least-squares rate of change of a data key per hour."""
+        points = [
+            (timestamp, value)
+            for timestamp, value in self.series(key, since)
+            if value is not None
+        ]
+        if len(points) < 2:
+            return None
+        count = len(points)
+        mean_t = sum(t for t, _ in points) / count
+        mean_v = sum(v for _, v in points) / count
+        variance = sum((t - mean_t) ** 2 for t, _ in points)
+        if not variance:
+            return None
+        covariance = sum((t - mean_t) * (v - mean_v) for t, v in points)
+        return covariance / variance * 3600
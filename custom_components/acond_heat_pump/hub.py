@@ -0,0 +1,129 @@
+"""Shared scheduling and aggregation across Acond heat pump units."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import AcondCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Modbus requests in flight across all units at once
+MAX_IN_FLIGHT = 4
+
+# Poll phase offset between consecutive units [s]
+STAGGER_STEP = 3
+
+# Unit updates arriving within this window are aggregated once [s]
+AGGREGATE_COOLDOWN = 1.0
+
+
+@dataclass(frozen=True, kw_only=True)
+class HubData:
+    """Totals across all units, computed once per polling cycle."""
+
+    units_online: int
+    units_running: int
+    total_compressor_power: int
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> AcondHub:
+    """Return the hub shared by all config entries, creating it on first use."""
+    if (hub := hass.data.get(DOMAIN)) is None:
+        hub = hass.data[DOMAIN] = AcondHub(hass)
+    return hub
+
+
+class AcondHub(DataUpdateCoordinator[HubData]):
+    """Coordinate all heat pump units configured in Home Assistant.
+
+    Every unit's client holds the hub's request limiter for each Modbus
+    request, so no more than MAX_IN_FLIGHT run at once, and every unit gets
+    its own poll phase, so units set up together do not poll in bursts. Unit
+    updates are folded into HubData after a short cooldown, once per cycle
+    rather than once per unit.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        super().__init__(hass, _LOGGER, name="Acond Heat Pump hub", config_entry=None)
+        self.limiter = asyncio.Semaphore(MAX_IN_FLIGHT)
+        self.units: dict[str, AcondCoordinator] = {}
+        self._slots: dict[str, int] = {}
+        self._aggregate_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=AGGREGATE_COOLDOWN,
+            immediate=False,
+            function=self.async_refresh,
+        )
+
+    @callback
+    def async_add_unit(
+        self, entry_id: str, coordinator: AcondCoordinator
+    ) -> Callable[[], None]:
+        """Register a unit and shift its poll phase; return the removal callback.
+
+        Must be called before the unit's entities subscribe, while its first
+        scheduled refresh can still be delayed.
+        """
+        taken = set(self._slots.values())
+        slot = next(i for i in range(len(taken) + 1) if i not in taken)
+        self._slots[entry_id] = slot
+        self.units[entry_id] = coordinator
+        if coordinator.update_interval:
+            offset = slot * STAGGER_STEP % coordinator.update_interval.total_seconds()
+            coordinator.async_delay_next_refresh(timedelta(seconds=offset))
+        remove_listener = coordinator.async_add_listener(self._async_unit_updated)
+        self._async_unit_updated()
+
+        @callback
+        def remove_unit() -> None:
+            remove_listener()
+            del self.units[entry_id], self._slots[entry_id]
+            if self.units:
+                self._async_unit_updated()
+                return
+            self._aggregate_debouncer.async_cancel()
+            self.async_set_updated_data(self._aggregate())
+
+        return remove_unit
+
+    @callback
+    def _async_unit_updated(self) -> None:
+        """Schedule aggregation after a unit update."""
+        self._aggregate_debouncer.async_schedule_call()
+
+    async def _async_update_data(self) -> HubData:
+        """Aggregate the latest data of every reachable unit."""
+        return self._aggregate()
+
+    def _aggregate(self) -> HubData:
+        """Compute totals from the latest data of every reachable unit."""
+        online = [
+            coordinator.data
+            for coordinator in self.units.values()
+            if coordinator.last_update_success and coordinator.data is not None
+        ]
+        return HubData(
+            units_online=len(online),
+            units_running=sum(data.status.running for data in online),
+            total_compressor_power=sum(
+                data.compressor_capacity_actual
+                for data in online
+                if data.compressor_capacity_max
+            ),
+        )
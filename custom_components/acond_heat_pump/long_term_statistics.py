@@ -0,0 +1,252 @@
+"""Locally aggregated long-term statistics for the Acond Heat Pump integration."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import slugify
+
+from acond_heat_pump import HeatPumpResponse
+
+from .analytics import MAX_GAP
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.components.recorder.models import (
+        StatisticData,
+        StatisticMetaData,
+    )
+
+_LOGGER = logging.getLogger(__name__)
+
+# Length of a long-term statistics period [s]
+PERIOD = 3600
+
+# Aggregate of the current period that may be unset, persisted across restarts
+_PERSISTED = ("value", "updated_at", "period_start", "minimum", "maximum", "state")
+
+
+class StatisticSeries:
+    """Hourly aggregate of one sensor, fed with every raw sample.
+
+    Means are time-weighted like the recorder's: a value counts until the
+    next sample, but not across intervals longer than MAX_GAP.
+    """
+
+    __slots__ = (
+        "duration",
+        "maximum",
+        "minimum",
+        "period_start",
+        "rows",
+        "state",
+        "unit",
+        "updated_at",
+        "value",
+        "value_fn",
+        "weighted",
+    )
+
+    def __init__(
+        self,
+        value_fn: Callable[[HeatPumpResponse], float | int | None],
+        *,
+        unit: str | None,
+    ) -> None:
+        """Initialize a series that has not seen a sample yet."""
+        self.value_fn = value_fn
+        self.unit = unit
+        self.value: float | None = None
+        self.updated_at: float | None = None
+        self.period_start: float | None = None
+        self.weighted = 0.0
+        self.duration = 0.0
+        self.minimum: float | None = None
+        self.maximum: float | None = None
+        self.state: float | None = None
+        """Last value in the period."""
+        self.rows: list[StatisticData] = []
+        """Completed periods not imported yet."""
+
+    def add(self, timestamp: float, value: float | None) -> None:
+        """Add a sample, closing the period when the hour has turned."""
+        previous, updated_at = self.value, self.updated_at
+        self.value, self.updated_at = value, timestamp
+        period_start = timestamp - timestamp % PERIOD
+        carried = (
+            previous is not None
+            and updated_at is not None
+            and 0 < timestamp - updated_at <= MAX_GAP
+        )
+        if self.period_start is not None and period_start > self.period_start:
+            if carried:
+                self._accumulate(previous, updated_at, period_start)
+            self._close()
+            updated_at = period_start
+        self.period_start = period_start
+        if carried:
+            self._accumulate(previous, updated_at, timestamp)
+        if value is not None:
+            self._extend(value)
+            self.state = value
+
+    def _accumulate(self, value: float, start: float, end: float) -> None:
+        """Count value as held from start to end."""
+        self.weighted += value * (end - start)
+        self.duration += end - start
+        self._extend(value)
+
+    def _extend(self, value: float) -> None:
+        """Widen the period's range to include value."""
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def _close(self) -> None:
+        """Turn the current period into a row, if it saw any value."""
+        if self.period_start is not None and self.state is not None:
+            self.rows.append(
+                {
+                    "start": datetime.fromtimestamp(self.period_start, UTC),
+                    "mean": (
+                        self.weighted / self.duration if self.duration else self.state
+                    ),
+                    "min": self.minimum,
+                    "max": self.maximum,
+                }
+            )
+        self.weighted = self.duration = 0.0
+        self.minimum = self.maximum = self.state = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the aggregate of the current period to persist."""
+        return {
+            "weighted": self.weighted,
+            "duration": self.duration,
+            **{slot: getattr(self, slot) for slot in _PERSISTED},
+        }
+
+    def restore(self, stored: dict[str, Any]) -> None:
+        """Restore a persisted aggregate, ignoring it if malformed."""
+        try:
+            weighted = float(stored["weighted"])
+            duration = float(stored["duration"])
+            values = {
+                slot: None if stored[slot] is None else float(stored[slot])
+                for slot in _PERSISTED
+            }
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.debug("Ignoring invalid statistics aggregate %s", stored)
+            return
+        self.weighted, self.duration = weighted, duration
+        for slot, value in values.items():
+            setattr(self, slot, value)
+
+
+class LongTermStatistics:
+    """Hourly statistics of the tracked sensors, imported into the recorder.
+
+    The hourly mean, min and max of the tracked measurements are aggregated
+    from every poll and imported as the external statistic
+    acond_heat_pump:<unique id> when the hour has turned. The
+    sensors keep their state class, so the recorder still compiles their own
+    statistics from the published states. Totals are left to the recorder,
+    which keeps their sums continuous across resets. The aggregates of the
+    current hour are persisted with the snapshot.
+    """
+
+    def __init__(self) -> None:
+        """Initialize without tracked sensors."""
+        self._series: dict[str, StatisticSeries] = {}
+        self._restored: dict[str, dict[str, Any]] = {}
+        """Persisted aggregates of sensors not tracked yet."""
+
+    @callback
+    def async_track(
+        self,
+        unique_id: str,
+        value_fn: Callable[[HeatPumpResponse], float | int | None],
+        *,
+        unit: str | None,
+    ) -> CALLBACK_TYPE:
+        """Aggregate the statistics of a sensor; return a callback to stop."""
+        series = self._series[unique_id] = StatisticSeries(value_fn, unit=unit)
+        if (stored := self._restored.pop(unique_id, None)) is not None:
+            series.restore(stored)
+
+        @callback
+        def _async_untrack() -> None:
+            self._series.pop(unique_id, None)
+
+        return _async_untrack
+
+    def add(self, timestamp: float, data: HeatPumpResponse) -> bool:
+        """Add the raw data of a poll; return True if a period was completed."""
+        completed = False
+        for series in self._series.values():
+            value = series.value_fn(data)
+            series.add(timestamp, None if value is None else float(value))
+            completed |= bool(series.rows)
+        return completed
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the aggregates of the current period to persist."""
+        return {
+            unique_id: series.as_dict() for unique_id, series in self._series.items()
+        }
+
+    def restore(self, stored: dict[str, Any]) -> None:
+        """Keep persisted aggregates until their sensors are tracked."""
+        if not isinstance(stored, dict):
+            _LOGGER.debug("Ignoring invalid statistics aggregates %s", stored)
+            return
+        self._restored = {
+            unique_id: aggregate
+            for unique_id, aggregate in stored.items()
+            if isinstance(aggregate, dict)
+        }
+
+    @callback
+    def async_import(self, hass: HomeAssistant) -> None:
+        """Import the completed periods into the recorder."""
+        if "recorder" not in hass.config.components:
+            for series in self._series.values():
+                series.rows = []
+            return
+        # Only imported with local statistics enabled, and after the recorder
+        # has been set up
+        from homeassistant.components.recorder.models import (
+            StatisticMeanType,
+        )
+        from homeassistant.components.recorder.statistics import (
+            async_add_external_statistics,
+        )
+
+        registry = er.async_get(hass)
+        for unique_id, series in self._series.items():
+            rows, series.rows = series.rows, []
+            entity_id = registry.async_get_entity_id(Platform.SENSOR, DOMAIN, unique_id)
+            if not rows or entity_id is None:
+                continue
+            state = hass.states.get(entity_id)
+            statistic_id = f"{DOMAIN}:{slugify(unique_id)}"
+            metadata: StatisticMetaData = {
+                "has_mean": True,
+                "mean_type": StatisticMeanType.ARITHMETIC,
+                "has_sum": False,
+                "name": state.name if state is not None else None,
+                "source": DOMAIN,
+                "statistic_id": statistic_id,
+                "unit_of_measurement": series.unit,
+            }
+            _LOGGER.debug(
+                "Importing %d hourly statistics of %s", len(rows), statistic_id
+            )
+            async_add_external_statistics(hass, metadata, rows)
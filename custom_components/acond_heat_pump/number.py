@@ -8,8 +8,14 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import AcondConfigEntry
+from .client import (
+    REG_DHW_TEMP_SET,
+    REG_POOL_TEMP_SET,
+    REG_WATER_BACK_TEMP_SET,
+    REG_WATER_COOL_TEMP_SET,
+)
 from .coordinator import AcondCoordinator
-from .entity import AcondEntity
+from .entity import AcondSetpointEntity
 
 
 async def async_setup_entry(
@@ -30,7 +36,7 @@ async def async_setup_entry(
     )
 
 
-class AcondWaterBackTemperature(AcondEntity, NumberEntity):
+class AcondWaterBackTemperature(AcondSetpointEntity, NumberEntity):
     """Representation of the water back temperature setpoint."""
 
     _attr_icon = "mdi:thermometer-water"
@@ -41,6 +47,8 @@ class AcondWaterBackTemperature(AcondEntity, NumberEntity):
     _attr_native_step = 0.5
     _attr_mode = NumberMode.SLIDER
     _attr_translation_key = "water_back_temperature"
+    _data_keys = frozenset({"water_back_temp_set"})
+    _setpoint_register = REG_WATER_BACK_TEMP_SET
 
     def __init__(self, coordinator: AcondCoordinator, entry_id: str) -> None:
         """Initialize the number entity."""
@@ -54,13 +62,10 @@ class AcondWaterBackTemperature(AcondEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new water back temperature setpoint."""
-        await self.hass.async_add_executor_job(
-            self.coordinator.client.set_water_back_temperature, value
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_setpoint(self._setpoint_register, value)
 
 
-class AcondPoolTemperature(AcondEntity, NumberEntity):
+class AcondPoolTemperature(AcondSetpointEntity, NumberEntity):
     """Representation of the pool temperature setpoint."""
 
     _attr_icon = "mdi:pool-thermometer"
@@ -71,6 +76,8 @@ class AcondPoolTemperature(AcondEntity, NumberEntity):
     _attr_native_step = 0.5
     _attr_mode = NumberMode.SLIDER
     _attr_translation_key = "pool_temperature_setpoint"
+    _data_keys = frozenset({"pool_temp_set"})
+    _setpoint_register = REG_POOL_TEMP_SET
 
     def __init__(self, coordinator: AcondCoordinator, entry_id: str) -> None:
         """Initialize the number entity."""
@@ -84,13 +91,10 @@ class AcondPoolTemperature(AcondEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new pool temperature setpoint."""
-        await self.hass.async_add_executor_job(
-            self.coordinator.client.set_pool_temperature, value
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_setpoint(self._setpoint_register, value)
 
 
-class AcondWaterCoolTemperature(AcondEntity, NumberEntity):
+class AcondWaterCoolTemperature(AcondSetpointEntity, NumberEntity):
     """Representation of the water cooling outlet temperature setpoint."""
 
     _attr_icon = "mdi:snowflake-thermometer"
@@ -101,6 +105,8 @@ class AcondWaterCoolTemperature(AcondEntity, NumberEntity):
     _attr_native_step = 0.5
     _attr_mode = NumberMode.SLIDER
     _attr_translation_key = "water_cool_temperature"
+    _data_keys = frozenset({"water_outlet_temp_set"})
+    _setpoint_register = REG_WATER_COOL_TEMP_SET
 
     def __init__(self, coordinator: AcondCoordinator, entry_id: str) -> None:
         """Initialize the number entity."""
@@ -114,13 +120,10 @@ class AcondWaterCoolTemperature(AcondEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new water cooling temperature setpoint."""
-        await self.hass.async_add_executor_job(
-            self.coordinator.client.set_water_cool_temperature, value
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_setpoint(self._setpoint_register, value)
 
 
-class AcondDhwTemperature(AcondEntity, NumberEntity):
+class AcondDhwTemperature(AcondSetpointEntity, NumberEntity):
     """Representation of the DHW (boiler) temperature setpoint."""
 
     _attr_icon = "mdi:water-boiler"
@@ -131,6 +134,8 @@ class AcondDhwTemperature(AcondEntity, NumberEntity):
     _attr_native_step = 0.5
     _attr_mode = NumberMode.SLIDER
     _attr_translation_key = "dhw_temperature_setpoint"
+    _data_keys = frozenset({"dhw_temp_set"})
+    _setpoint_register = REG_DHW_TEMP_SET
 
     def __init__(self, coordinator: AcondCoordinator, entry_id: str) -> None:
         """Initialize the number entity."""
@@ -144,7 +149,4 @@ class AcondDhwTemperature(AcondEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new DHW temperature setpoint."""
-        await self.hass.async_add_executor_job(
-            self.coordinator.client.set_dhw_temperature, value
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_setpoint(self._setpoint_register, value)
@@ -0,0 +1,188 @@
+"""Price-aware setpoint planning for the Acond Heat Pump integration."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from acond_heat_pump import HeatPumpResponse
+
+from .client import REG_DHW_TEMP_SET, REG_INDOOR1_TEMP_SET, REG_INDOOR2_TEMP_SET
+from .performance import MIN_LIFT, ZERO_CELSIUS
+
+# Temperature resolution of a plan [K]
+RESOLUTION = 0.5
+
+# The heating water is assumed this much warmer than the DHW tank [K]
+DHW_APPROACH = 5.0
+
+# Hot water drawn is replaced with cold water, so its heat is lost to about
+# midway between the cold water and the room around the tank [°C]
+DHW_AMBIENT = 15.0
+
+# Heating water temperature assumed when the outlet temperature is unknown [°C]
+DEFAULT_FLOW_TEMPERATURE = 35.0
+
+
+@dataclass(frozen=True, kw_only=True)
+class ThermalStore:
+    """A building or tank as one lumped heat capacity losing heat to ambient."""
+
+    capacity: float
+    """Heat stored per kelvin [kWh/K]."""
+    heat_loss: float
+    """Heat lost per kelvin above ambient [W/K]."""
+
+
+# Stores of the setpoints that can be planned: a typical house for the
+# circuits, and a 200 l tank from which about 5 kWh is drawn a day for DHW
+STORES: dict[int, ThermalStore] = {
+    REG_INDOOR1_TEMP_SET: ThermalStore(capacity=8.0, heat_loss=150.0),
+    REG_INDOOR2_TEMP_SET: ThermalStore(capacity=8.0, heat_loss=150.0),
+    REG_DHW_TEMP_SET: ThermalStore(capacity=0.23, heat_loss=8.0),
+}
+
+
+def carnot_cop(sink: float, source: float, efficiency: float) -> float:
+    """Return the COP of lifting heat from source to sink temperature."""
+    return efficiency * (sink + ZERO_CELSIUS) / max(sink - source, MIN_LIFT)
+
+
+def optimize_setpoints(
+    prices: Sequence[float],
+    *,
+    interval: float,
+    initial: float,
+    minimum: float,
+    maximum: float,
+    ambient: float,
+    store: ThermalStore,
+    power: float,
+    cop: Callable[[float], float],
+) -> list[float]:
+    """Return the setpoint of each price interval minimizing the energy cost.
+
+    Dynamic programming over the store temperature, on a grid of RESOLUTION
+    between minimum and maximum: heating from one level to another within an
+    interval costs the heat stored and lost, divided by the COP at the new
+    level, at that interval's price. The heat pump can't draw more than power
+    [W], and the store can't cool faster than its losses allow, give or take
+    a level so that it can coast down in short intervals too. Heat left in
+    the store at the end is valued at the mean price, so the plan doesn't
+    simply run the store down. The transition costs are computed once, so a
+    plan takes O(intervals * levels²).
+    """
+    count = math.ceil((maximum - minimum) / RESOLUTION - 1e-9) + 1
+    levels = [min(minimum + index * RESOLUTION, maximum) for index in range(count)]
+    hours = interval / 3600
+    stored = store.capacity * 1000
+    slack = stored * RESOLUTION
+    cops = [cop(level) for level in levels]
+    # Levels the store can reach from each level within an interval, with the
+    # electrical energy that takes [Wh]
+    moves: list[list[tuple[int, float]]] = []
+    for start in levels:
+        row: list[tuple[int, float]] = []
+        for index, (end, level_cop) in enumerate(zip(levels, cops, strict=True)):
+            heat = stored * (end - start)
+            heat += store.heat_loss * ((start + end) / 2 - ambient) * hours
+            electrical = max(heat, 0.0) / level_cop
+            if heat >= -slack and electrical <= power * hours:
+                row.append((index, electrical))
+        moves.append(row)
+
+    initial = min(max(initial, minimum), maximum)
+    start_index = min(round((initial - minimum) / RESOLUTION), count - 1)
+    start_level = levels[start_index]
+    mean_price = sum(prices) / len(prices)
+    cost = [
+        stored * (start_level - level) / level_cop * mean_price
+        for level, level_cop in zip(levels, cops, strict=True)
+    ]
+    choices: list[list[int]] = []
+    for price in reversed(prices):
+        step_cost: list[float] = []
+        step_choice: list[int] = []
+        for row in moves:
+            best, best_index = math.inf, -1
+            for index, electrical in row:
+                if (total := price * electrical + cost[index]) < best:
+                    best, best_index = total, index
+            step_cost.append(best)
+            step_choice.append(best_index)
+        cost = step_cost
+        choices.append(step_choice)
+    choices.reverse()
+
+    if cost[start_index] == math.inf:
+        raise ValueError(
+            f"{power:.0f} W can't keep the temperature between {minimum} and "
+            f"{maximum} °C"
+        )
+    setpoints: list[float] = []
+    index = start_index
+    for step_choice in choices:
+        index = step_choice[index]
+        setpoints.append(levels[index])
+    return setpoints
+
+
+def plan_setpoint(
+    register: int,
+    data: HeatPumpResponse,
+    prices: Sequence[float],
+    *,
+    interval: float,
+    minimum: float,
+    maximum: float,
+    store: ThermalStore,
+    power: float,
+    carnot_efficiency: float,
+) -> list[float]:
+    """Plan a circuit or DHW setpoint from the state of the heat pump.
+
+    The current outdoor temperature is assumed to hold over the whole plan,
+    and hot water to be drawn evenly.
+    """
+    source = data.brine_temp
+    if source is None:
+        source = data.outdoor_temp_actual
+    if source is None:
+        raise ValueError("The heat pump doesn't report its source temperature")
+    if register == REG_DHW_TEMP_SET:
+        initial = data.dhw_temp_actual
+        ambient = DHW_AMBIENT
+
+        def cop(level: float) -> float:
+            return carnot_cop(level + DHW_APPROACH, source, carnot_efficiency)
+
+    else:
+        if register == REG_INDOOR1_TEMP_SET:
+            initial = data.indoor1_temp_actual
+        else:
+            initial = data.indoor2_temp_actual
+        ambient = data.outdoor_temp_actual
+        if ambient is None:
+            raise ValueError("The heat pump doesn't report the outdoor temperature")
+        flow = data.water_outlet_temp_actual
+        if flow is None:
+            flow = DEFAULT_FLOW_TEMPERATURE
+        flow_cop = carnot_cop(flow, source, carnot_efficiency)
+
+        def cop(level: float) -> float:
+            return flow_cop
+
+    if initial is None:
+        initial = minimum
+    return optimize_setpoints(
+        prices,
+        interval=interval,
+        initial=initial,
+        minimum=minimum,
+        maximum=maximum,
+        ambient=ambient,
+        store=store,
+        power=power,
+        cop=cop,
+    )
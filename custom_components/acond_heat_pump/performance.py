@@ -0,0 +1,165 @@
+"""Thermal output and COP estimation for the Acond Heat Pump integration."""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+from acond_heat_pump import HeatPumpResponse
+
+from .analytics import MAX_GAP
+
+_LOGGER = logging.getLogger(__name__)
+
+# Window of the rolling COP [s]
+COP_WINDOW = 3600
+
+# The Carnot estimate assumes at least this temperature lift [K]
+MIN_LIFT = 5.0
+
+ZERO_CELSIUS = 273.15
+
+
+class EnergyMeter:
+    """Integrate sampled power into energy with the trapezoidal rule.
+
+    Samples further apart than MAX_GAP are not integrated across: the power
+    in between went unobserved, so the total is left short rather than
+    guessed. The first sample after a restart only starts a new interval.
+    """
+
+    __slots__ = ("power", "total", "updated_at")
+
+    def __init__(self) -> None:
+        """Initialize a meter at zero."""
+        self.total = 0.0
+        """Total energy [kWh]."""
+        self.power = 0.0
+        """Power at the last sample [W]."""
+        self.updated_at: float | None = None
+
+    def add(self, timestamp: float, power: float) -> float | None:
+        """Add a power sample [W]; return the energy since the last one [Wh]."""
+        previous, updated_at = self.power, self.updated_at
+        self.power, self.updated_at = power, timestamp
+        if updated_at is None:
+            return None
+        gap = timestamp - updated_at
+        if not 0 < gap <= MAX_GAP:
+            if gap:
+                _LOGGER.debug("Not metering %.0f s without samples", gap)
+            return None
+        energy = (previous + power) / 2 * gap / 3600
+        self.total += energy / 1000
+        return energy
+
+
+@dataclass(frozen=True, kw_only=True)
+class PerformanceParameters:
+    """Hydraulic and refrigerant parameters of the installation."""
+
+    flow_rate: float
+    """Heating water flow [l/min]; 0 estimates the output from the lift."""
+    heat_capacity: float
+    """Volumetric heat capacity of the heating water [kJ/(l·K)]."""
+    carnot_efficiency: float
+    """Share of the Carnot COP reached by the refrigerant cycle."""
+
+
+class PerformanceEstimator:
+    """Heat output and COP, updated in O(1) per poll.
+
+    Compressor power is taken as the electrical input. With a known flow rate
+    the output is measured from the outlet and return water temperatures,
+    otherwise it is estimated from the lift between the brine (or outdoor) and
+    outlet temperatures. Both powers are metered at every poll. No heat is
+    counted during defrost, cooling and bivalent heating, while the power
+    drawn still is, so the rolling COP and the energy totals include their
+    cost.
+    """
+
+    def __init__(self, parameters: PerformanceParameters) -> None:
+        """Initialize an estimator that has not seen a poll yet."""
+        self.parameters = parameters
+        self.thermal_power: float | None = None
+        """Heat output at the last poll [W]."""
+        self.cop: float | None = None
+        """Heat output over compressor power at the last poll."""
+        self.heat = EnergyMeter()
+        """Heat delivered."""
+        self.electrical = EnergyMeter()
+        """Energy drawn by the compressor."""
+        self._window: deque[tuple[float, float, float]] = deque()
+        """(timestamp, heat, electrical) energy per poll interval [Wh]."""
+        self._window_heat = 0.0
+        self._window_electrical = 0.0
+
+    def update(self, timestamp: float, data: HeatPumpResponse) -> None:
+        """Fold in a successful poll."""
+        status = data.status
+        power = float(data.compressor_capacity_actual or 0)
+        if not status.running:
+            thermal_power: float | None = 0.0
+        elif status.defrost or status.cooling_running or status.bivalence_running:
+            thermal_power = None
+        else:
+            thermal_power = self._estimate_output(data, power)
+        self.thermal_power = thermal_power
+        self.cop = thermal_power / power if thermal_power and power else None
+
+        heat = self.heat.add(timestamp, thermal_power or 0.0)
+        electrical = self.electrical.add(timestamp, power)
+        window = self._window
+        if heat is not None and electrical is not None:
+            window.append((timestamp, heat, electrical))
+            self._window_heat += heat
+            self._window_electrical += electrical
+        while window and window[0][0] <= timestamp - COP_WINDOW:
+            _, heat, electrical = window.popleft()
+            self._window_heat -= heat
+            self._window_electrical -= electrical
+
+    def _estimate_output(self, data: HeatPumpResponse, power: float) -> float | None:
+        """Return the heat output while heating [W]."""
+        parameters = self.parameters
+        outlet = data.water_outlet_temp_actual
+        if parameters.flow_rate:
+            if outlet is None or (back := data.water_back_temp_actual) is None:
+                return None
+            # l/min * kJ/(l·K) * K / 60 s = kW
+            delta = max(outlet - back, 0.0)
+            return parameters.flow_rate * parameters.heat_capacity * delta / 60 * 1000
+        source = data.brine_temp
+        if source is None:
+            source = data.outdoor_temp_actual
+        if not power or outlet is None or source is None:
+            return None
+        lift = max(outlet - source, MIN_LIFT)
+        return power * parameters.carnot_efficiency * (outlet + ZERO_CELSIUS) / lift
+
+    @property
+    def rolling_cop(self) -> float | None:
+        """Return the heat delivered over the energy drawn in the last hour."""
+        if self._window_electrical <= 0:
+            return None
+        return self._window_heat / self._window_electrical
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state to persist."""
+        return {
+            "heat_energy": self.heat.total,
+            "electrical_energy": self.electrical.total,
+        }
+
+    def restore(self, stored: dict[str, Any]) -> None:
+        """Restore a persisted state, ignoring it if malformed."""
+        try:
+            heat_energy = float(stored["heat_energy"])
+            electrical_energy = float(stored["electrical_energy"])
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.debug("Ignoring invalid performance totals %s", stored)
+            return
+        self.heat.total = heat_energy
+        self.electrical.total = electrical_energy
@@ -0,0 +1,252 @@
+"""Weekly setpoint programs for the Acond Heat Pump integration."""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_right
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime, time, timedelta
+from typing import Any
+
+from homeassistant.const import ATTR_TEMPERATURE, WEEKDAYS
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Minutes in a week; a program time is minutes since Monday 00:00 local time
+WEEK_MINUTES = 7 * 24 * 60
+
+type Program = list[tuple[int, float]]
+"""Sorted (minute of the week, temperature) transitions."""
+
+type Plan = list[tuple[float, float]]
+"""Sorted (timestamp, temperature) steps; the last one ends the plan."""
+
+ATTR_DAYS = "days"
+ATTR_TIME = "time"
+
+
+def minute_of_week(moment: datetime) -> int:
+    """Return the minutes since Monday 00:00 of a local time."""
+    return moment.weekday() * 1440 + moment.hour * 60 + moment.minute
+
+
+def effective_target(program: Program, minute: int) -> float:
+    """Return the temperature in effect at a minute of the week.
+
+    Before the first transition of the week the last one still applies.
+    """
+    index = bisect_right(program, minute, key=lambda transition: transition[0])
+    return program[index - 1][1]
+
+
+def next_transition(program: Program, minute: int) -> tuple[int, float]:
+    """Return the first transition after a minute of the week.
+
+    The minute returned is counted from the same Monday, so it exceeds
+    WEEK_MINUTES when the program wraps around to the next week.
+    """
+    index = bisect_right(program, minute, key=lambda transition: transition[0])
+    if index < len(program):
+        return program[index]
+    first_minute, temperature = program[0]
+    return first_minute + WEEK_MINUTES, temperature
+
+
+def build_program(entries: Iterable[dict[str, Any]]) -> Program:
+    """Expand validated set_schedule entries into a program.
+
+    A later entry for the same day and time replaces an earlier one.
+    """
+    program: dict[int, float] = {}
+    for entry in entries:
+        at: time = entry[ATTR_TIME]
+        for day in entry[ATTR_DAYS]:
+            minute = WEEKDAYS.index(day) * 1440 + at.hour * 60 + at.minute
+            program[minute] = entry[ATTR_TEMPERATURE]
+    return sorted(program.items())
+
+
+def _step_start(step: tuple[float, float]) -> float:
+    """Return the start of a plan step."""
+    return step[0]
+
+
+class SetpointScheduler:
+    """Weekly setpoint programs applied locally, one timer for all of them.
+
+    The next transition of every program is precomputed, and a single timer
+    is armed for the earliest one. When it fires, only registers whose target
+    actually changes are handed to the write callback, which may still skip
+    the write if the heat pump already holds that value.
+
+    A plan overrides the program of its register until its last step, which
+    sets the value to return to when the register has no program.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        apply: Callable[[int, float], Awaitable[None]],
+    ) -> None:
+        """Initialize without programs."""
+        self.hass = hass
+        self._apply = apply
+        self.programs: dict[int, Program] = {}
+        """Program of each setpoint register."""
+        self.plans: dict[int, Plan] = {}
+        """Plan of each setpoint register, until its last step."""
+        self._next: dict[int, datetime] = {}
+        """Time of the next transition of each program."""
+        self._targets: dict[int, float] = {}
+        """Target last handed to the write callback per register."""
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Apply the targets in effect now and arm the timer."""
+        now = dt_util.now()
+        for register in self.programs.keys() | self.plans.keys():
+            self._async_apply(register, now, force=True)
+        self._async_arm(now)
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the timer."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def async_set_program(self, register: int, program: Program) -> None:
+        """Replace the program of a register and apply its current target."""
+        self.programs[register] = program
+        now = dt_util.now()
+        self._async_apply(register, now, force=True)
+        self._async_arm(now)
+
+    @callback
+    def async_set_plan(self, register: int, plan: Plan) -> None:
+        """Replace the plan of a register and apply its current target."""
+        self.plans[register] = plan
+        now = dt_util.now()
+        self._async_apply(register, now, force=True)
+        self._async_arm(now)
+
+    @callback
+    def async_clear_program(self, register: int) -> None:
+        """Remove the program and plan of a register; its setpoint is left."""
+        program = self.programs.pop(register, None)
+        plan = self.plans.pop(register, None)
+        if program is not None or plan is not None:
+            self._targets.pop(register, None)
+            self._async_arm(dt_util.now())
+
+    def _target(self, register: int, now: datetime) -> float | None:
+        """Return the target in effect now: the plan's, else the program's."""
+        if plan := self.plans.get(register):
+            index = bisect_right(plan, now.timestamp(), key=_step_start)
+            if 0 < index < len(plan) or (index and register not in self.programs):
+                return plan[index - 1][1]
+        if (program := self.programs.get(register)) is not None:
+            return effective_target(program, minute_of_week(now))
+        return None
+
+    @callback
+    def _async_apply(
+        self, register: int, now: datetime, *, force: bool = False
+    ) -> None:
+        """Hand the target in effect now to the write callback if it changed."""
+        target = self._target(register, now)
+        if target is None or (not force and self._targets.get(register) == target):
+            return
+        self._targets[register] = target
+        self.hass.async_create_task(
+            self._apply(register, target), f"{DOMAIN} scheduled setpoint {register}"
+        )
+
+    @callback
+    def _async_arm(self, now: datetime) -> None:
+        """Precompute the next transitions and arm the timer for the earliest.
+
+        Plans that have ended are dropped.
+        """
+        self.async_stop()
+        timestamp = now.timestamp()
+        self.plans = {
+            register: plan
+            for register, plan in self.plans.items()
+            if plan[-1][0] > timestamp
+        }
+        monday = (now - timedelta(days=now.weekday())).date()
+        minute = minute_of_week(now)
+        timezone = dt_util.get_default_time_zone()
+        self._next = {}
+        for register, program in self.programs.items():
+            at, _ = next_transition(program, minute)
+            # Built from the wall clock so that DST changes keep program times
+            day, minute_of_day = divmod(at, 1440)
+            self._next[register] = datetime.combine(
+                monday + timedelta(days=day),
+                time(minute_of_day // 60, minute_of_day % 60),
+                tzinfo=timezone,
+            )
+        for register, plan in self.plans.items():
+            index = bisect_right(plan, timestamp, key=_step_start)
+            at = dt_util.utc_from_timestamp(plan[index][0])
+            if register not in self._next or at < self._next[register]:
+                self._next[register] = at
+        if self._next:
+            self._unsub_timer = async_track_point_in_time(
+                self.hass, self._async_fire, min(self._next.values())
+            )
+
+    @callback
+    def _async_fire(self, now: datetime) -> None:
+        """Apply the programs whose transition is due and re-arm."""
+        self._unsub_timer = None
+        now = dt_util.as_local(now)
+        for register, at in self._next.items():
+            if at <= now:
+                self._async_apply(register, now)
+        self._async_arm(now)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the programs and plans to persist."""
+        return {
+            "programs": {
+                str(register): [list(transition) for transition in program]
+                for register, program in self.programs.items()
+            },
+            "plans": {
+                str(register): [list(step) for step in plan]
+                for register, plan in self.plans.items()
+            },
+        }
+
+    def restore(self, stored: dict[str, Any]) -> None:
+        """Restore persisted programs and plans, ignoring them if malformed."""
+        try:
+            programs = {
+                int(register): sorted(
+                    (int(minute), float(temperature)) for minute, temperature in program
+                )
+                for register, program in stored.get("programs", {}).items()
+            }
+            plans = {
+                int(register): sorted(
+                    (float(at), float(temperature)) for at, temperature in plan
+                )
+                for register, plan in stored.get("plans", {}).items()
+            }
+        except (AttributeError, TypeError, ValueError):
+            _LOGGER.debug("Ignoring invalid setpoint programs %s", stored)
+            return
+        self.programs = {
+            register: program for register, program in programs.items() if program
+        }
+        self.plans = {register: plan for register, plan in plans.items() if plan}
@@ -6,17 +6,39 @@ from homeassistant.components.select import SelectEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from acond_heat_pump import HeatPumpMode, RegulationMode
+
 from . import AcondConfigEntry
-from .const import (
-    HEAT_PUMP_MODE_BY_KEY,
-    HEAT_PUMP_MODE_KEYS,
-    OPERATION_MODE_OPTIONS,
-    REGULATION_MODE_BY_KEY,
-    REGULATION_MODE_KEYS,
-)
+from .const import OPERATION_MODE_OPTIONS
 from .coordinator import AcondCoordinator
 from .entity import AcondEntity
 
+# HeatPumpMode -> translation key
+HEAT_PUMP_MODE_KEYS: dict[HeatPumpMode, str] = {
+    HeatPumpMode.AUTOMATIC: "automatic",
+    HeatPumpMode.HEAT_PUMP_ONLY: "heat_pump",
+    HeatPumpMode.BIVALENT_ONLY: "bivalency_source",
+    HeatPumpMode.COOLING: "cooling",
+    HeatPumpMode.OFF: "off",
+}
+
+# Translation key -> HeatPumpMode (reverse lookup)
+HEAT_PUMP_MODE_BY_KEY: dict[str, HeatPumpMode] = {
+    v: k for k, v in HEAT_PUMP_MODE_KEYS.items()
+}
+
+# RegulationMode -> translation key
+REGULATION_MODE_KEYS: dict[RegulationMode, str] = {
+    RegulationMode.ACOND_THERM: "smart_therm",
+    RegulationMode.EQUITHERMAL: "ekviterm",
+    RegulationMode.MANUAL: "standard",
+}
+
+# Translation key -> RegulationMode (reverse lookup)
+REGULATION_MODE_BY_KEY: dict[str, RegulationMode] = {
+    v: k for k, v in REGULATION_MODE_KEYS.items()
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -41,6 +63,7 @@ class AcondRegimeSelect(AcondEntity, SelectEntity):
     _attr_icon = "mdi:heat-pump"
     _attr_translation_key = "regime"
     _attr_options = list(HEAT_PUMP_MODE_KEYS.values())
+    _data_keys = frozenset({"heat_pump_mode"})
 
     def __init__(self, coordinator: AcondCoordinator, entry_id: str) -> None:
         """Initialize the regime select."""
@@ -57,10 +80,7 @@ class AcondRegimeSelect(AcondEntity, SelectEntity):
         """Set the regime."""
         if (mode := HEAT_PUMP_MODE_BY_KEY.get(option)) is None:
             return
-        await self.hass.async_add_executor_job(
-            self.coordinator.client.change_setting, mode
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_heat_pump_mode(mode)
 
 
 class AcondRegulationSelect(AcondEntity, SelectEntity):
@@ -69,6 +89,7 @@ class AcondRegulationSelect(AcondEntity, SelectEntity):
     _attr_icon = "mdi:tune"
     _attr_translation_key = "regulation"
     _attr_options = list(REGULATION_MODE_KEYS.values())
+    _data_keys = frozenset({"regulation_mode"})
 
     def __init__(self, coordinator: AcondCoordinator, entry_id: str) -> None:
         """Initialize the regulation select."""
@@ -85,10 +106,7 @@ class AcondRegulationSelect(AcondEntity, SelectEntity):
         """Set the regulation mode."""
         if (mode := REGULATION_MODE_BY_KEY.get(option)) is None:
             return
-        await self.hass.async_add_executor_job(
-            self.coordinator.client.set_regulation_mode, mode
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_regulation_mode(mode)
 
 
 class AcondOperationSelect(AcondEntity, SelectEntity):
@@ -97,6 +115,7 @@ class AcondOperationSelect(AcondEntity, SelectEntity):
     _attr_icon = "mdi:sun-snowflake-variant"
     _attr_translation_key = "operation"
     _attr_options = OPERATION_MODE_OPTIONS
+    _data_keys = frozenset({"status.summer_mode"})
 
     def __init__(self, coordinator: AcondCoordinator, entry_id: str) -> None:
         """Initialize the operation select."""
@@ -113,7 +132,4 @@ class AcondOperationSelect(AcondEntity, SelectEntity):
     async def async_select_option(self, option: str) -> None:
         """Set the operation mode."""
         summer = option == "summer"
-        await self.hass.async_add_executor_job(
-            self.coordinator.client.set_summer_mode, summer
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_summer_mode(summer)
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime
+import time
+from typing import Any
 
 from acond_heat_pump import HeatPumpResponse
 
@@ -13,21 +16,56 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import UnitOfPower, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    MATCH_ALL,
+    UnitOfEnergy,
+    UnitOfInformation,
+    UnitOfPower,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
-from . import AcondConfigEntry
+from . import AcondConfigEntry, AcondHubConfigEntry
+from .analytics import CycleAnalytics
+from .const import (
+    CONF_DIAGNOSTIC_PUBLISH_INTERVAL,
+    CONF_FLOW_RATE,
+    CONF_HUB,
+    CONF_MAX_PUBLISH_INTERVAL,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_POWER_DEADBAND,
+    CONF_TEMPERATURE_DEADBAND,
+    DEADBAND_DEFAULTS,
+    DEFAULT_DIAGNOSTIC_PUBLISH_INTERVAL,
+    DEFAULT_FLOW_RATE,
+    DEFAULT_MAX_PUBLISH_INTERVAL,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+)
 from .coordinator import AcondCoordinator
-from .entity import AcondEntity
+from .entity import AcondDerivedEntity, AcondEntity, AcondHubEntity
+from .history import HistoryBuffer
+from .hub import AcondHub, HubData
+from .performance import PerformanceEstimator
+from .stats import AcondStats
+from .thermal_model import ThermalModel
 
 
 @dataclass(frozen=True, kw_only=True)
 class AcondSensorEntityDescription(SensorEntityDescription):
     """Describes an Acond sensor entity."""
 
+    data_key: str
     value_fn: Callable[[HeatPumpResponse], float | int | None]
+    deadband_key: str | None = None
+    """Option holding the deadband; None publishes every change."""
+    relative_deadband: bool = False
+    """Deadband is a percentage of the published value."""
+    pro_only: bool = False
+    """Only created on PRO units, which report a maximum compressor power."""
 
 
 SENSOR_DESCRIPTIONS: tuple[AcondSensorEntityDescription, ...] = (
@@ -38,6 +76,8 @@ SENSOR_DESCRIPTIONS: tuple[AcondSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        data_key="outdoor_temp_actual",
+        deadband_key=CONF_TEMPERATURE_DEADBAND,
         value_fn=lambda data: data.outdoor_temp_actual,
     ),
     AcondSensorEntityDescription(
@@ -47,6 +87,8 @@ SENSOR_DESCRIPTIONS: tuple[AcondSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        data_key="water_back_temp_actual",
+        deadband_key=CONF_TEMPERATURE_DEADBAND,
         value_fn=lambda data: data.water_back_temp_actual,
     ),
     AcondSensorEntityDescription(
@@ -56,6 +98,7 @@ SENSOR_DESCRIPTIONS: tuple[AcondSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        data_key="water_back_temp_set",
         value_fn=lambda data: data.water_back_temp_set,
     ),
     AcondSensorEntityDescription(
@@ -65,6 +108,8 @@ SENSOR_DESCRIPTIONS: tuple[AcondSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        data_key="brine_temp",
+        deadband_key=CONF_TEMPERATURE_DEADBAND,
         value_fn=lambda data: data.brine_temp,
     ),
     AcondSensorEntityDescription(
@@ -74,6 +119,8 @@ SENSOR_DESCRIPTIONS: tuple[AcondSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        data_key="indoor2_temp_actual",
+        deadband_key=CONF_TEMPERATURE_DEADBAND,
         value_fn=lambda data: data.indoor2_temp_actual,
     ),
     AcondSensorEntityDescription(
@@ -83,6 +130,8 @@ SENSOR_DESCRIPTIONS: tuple[AcondSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        data_key="solar_temp_actual",
+        deadband_key=CONF_TEMPERATURE_DEADBAND,
         value_fn=lambda data: data.solar_temp_actual,
     ),
     AcondSensorEntityDescription(
@@ -92,6 +141,8 @@ SENSOR_DESCRIPTIONS: tuple[AcondSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        data_key="pool_temp_actual",
+        deadband_key=CONF_TEMPERATURE_DEADBAND,
         value_fn=lambda data: data.pool_temp_actual,
     ),
     AcondSensorEntityDescription(
@@ -101,6 +152,7 @@ SENSOR_DESCRIPTIONS: tuple[AcondSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        data_key="pool_temp_set",
         value_fn=lambda data: data.pool_temp_set,
     ),
     AcondSensorEntityDescription(
@@ -110,6 +162,8 @@ SENSOR_DESCRIPTIONS: tuple[AcondSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        data_key="water_outlet_temp_actual",
+        deadband_key=CONF_TEMPERATURE_DEADBAND,
         value_fn=lambda data: data.water_outlet_temp_actual,
     ),
     AcondSensorEntityDescription(
@@ -119,6 +173,7 @@ SENSOR_DESCRIPTIONS: tuple[AcondSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        data_key="water_outlet_temp_set",
         value_fn=lambda data: data.water_outlet_temp_set,
     ),
     AcondSensorEntityDescription(
@@ -129,6 +184,10 @@ SENSOR_DESCRIPTIONS: tuple[AcondSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.WATT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        data_key="compressor_capacity_actual",
+        deadband_key=CONF_POWER_DEADBAND,
+        relative_deadband=True,
+        pro_only=True,
         value_fn=lambda data: data.compressor_capacity_actual,
     ),
     AcondSensorEntityDescription(
@@ -139,6 +198,7 @@ SENSOR_DESCRIPTIONS: tuple[AcondSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.WATT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        data_key="compressor_capacity_max",
         value_fn=lambda data: data.compressor_capacity_max,
     ),
     AcondSensorEntityDescription(
@@ -146,6 +206,7 @@ SENSOR_DESCRIPTIONS: tuple[AcondSensorEntityDescription, ...] = (
         translation_key="error_code",
         icon="mdi:alert-circle",
         entity_category=EntityCategory.DIAGNOSTIC,
+        data_key="err_number",
         value_fn=lambda data: data.err_number,
     ),
     AcondSensorEntityDescription(
@@ -153,6 +214,7 @@ SENSOR_DESCRIPTIONS: tuple[AcondSensorEntityDescription, ...] = (
         translation_key="error_code_secmono",
         icon="mdi:alert-circle",
         entity_category=EntityCategory.DIAGNOSTIC,
+        data_key="err_number_SECMono",
         value_fn=lambda data: data.err_number_SECMono,
     ),
     AcondSensorEntityDescription(
@@ -160,6 +222,7 @@ SENSOR_DESCRIPTIONS: tuple[AcondSensorEntityDescription, ...] = (
         translation_key="error_code_driver",
         icon="mdi:alert-circle",
         entity_category=EntityCategory.DIAGNOSTIC,
+        data_key="err_number_driver",
         value_fn=lambda data: data.err_number_driver,
     ),
     AcondSensorEntityDescription(
@@ -169,26 +232,416 @@ SENSOR_DESCRIPTIONS: tuple[AcondSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        data_key="dhw_temp_actual",
+        deadband_key=CONF_TEMPERATURE_DEADBAND,
         value_fn=lambda data: data.dhw_temp_actual,
     ),
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class AcondStatsSensorEntityDescription(SensorEntityDescription):
+    """Describes an opt-in sensor reporting connection statistics."""
+
+    entity_category: EntityCategory = EntityCategory.DIAGNOSTIC
+    entity_registry_enabled_default: bool = False
+    value_fn: Callable[[AcondStats], float | int | datetime | None]
+    attributes_fn: Callable[[AcondStats], dict[str, Any]] | None = None
+
+
+STATS_SENSOR_DESCRIPTIONS: tuple[AcondStatsSensorEntityDescription, ...] = (
+    AcondStatsSensorEntityDescription(
+        key="poll_latency",
+        translation_key="poll_latency",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda stats: stats.poll_latency.percentile(50),
+        attributes_fn=lambda stats: stats.poll_latency.as_dict(),
+    ),
+    AcondStatsSensorEntityDescription(
+        key="write_latency",
+        translation_key="write_latency",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda stats: stats.write_latency.percentile(50),
+        attributes_fn=lambda stats: stats.write_latency.as_dict(),
+    ),
+    AcondStatsSensorEntityDescription(
+        key="executor_wait",
+        translation_key="executor_wait",
+        icon="mdi:timer-sand",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda stats: stats.executor_wait.percentile(50),
+        attributes_fn=lambda stats: stats.executor_wait.as_dict(),
+    ),
+    AcondStatsSensorEntityDescription(
+        key="bytes_sent",
+        translation_key="bytes_sent",
+        icon="mdi:upload-network",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        value_fn=lambda stats: stats.bytes_sent,
+    ),
+    AcondStatsSensorEntityDescription(
+        key="bytes_received",
+        translation_key="bytes_received",
+        icon="mdi:download-network",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        value_fn=lambda stats: stats.bytes_received,
+    ),
+    AcondStatsSensorEntityDescription(
+        key="retries",
+        translation_key="retries",
+        icon="mdi:repeat",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.retries,
+    ),
+    AcondStatsSensorEntityDescription(
+        key="reconnects",
+        translation_key="reconnects",
+        icon="mdi:lan-pending",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.reconnects,
+    ),
+    AcondStatsSensorEntityDescription(
+        key="failed_polls",
+        translation_key="failed_polls",
+        icon="mdi:lan-disconnect",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.failed_polls,
+    ),
+    AcondStatsSensorEntityDescription(
+        key="last_successful_read",
+        translation_key="last_successful_read",
+        icon="mdi:clock-check-outline",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda stats: stats.last_success,
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class AcondAnalyticsSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor reporting compressor cycle or defrost statistics."""
+
+    value_fn: Callable[[CycleAnalytics], float | int | None]
+
+
+ANALYTICS_SENSOR_DESCRIPTIONS: tuple[AcondAnalyticsSensorEntityDescription, ...] = (
+    AcondAnalyticsSensorEntityDescription(
+        key="compressor_starts",
+        translation_key="compressor_starts",
+        icon="mdi:counter",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda analytics: analytics.compressor.count,
+    ),
+    AcondAnalyticsSensorEntityDescription(
+        key="compressor_starts_per_hour",
+        translation_key="compressor_starts_per_hour",
+        icon="mdi:repeat",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda analytics: analytics.starts_per_hour,
+    ),
+    AcondAnalyticsSensorEntityDescription(
+        key="compressor_run_time",
+        translation_key="compressor_run_time",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        suggested_display_precision=1,
+        value_fn=lambda analytics: round(analytics.compressor.on_time / 3600, 1),
+    ),
+    AcondAnalyticsSensorEntityDescription(
+        key="last_compressor_run",
+        translation_key="last_compressor_run",
+        icon="mdi:timer-play-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.MINUTES,
+        suggested_display_precision=0,
+        value_fn=lambda analytics: analytics.compressor.last_on,
+    ),
+    AcondAnalyticsSensorEntityDescription(
+        key="last_compressor_pause",
+        translation_key="last_compressor_pause",
+        icon="mdi:timer-pause-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.MINUTES,
+        suggested_display_precision=0,
+        value_fn=lambda analytics: analytics.compressor.last_off,
+    ),
+    AcondAnalyticsSensorEntityDescription(
+        key="defrosts",
+        translation_key="defrosts",
+        icon="mdi:snowflake-melt",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda analytics: analytics.defrost.count,
+    ),
+    AcondAnalyticsSensorEntityDescription(
+        key="last_defrost",
+        translation_key="last_defrost",
+        icon="mdi:snowflake-melt",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.MINUTES,
+        suggested_display_precision=1,
+        value_fn=lambda analytics: analytics.defrost.last_on,
+    ),
+)
+
+
+def _round(value: float | None, digits: int) -> float | None:
+    """Round an estimate that may be unknown."""
+    return None if value is None else round(value, digits)
+
+
+@dataclass(frozen=True, kw_only=True)
+class AcondPerformanceSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor reporting the estimated heat output, COP or metered energy."""
+
+    value_fn: Callable[[PerformanceEstimator], float | None]
+    pro_only: bool = False
+    """Needs the compressor power, which only PRO units report."""
+
+
+PERFORMANCE_SENSOR_DESCRIPTIONS: tuple[AcondPerformanceSensorEntityDescription, ...] = (
+    AcondPerformanceSensorEntityDescription(
+        key="thermal_power",
+        translation_key="thermal_power",
+        icon="mdi:radiator",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        value_fn=lambda performance: _round(performance.thermal_power, 0),
+    ),
+    AcondPerformanceSensorEntityDescription(
+        key="heat_energy",
+        translation_key="heat_energy",
+        icon="mdi:radiator",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=1,
+        value_fn=lambda performance: round(performance.heat.total, 2),
+    ),
+    AcondPerformanceSensorEntityDescription(
+        key="compressor_energy",
+        translation_key="compressor_energy",
+        icon="mdi:lightning-bolt",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=1,
+        pro_only=True,
+        value_fn=lambda performance: round(performance.electrical.total, 2),
+    ),
+    AcondPerformanceSensorEntityDescription(
+        key="cop",
+        translation_key="cop",
+        icon="mdi:gauge",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        pro_only=True,
+        value_fn=lambda performance: _round(performance.cop, 2),
+    ),
+    AcondPerformanceSensorEntityDescription(
+        key="rolling_cop",
+        translation_key="rolling_cop",
+        icon="mdi:gauge",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        pro_only=True,
+        value_fn=lambda performance: _round(performance.rolling_cop, 2),
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class AcondThermalModelSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor reporting a prediction of the building model."""
+
+    value_fn: Callable[[ThermalModel], float | None]
+
+
+THERMAL_MODEL_SENSOR_DESCRIPTIONS: tuple[
+    AcondThermalModelSensorEntityDescription, ...
+] = (
+    AcondThermalModelSensorEntityDescription(
+        key="predicted_indoor_temperature",
+        translation_key="predicted_indoor_temperature",
+        icon="mdi:home-thermometer-outline",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        suggested_display_precision=1,
+        value_fn=lambda model: _round(model.predicted_temperature, 1),
+    ),
+    AcondThermalModelSensorEntityDescription(
+        key="time_to_setpoint",
+        translation_key="time_to_setpoint",
+        icon="mdi:timer-sand",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.MINUTES,
+        suggested_display_precision=0,
+        value_fn=lambda model: _round(model.time_to_setpoint, 0),
+    ),
+)
+
+
+def _since(history: HistoryBuffer, window: float) -> float | None:
+    """Return the start of the last window seconds of history."""
+    if (last := history.last_timestamp) is None:
+        return None
+    return last - window
+
+
+@dataclass(frozen=True, kw_only=True)
+class AcondHistorySensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor computed from the in-memory poll history."""
+
+    value_fn: Callable[[HistoryBuffer], float | None]
+
+
+HISTORY_SENSOR_DESCRIPTIONS: tuple[AcondHistorySensorEntityDescription, ...] = (
+    AcondHistorySensorEntityDescription(
+        key="outdoor_temperature_trend",
+        translation_key="outdoor_temperature_trend",
+        icon="mdi:thermometer-chevron-up",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="°C/h",
+        suggested_display_precision=1,
+        value_fn=lambda history: _round(
+            history.rate("outdoor_temp_actual", _since(history, 3600)), 1
+        ),
+    ),
+    AcondHistorySensorEntityDescription(
+        key="outdoor_temperature_daily_mean",
+        translation_key="outdoor_temperature_daily_mean",
+        icon="mdi:thermometer-lines",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        suggested_display_precision=1,
+        value_fn=lambda history: _round(
+            history.mean("outdoor_temp_actual", _since(history, 86400)), 1
+        ),
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class AcondHubSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor aggregating all heat pump units."""
+
+    value_fn: Callable[[HubData], int]
+
+
+HUB_SENSOR_DESCRIPTIONS: tuple[AcondHubSensorEntityDescription, ...] = (
+    AcondHubSensorEntityDescription(
+        key="total_compressor_power",
+        translation_key="total_compressor_power",
+        icon="mdi:flash",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        value_fn=lambda data: data.total_compressor_power,
+    ),
+    AcondHubSensorEntityDescription(
+        key="units_running",
+        translation_key="units_running",
+        icon="mdi:heat-pump",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.units_running,
+    ),
+    AcondHubSensorEntityDescription(
+        key="units_online",
+        translation_key="units_online",
+        icon="mdi:lan-connect",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda data: data.units_online,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: AcondConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Acond sensor entities."""
+    if entry.data.get(CONF_HUB):
+        _async_setup_hub_entry(entry, async_add_entities)
+        return
+
     coordinator = entry.runtime_data
+    # Sensors for hardware the unit does not have are not created at all
+    pro = bool(coordinator.data.compressor_capacity_max)
     async_add_entities(
         AcondSensor(coordinator, entry.entry_id, description)
         for description in SENSOR_DESCRIPTIONS
+        if pro or not description.pro_only
+    )
+    async_add_entities(
+        AcondAnalyticsSensor(coordinator, entry.entry_id, description)
+        for description in ANALYTICS_SENSOR_DESCRIPTIONS
+    )
+    # The output can be estimated from the power or measured from the flow
+    flow = bool(entry.options.get(CONF_FLOW_RATE, DEFAULT_FLOW_RATE))
+    async_add_entities(
+        AcondPerformanceSensor(coordinator, entry.entry_id, description)
+        for description in PERFORMANCE_SENSOR_DESCRIPTIONS
+        if pro or (flow and not description.pro_only)
+    )
+    async_add_entities(
+        AcondThermalModelSensor(coordinator, entry.entry_id, description)
+        for description in THERMAL_MODEL_SENSOR_DESCRIPTIONS
+    )
+    async_add_entities(
+        AcondHistorySensor(coordinator, entry.entry_id, description)
+        for description in HISTORY_SENSOR_DESCRIPTIONS
+    )
+    async_add_entities(
+        AcondStatsSensor(coordinator, entry.entry_id, description)
+        for description in STATS_SENSOR_DESCRIPTIONS
+    )
+
+
+@callback
+def _async_setup_hub_entry(
+    entry: AcondHubConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up the aggregate sensors of the hub entry."""
+    hub = entry.runtime_data
+    async_add_entities(
+        AcondHubSensor(hub, entry.entry_id, description)
+        for description in HUB_SENSOR_DESCRIPTIONS
     )
 
 
 class AcondSensor(AcondEntity, SensorEntity):
-    """Representation of an Acond sensor."""
+    """Representation of an Acond sensor.
+
+    Sensors with a deadband only publish changes that leave it, no more often
+    than the min publish interval; while the reading keeps moving inside the
+    deadband, the current value is still published every max publish interval.
+    """
 
     entity_description: AcondSensorEntityDescription
 
@@ -202,8 +655,301 @@ class AcondSensor(AcondEntity, SensorEntity):
         super().__init__(coordinator, entry_id)
         self.entity_description = description
         self._attr_unique_id = f"{entry_id}_sensor_{description.key}"
+        self._data_keys = frozenset({description.data_key})
+        options = coordinator.config_entry.options
+        self._deadband: float | None = None
+        if (key := description.deadband_key) is not None:
+            self._deadband = options.get(key, DEADBAND_DEFAULTS[key])
+        self._min_interval = options.get(
+            CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL
+        )
+        self._max_interval = options.get(
+            CONF_MAX_PUBLISH_INTERVAL, DEFAULT_MAX_PUBLISH_INTERVAL
+        )
+        self._published_value = self._current_value()
+        self._published_available = coordinator.last_update_success
+        self._published_at = time.monotonic()
+        self._unsub_deferred: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Aggregate the statistics of measured values from every poll."""
+        await super().async_added_to_hass()
+        statistics = self.coordinator.statistics
+        if statistics is not None and self.entity_description.deadband_key:
+            self.async_on_remove(
+                statistics.async_track(
+                    self.unique_id,
+                    self.entity_description.value_fn,
+                    unit=self.entity_description.native_unit_of_measurement,
+                )
+            )
+
+    def _current_value(self) -> float | int | None:
+        """Return the value in the latest coordinator data."""
+        if self.coordinator.data is None:
+            return None
+        return self.entity_description.value_fn(self.coordinator.data)
 
     @property
     def native_value(self) -> float | int | None:
         """Return the sensor value."""
+        if self._deadband is None:
+            return self._current_value()
+        return self._published_value
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Publish the new value if it leaves the deadband."""
+        if self._deadband is None:
+            super()._handle_coordinator_update()
+            return
+        value = self._current_value()
+        if self.available != self._published_available or self._publish_due(value):
+            self._publish(value)
+
+    def _publish_due(self, value: float | None) -> bool:
+        """Return True if value should be published now."""
+        if value == self._published_value:
+            return False
+        elapsed = time.monotonic() - self._published_at
+        if self._max_interval and elapsed >= self._max_interval:
+            return True
+        if not self._outside_deadband(value):
+            return False
+        if elapsed < self._min_interval:
+            if self._unsub_deferred is None:
+                self._unsub_deferred = async_call_later(
+                    self.hass, self._min_interval - elapsed, self._async_deferred
+                )
+            return False
+        return True
+
+    def _outside_deadband(self, value: float | None) -> bool:
+        """Return True if value differs from the published one by the deadband."""
+        published = self._published_value
+        if value is None or published is None:
+            return value is not published
+        deadband = self._deadband or 0.0
+        if self.entity_description.relative_deadband:
+            deadband *= abs(published) / 100
+        return abs(value - published) >= deadband and value != published
+
+    @callback
+    def _async_deferred(self, _now: datetime) -> None:
+        """Publish a change held back by the min publish interval."""
+        self._unsub_deferred = None
+        if self._outside_deadband(value := self._current_value()):
+            self._publish(value)
+
+    @callback
+    def _publish(self, value: float | None) -> None:
+        """Write value as the new state."""
+        if self._unsub_deferred is not None:
+            self._unsub_deferred()
+            self._unsub_deferred = None
+        self._published_value = value
+        self._published_available = self.available
+        self._published_at = time.monotonic()
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending deferred publish."""
+        if self._unsub_deferred is not None:
+            self._unsub_deferred()
+            self._unsub_deferred = None
+        await super().async_will_remove_from_hass()
+
+
+class AcondStatsSensor(AcondEntity, SensorEntity):
+    """Sensor reporting connection statistics; updated on every poll."""
+
+    entity_description: AcondStatsSensorEntityDescription
+    _unrecorded_attributes = frozenset({MATCH_ALL})
+
+    def __init__(
+        self,
+        coordinator: AcondCoordinator,
+        entry_id: str,
+        description: AcondStatsSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry_id)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry_id}_sensor_{description.key}"
+        self._publish_interval = coordinator.config_entry.options.get(
+            CONF_DIAGNOSTIC_PUBLISH_INTERVAL, DEFAULT_DIAGNOSTIC_PUBLISH_INTERVAL
+        )
+        self._published_at = float("-inf")
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state at most every diagnostic publish interval."""
+        now = time.monotonic()
+        if now - self._published_at < self._publish_interval:
+            return
+        self._published_at = now
+        super()._handle_coordinator_update()
+
+    @property
+    def available(self) -> bool:
+        """Statistics stay available while the heat pump is unreachable."""
+        return True
+
+    @property
+    def native_value(self) -> float | int | datetime | None:
+        """Return the statistic."""
+        return self.entity_description.value_fn(self.coordinator.stats)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the latency histogram, if any."""
+        if (attributes_fn := self.entity_description.attributes_fn) is None:
+            return None
+        return attributes_fn(self.coordinator.stats)
+
+
+class AcondAnalyticsSensor(AcondDerivedEntity, SensorEntity):
+    """Sensor reporting compressor cycle or defrost statistics."""
+
+    entity_description: AcondAnalyticsSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: AcondCoordinator,
+        entry_id: str,
+        description: AcondAnalyticsSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry_id)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry_id}_sensor_{description.key}"
+
+    def _compute_value(self) -> float | int | None:
+        """Return the statistic."""
+        return self.entity_description.value_fn(self.coordinator.analytics)
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the statistic."""
+        return self._value
+
+
+class AcondPerformanceSensor(AcondDerivedEntity, SensorEntity):
+    """Sensor reporting the estimated heat output, COP or metered energy."""
+
+    entity_description: AcondPerformanceSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: AcondCoordinator,
+        entry_id: str,
+        description: AcondPerformanceSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry_id)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry_id}_sensor_{description.key}"
+        # Energy totals are left to the recorder, which compiles their sums
+        self._local_statistics = (
+            coordinator.statistics is not None
+            and description.state_class == SensorStateClass.MEASUREMENT
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Aggregate the statistics of the estimate from every poll."""
+        await super().async_added_to_hass()
+        statistics = self.coordinator.statistics
+        if not self._local_statistics or statistics is None:
+            return
+        description = self.entity_description
+        performance = self.coordinator.performance
+        self.async_on_remove(
+            statistics.async_track(
+                self.unique_id,
+                lambda _data: description.value_fn(performance),
+                unit=description.native_unit_of_measurement,
+            )
+        )
+
+    def _compute_value(self) -> float | None:
+        """Return the estimate."""
+        return self.entity_description.value_fn(self.coordinator.performance)
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the estimate."""
+        return self._value
+
+
+class AcondThermalModelSensor(AcondDerivedEntity, SensorEntity):
+    """Sensor reporting a prediction of the building model."""
+
+    entity_description: AcondThermalModelSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: AcondCoordinator,
+        entry_id: str,
+        description: AcondThermalModelSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry_id)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry_id}_sensor_{description.key}"
+
+    def _compute_value(self) -> float | None:
+        """Return the prediction."""
+        return self.entity_description.value_fn(self.coordinator.thermal_model)
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the prediction."""
+        return self._value
+
+
+class AcondHistorySensor(AcondDerivedEntity, SensorEntity):
+    """Sensor computed from the in-memory poll history."""
+
+    entity_description: AcondHistorySensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: AcondCoordinator,
+        entry_id: str,
+        description: AcondHistorySensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry_id)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry_id}_sensor_{description.key}"
+
+    def _compute_value(self) -> float | None:
+        """Return the value computed from the history."""
+        return self.entity_description.value_fn(self.coordinator.history)
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the value computed from the history."""
+        return self._value
+
+
+class AcondHubSensor(AcondHubEntity, SensorEntity):
+    """Sensor aggregating all heat pump units."""
+
+    entity_description: AcondHubSensorEntityDescription
+
+    def __init__(
+        self,
+        hub: AcondHub,
+        entry_id: str,
+        description: AcondHubSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(hub, entry_id)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry_id}_sensor_{description.key}"
+
+    @property
+    def native_value(self) -> int:
+        """Return the aggregated value."""
         return self.entity_description.value_fn(self.coordinator.data)
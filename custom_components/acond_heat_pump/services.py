@@ -0,0 +1,158 @@
+"""Services of the Acond Heat Pump integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.const import ATTR_TEMPERATURE, WEEKDAYS
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.entity_platform import async_get_platforms
+from homeassistant.helpers.importlib import async_import_module
+from homeassistant.helpers.service import async_extract_entity_ids
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .scheduler import ATTR_DAYS, ATTR_TIME
+
+if TYPE_CHECKING:
+    from .entity import AcondSetpointEntity
+
+SERVICE_SET_SCHEDULE = "set_schedule"
+SERVICE_CLEAR_SCHEDULE = "clear_schedule"
+SERVICE_OPTIMIZE_SETPOINT = "optimize_setpoint"
+ATTR_PROGRAM = "program"
+ATTR_PRICES = "prices"
+ATTR_INTERVAL = "interval"
+ATTR_MIN_TEMPERATURE = "min_temperature"
+ATTR_MAX_TEMPERATURE = "max_temperature"
+ATTR_POWER = "power"
+ATTR_THERMAL_CAPACITY = "thermal_capacity"
+ATTR_HEAT_LOSS = "heat_loss"
+
+# Price intervals of the spot markets [min], and at most two days of them
+PRICE_INTERVALS = [15, 30, 60]
+MAX_PRICES = 192
+
+SET_SCHEDULE_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_PROGRAM): vol.All(
+            cv.ensure_list,
+            vol.Length(min=1),
+            [
+                vol.Schema(
+                    {
+                        vol.Optional(ATTR_DAYS, default=WEEKDAYS): vol.All(
+                            cv.ensure_list, [vol.In(WEEKDAYS)]
+                        ),
+                        vol.Required(ATTR_TIME): cv.time,
+                        vol.Required(ATTR_TEMPERATURE): vol.Coerce(float),
+                    }
+                )
+            ],
+        )
+    }
+)
+CLEAR_SCHEDULE_SCHEMA = cv.make_entity_service_schema({})
+OPTIMIZE_SETPOINT_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_PRICES): vol.All(
+            cv.ensure_list, vol.Length(min=1, max=MAX_PRICES), [vol.Coerce(float)]
+        ),
+        vol.Optional(ATTR_INTERVAL, default=60): vol.All(
+            vol.Coerce(int), vol.In(PRICE_INTERVALS)
+        ),
+        vol.Required(ATTR_MIN_TEMPERATURE): vol.Coerce(float),
+        vol.Required(ATTR_MAX_TEMPERATURE): vol.Coerce(float),
+        vol.Optional(ATTR_POWER): cv.positive_float,
+        vol.Optional(ATTR_THERMAL_CAPACITY): vol.All(
+            vol.Coerce(float), vol.Range(min=0, min_included=False)
+        ),
+        vol.Optional(ATTR_HEAT_LOSS): cv.positive_float,
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the schedule and optimization services.
+
+    They target climate and number entities alike, so they are registered
+    for the integration rather than as entity services of one platform.
+    """
+
+    async def _async_set_schedule(call: ServiceCall) -> None:
+        for entity in await _async_setpoint_entities(call):
+            await entity.async_set_schedule(call.data[ATTR_PROGRAM])
+
+    async def _async_clear_schedule(call: ServiceCall) -> None:
+        for entity in await _async_setpoint_entities(call):
+            await entity.async_clear_schedule()
+
+    async def _async_optimize_setpoint(call: ServiceCall) -> ServiceResponse:
+        response: dict[str, Any] = {}
+        for entity in await _async_setpoint_entities(call):
+            plan = await entity.async_optimize_setpoint(
+                call.data[ATTR_PRICES],
+                interval=call.data[ATTR_INTERVAL] * 60,
+                minimum=call.data[ATTR_MIN_TEMPERATURE],
+                maximum=call.data[ATTR_MAX_TEMPERATURE],
+                power=call.data.get(ATTR_POWER),
+                thermal_capacity=call.data.get(ATTR_THERMAL_CAPACITY),
+                heat_loss=call.data.get(ATTR_HEAT_LOSS),
+            )
+            response[entity.entity_id] = {
+                "setpoints": [
+                    {
+                        "start": dt_util.as_local(
+                            dt_util.utc_from_timestamp(start)
+                        ).isoformat(),
+                        ATTR_TEMPERATURE: temperature,
+                    }
+                    for start, temperature in plan[:-1]
+                ]
+            }
+        return response
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_SCHEDULE, _async_set_schedule, SET_SCHEDULE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_CLEAR_SCHEDULE, _async_clear_schedule, CLEAR_SCHEDULE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_OPTIMIZE_SETPOINT,
+        _async_optimize_setpoint,
+        OPTIMIZE_SETPOINT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+async def _async_setpoint_entities(call: ServiceCall) -> list[AcondSetpointEntity]:
+    """Return the targeted setpoint entities."""
+    hass = call.hass
+    entity_ids = await async_extract_entity_ids(hass, call)
+    # Loaded with the platforms already; only looked up here
+    entity_module = await async_import_module(hass, f"{__package__}.entity")
+    entities = [
+        entity
+        for platform in async_get_platforms(hass, DOMAIN)
+        for entity_id, entity in platform.entities.items()
+        if entity_id in entity_ids
+    ]
+    if not entities or not all(
+        isinstance(entity, entity_module.AcondSetpointEntity) for entity in entities
+    ):
+        raise ServiceValidationError(
+            "Only Acond climate and setpoint number entities can be targeted"
+        )
+    return entities
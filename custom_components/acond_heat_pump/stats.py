@@ -0,0 +1,72 @@
+"""Runtime statistics for the Acond Heat Pump integration."""
+
+from __future__ import annotations
+
+import statistics
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+# Upper bounds of the latency histogram buckets [ms]; the last bucket is open
+HISTOGRAM_BOUNDS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Recent samples kept for percentiles
+RECENT_SAMPLES = 100
+
+
+class LatencyHistogram:
+    """Latency samples: cumulative bucket counts and a window of recent ones."""
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.recent: deque[float] = deque(maxlen=RECENT_SAMPLES)
+
+    def record(self, seconds: float) -> None:
+        """Add a sample."""
+        ms = seconds * 1000
+        self.buckets[bisect_left(HISTOGRAM_BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        self.recent.append(ms)
+
+    def percentile(self, percent: int) -> float | None:
+        """Return a percentile of the recent samples in ms."""
+        if not self.recent:
+            return None
+        if len(self.recent) == 1:
+            return self.recent[0]
+        cuts = statistics.quantiles(self.recent, n=100, method="inclusive")
+        return round(cuts[percent - 1], 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary suitable for state attributes."""
+        labels = [f"le_{bound}ms" for bound in HISTOGRAM_BOUNDS_MS] + ["inf"]
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 1) if self.count else None,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "buckets": dict(zip(labels, self.buckets, strict=True)),
+        }
+
+
+@dataclass
+class AcondStats:
+    """Counters and timings of one heat pump connection."""
+
+    poll_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    write_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    executor_wait: LatencyHistogram = field(default_factory=LatencyHistogram)
+    """Time blocking calls wait for an executor thread (executor transport)."""
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    retries: int = 0
+    reconnects: int = 0
+    failed_polls: int = 0
+    last_success: datetime | None = None
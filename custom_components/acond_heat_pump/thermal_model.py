@@ -0,0 +1,197 @@
+"""Online thermal model of the building for the Acond Heat Pump integration."""
+
+from __future__ import annotations
+
+import logging
+import math
+from typing import Any
+
+from acond_heat_pump import HeatPumpResponse
+
+from .analytics import MAX_GAP
+
+_LOGGER = logging.getLogger(__name__)
+
+# The inputs are integrated over this long for one model update; the indoor
+# temperature, read in tenths of a degree, hardly moves between polls [s]
+MODEL_INTERVAL = 900
+
+# Weight kept by past updates at each new one: about ten days of memory
+FORGETTING = 0.999
+
+# Initial covariance of the parameters, and the largest total to which
+# forgetting lets it grow back while the inputs don't vary
+INITIAL_COVARIANCE = 1.0
+MAX_COVARIANCE = 3 * INITIAL_COVARIANCE
+
+# Updates before the model is trusted for predictions: one day
+MIN_UPDATES = 96
+
+# Horizon of the predicted indoor temperature [h]
+PREDICTION_HORIZON = 1.0
+
+# Setpoints further away in time are reported as not reached [h]
+MAX_TIME_TO_SETPOINT = 48.0
+
+# The setpoint counts as reached within this [K]
+SETPOINT_TOLERANCE = 0.1
+
+
+class ThermalModel:
+    """First-order (RC) model of the building, fitted by recursive least squares.
+
+    The indoor temperature T of circuit I follows
+
+        dT/dt = a (T_outdoor - T) + b (T_water - T) + c P  [K/h]
+
+    with the return water temperature T_water counting while the circuit I
+    pump runs, and the compressor power P [kW]. The inputs are integrated at
+    every poll and a, b and c updated once per MODEL_INTERVAL from the change
+    of T over it, in O(1) and without keeping any history. Predictions hold
+    the current inputs constant.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an untrained model."""
+        self.parameters = [0.0, 0.0, 0.0]
+        """a, b [1/h] and c [K/kWh]."""
+        self.covariance = [
+            [INITIAL_COVARIANCE if row == column else 0.0 for column in range(3)]
+            for row in range(3)
+        ]
+        self.updates = 0
+        """Model updates so far."""
+        self.predicted_temperature: float | None = None
+        """Indoor temperature PREDICTION_HORIZON ahead [°C]."""
+        self.time_to_setpoint: float | None = None
+        """Time until the indoor temperature reaches its setpoint [s]."""
+        self._sample: tuple[float, tuple[float, float, float]] | None = None
+        """Time and input terms of the last poll."""
+        self._start: tuple[float, float] | None = None
+        """Time and indoor temperature at the start of the interval."""
+        self._integrals = [0.0, 0.0, 0.0]
+        """Input terms integrated over the interval [K·h, K·h, kWh]."""
+
+    @property
+    def trained(self) -> bool:
+        """Return True once the model is trusted for predictions."""
+        return self.updates >= MIN_UPDATES
+
+    def update(self, timestamp: float, data: HeatPumpResponse) -> None:
+        """Fold in a successful poll."""
+        indoor = data.indoor1_temp_actual
+        outdoor = data.outdoor_temp_actual
+        water = data.water_back_temp_actual
+        if indoor is None or outdoor is None or water is None:
+            self._sample = self._start = None
+            self.predicted_temperature = self.time_to_setpoint = None
+            return
+        terms = (
+            outdoor - indoor,
+            water - indoor if data.status.pump_circuit1 else 0.0,
+            (data.compressor_capacity_actual or 0) / 1000,
+        )
+        previous, self._sample = self._sample, (timestamp, terms)
+        start = self._start
+        if (
+            previous is None
+            or start is None
+            or not 0 < timestamp - previous[0] <= MAX_GAP
+        ):
+            self._restart(timestamp, indoor)
+        else:
+            hours = (timestamp - previous[0]) / 3600
+            for index, term in enumerate(previous[1]):
+                self._integrals[index] += term * hours
+            if timestamp - start[0] >= MODEL_INTERVAL:
+                self._fit(self._integrals, indoor - start[1])
+                self._restart(timestamp, indoor)
+        self._predict(indoor, terms, data.indoor1_temp_set)
+
+    def _restart(self, timestamp: float, indoor: float) -> None:
+        """Start a new integration interval."""
+        self._start = (timestamp, indoor)
+        self._integrals = [0.0, 0.0, 0.0]
+
+    def _fit(self, inputs: list[float], change: float) -> None:
+        """Update the parameters with one interval (recursive least squares)."""
+        parameters, covariance = self.parameters, self.covariance
+        weighted = [
+            sum(row[column] * inputs[column] for column in range(3))
+            for row in covariance
+        ]
+        gain_denominator = FORGETTING + sum(
+            value * weight for value, weight in zip(inputs, weighted, strict=True)
+        )
+        gain = [weight / gain_denominator for weight in weighted]
+        error = change - sum(
+            parameter * value
+            for parameter, value in zip(parameters, inputs, strict=True)
+        )
+        # Without forgetting while the covariance is large, so that it doesn't
+        # wind up while the inputs carry no information
+        trace = sum(covariance[index][index] for index in range(3))
+        forgetting = FORGETTING if trace < MAX_COVARIANCE else 1.0
+        for row in range(3):
+            parameters[row] += gain[row] * error
+            for column in range(3):
+                covariance[row][column] = (
+                    covariance[row][column] - gain[row] * weighted[column]
+                ) / forgetting
+        self.updates += 1
+
+    def _predict(
+        self,
+        indoor: float,
+        terms: tuple[float, float, float],
+        setpoint: float | None,
+    ) -> None:
+        """Predict the indoor temperature with the current inputs held."""
+        outdoor_term, water_term, power = terms
+        a, b, c = self.parameters
+        # Relaxation rate towards the steady state [1/h]; the water only
+        # couples while the pump runs
+        rate = a + (b if water_term else 0.0)
+        if not self.trained or rate <= 0:
+            self.predicted_temperature = self.time_to_setpoint = None
+            return
+        drift = a * outdoor_term + b * water_term + c * power
+        steady = indoor + drift / rate
+        self.predicted_temperature = steady + (indoor - steady) * math.exp(
+            -rate * PREDICTION_HORIZON
+        )
+        self.time_to_setpoint = None
+        if setpoint is None:
+            return
+        if abs(setpoint - indoor) <= SETPOINT_TOLERANCE:
+            self.time_to_setpoint = 0.0
+        elif (setpoint - indoor) * (steady - setpoint) > 0:
+            hours = math.log((indoor - steady) / (setpoint - steady)) / rate
+            if hours <= MAX_TIME_TO_SETPOINT:
+                self.time_to_setpoint = hours * 3600
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state to persist."""
+        return {
+            "parameters": self.parameters,
+            "covariance": self.covariance,
+            "updates": self.updates,
+        }
+
+    def restore(self, stored: dict[str, Any]) -> None:
+        """Restore a persisted state, ignoring it if malformed."""
+        try:
+            parameters = [float(value) for value in stored["parameters"]]
+            covariance = [
+                [float(value) for value in row] for row in stored["covariance"]
+            ]
+            updates = int(stored["updates"])
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.debug("Ignoring invalid thermal model %s", stored)
+            return
+        if len(parameters) != 3 or [len(row) for row in covariance] != [3, 3, 3]:
+            _LOGGER.debug("Ignoring invalid thermal model %s", stored)
+            return
+        self.parameters = parameters
+        self.covariance = covariance
+        self.updates = updates
@@ -0,0 +1,182 @@
+"""Raw Modbus traffic recording and replay for the Acond Heat Pump integration.
+
+A traffic log starts with MAGIC, followed by one record per exchange: a
+RECORD header, the request frame and the response frame, both with their MBAP
+header. A failed exchange has an empty response. A record cut short by a
+crash ends the log.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import mmap
+import struct
+import time
+from bisect import bisect_right
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant, callback
+
+from .client import READ_HOLDING_REGISTERS, READ_INPUT_REGISTERS
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"ACONDTR\x01"
+
+# Time of the exchange [s since the epoch], request and response frame lengths
+RECORD = struct.Struct("<dHH")
+
+# Length of the MBAP header before the PDU of a Modbus TCP frame
+MBAP_HEADER_SIZE = 7
+
+
+class TrafficRecorder:
+    """Append raw request and response frames to a traffic log.
+
+    Records are buffered on the event loop and appended to the file in the
+    executor, with at most one write in flight.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize a recorder appending to path."""
+        self.hass = hass
+        self.path = Path(path)
+        self._buffer = bytearray()
+        self._flush_task: asyncio.Task[None] | None = None
+        self._failed = False
+
+    @callback
+    def record(self, request: bytes, response: bytes) -> None:
+        """Record an exchange; an empty response records a failed one."""
+        self._buffer += RECORD.pack(time.time(), len(request), len(response))
+        self._buffer += request
+        self._buffer += response
+        if self._flush_task is None:
+            # Tracked, so that shutdown waits for the last records
+            self._flush_task = self.hass.async_create_task(
+                self._async_flush(), f"acond_heat_pump traffic log {self.path.name}"
+            )
+
+    async def _async_flush(self) -> None:
+        """Append the buffered records until none are left."""
+        try:
+            while self._buffer:
+                data, self._buffer = bytes(self._buffer), bytearray()
+                await self.hass.async_add_executor_job(self._write, data)
+        finally:
+            self._flush_task = None
+
+    def _write(self, data: bytes) -> None:
+        """Append records to the file (runs in executor)."""
+        try:
+            with self.path.open("ab") as file:
+                if not file.tell():
+                    file.write(MAGIC)
+                file.write(data)
+        except OSError as err:
+            if not self._failed:
+                _LOGGER.error("Error writing traffic log %s: %s", self.path, err)
+            self._failed = True
+        else:
+            self._failed = False
+
+    async def async_close(self) -> None:
+        """Write the records still buffered."""
+        if self._flush_task is not None:
+            await self._flush_task
+
+
+class TrafficReplay:
+    """A traffic log memory-mapped for replay.
+
+    Every request is answered with a response recorded for the same request
+    PDU. With speed 0, the responses to each request are served in recorded
+    order, one per request, as fast as they are asked for. Otherwise the
+    response recorded last before the replay clock is served; the clock runs
+    speed times as fast as real time from the first record.
+
+    Opening reads the record headers once to index them; frames are only
+    read from the mapping when served. Blocking: open it in the executor.
+    """
+
+    def __init__(self, path: str, speed: float = 0.0) -> None:
+        """Open and index a traffic log."""
+        self.path = path
+        self.speed = speed
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[: len(MAGIC)] != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a traffic log")
+        self._index: dict[bytes, tuple[list[float], list[tuple[int, int]]]] = {}
+        """Request PDU -> times of its records and offsets of their responses."""
+        self.records = 0
+        self.first: float | None = None
+        self.last: float | None = None
+        offset, size = len(MAGIC), len(self._map)
+        while offset + RECORD.size <= size:
+            timestamp, request_length, response_length = RECORD.unpack_from(
+                self._map, offset
+            )
+            request = offset + RECORD.size
+            response = request + request_length
+            if (end := response + response_length) > size:
+                break
+            timestamps, responses = self._index.setdefault(
+                self._map[request + MBAP_HEADER_SIZE : response], ([], [])
+            )
+            timestamps.append(timestamp)
+            responses.append((response, response_length))
+            if self.first is None:
+                self.first = timestamp
+            self.last = timestamp
+            self.records += 1
+            offset = end
+        self.served = 0
+        """Responses served so far."""
+        self._cursors: dict[bytes, int] = {}
+        self._started = time.monotonic()
+
+    @property
+    def finished(self) -> bool:
+        """Return True once every recorded read has been replayed.
+
+        Recorded writes don't count: what is written depends on the replay.
+        """
+        if self.speed:
+            return self.clock >= (self.last or 0.0)
+        return all(
+            self._cursors.get(request, 0) >= len(timestamps)
+            for request, (timestamps, _) in self._index.items()
+            if request[0] in (READ_HOLDING_REGISTERS, READ_INPUT_REGISTERS)
+        )
+
+    @property
+    def clock(self) -> float:
+        """Return the time of the log being replayed now."""
+        return (self.first or 0.0) + (time.monotonic() - self._started) * self.speed
+
+    def response(self, request: bytes) -> bytes | None:
+        """Return the response frame to a request PDU.
+
+        An empty frame replays a failed exchange; None means there is no
+        response (left) to replay.
+        """
+        if (entry := self._index.get(request)) is None:
+            return None
+        timestamps, responses = entry
+        if self.speed:
+            index = max(bisect_right(timestamps, self.clock) - 1, 0)
+        else:
+            index = self._cursors.get(request, 0)
+            if index >= len(timestamps):
+                return None
+            self._cursors[request] = index + 1
+        self.served += 1
+        start, length = responses[index]
+        return self._map[start : start + length]
+
+    def close(self) -> None:
+        """Release the mapping."""
+        self._map.close()
@@ -0,0 +1 @@
+"""Development tools for the Acond Heat Pump integration."""
@@ -0,0 +1,289 @@
+"""Latency benchmark for the Acond Heat Pump transports.
+
+Starts the local simulator (or targets --host/--port) and reports:
+
+- poll latency percentiles for a full register block read,
+- poll latency when every register group is requested separately, which the
+  asyncio transport pipelines with --max-in-flight > 1,
+- write-to-state-visible latency (setpoint write until a read reflects it),
+- reconnect recovery time after the controller drops every connection.
+
+Both the asyncio transport and the blocking executor fallback are measured.
+Requires the Home Assistant development environment; run from the
+repository root:
+
+    python -m tools.benchmark --iterations 200 --latency 0.005 --jitter 0.002
+
+The simulator's latency is link delay, so pipelined requests overlap in
+flight the way they do over a slow VPN.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from acond_heat_pump import AcondHeatPump
+
+from custom_components.acond_heat_pump.client import (
+    DEVICE_ID,
+    REGISTER_GROUPS,
+    AcondAsyncClient,
+)
+
+from .simulator import HeatPumpSimulator
+
+_LOGGER = logging.getLogger(__name__)
+
+WRITE_VALUES = (34.0, 34.5, 35.0, 35.5)
+GROUP_SPANS = [(group.start, group.count) for group in REGISTER_GROUPS]
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Return latency percentiles in milliseconds."""
+    if not samples:
+        return {}
+    ms = sorted(sample * 1000 for sample in samples)
+    cuts = (
+        statistics.quantiles(ms, n=100, method="inclusive") if len(ms) > 1 else ms * 99
+    )
+    return {
+        "n": len(ms),
+        "mean": statistics.fmean(ms),
+        "p50": cuts[49],
+        "p90": cuts[89],
+        "p99": cuts[98],
+        "max": ms[-1],
+    }
+
+
+class BlockingTransport:
+    """Blocking AcondHeatPump driven through a thread pool, like the fallback."""
+
+    def __init__(self, host: str, port: int, executor: ThreadPoolExecutor) -> None:
+        """Initialize the transport."""
+        self.host = host
+        self.port = port
+        self._executor = executor
+        self._client = AcondHeatPump(host, port)
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking call in the thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, func, *args
+        )
+
+    async def connect(self) -> bool:
+        """Connect to the heat pump."""
+        return await self._run(self._client.connect)
+
+    async def close(self) -> None:
+        """Close the connection."""
+        await self._run(self._client.close)
+
+    async def read_data(self) -> Any:
+        """Read the register block."""
+        return await self._run(self._client.read_data)
+
+    def _read_input_spans(self, spans: list[tuple[int, int]]) -> list[list[int]]:
+        """Read spans one after another (runs in the thread pool)."""
+        return [
+            self._client.client.read_input_registers(
+                start, count=count, device_id=DEVICE_ID
+            ).registers
+            for start, count in spans
+        ]
+
+    async def read_input_spans(self, spans: list[tuple[int, int]]) -> Any:
+        """Read several spans in one thread pool job."""
+        return await self._run(self._read_input_spans, spans)
+
+    async def set_water_back_temperature(self, temperature: float) -> None:
+        """Write the return water setpoint."""
+        await self._run(self._client.set_water_back_temperature, temperature)
+
+    def reset(self) -> None:
+        """Replace the client, as the coordinator does on reconnect."""
+        self._client = AcondHeatPump(self.host, self.port)
+
+
+async def read_with_reconnect(transport: Any) -> Any:
+    """Read data, reconnecting once on failure (the coordinator strategy)."""
+    try:
+        return await transport.read_data()
+    except Exception:
+        await transport.close()
+        if isinstance(transport, BlockingTransport):
+            transport.reset()
+        if not await transport.connect():
+            raise
+        return await transport.read_data()
+
+
+async def bench_polls(transport: Any, iterations: int) -> list[float]:
+    """Time full register block reads."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await transport.read_data()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def bench_group_polls(transport: Any, iterations: int) -> list[float]:
+    """Time reads issuing one request per register group."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await transport.read_input_spans(GROUP_SPANS)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def bench_writes(transport: Any, iterations: int) -> list[float]:
+    """Time a setpoint write until a subsequent read reflects it."""
+    samples = []
+    for index in range(iterations):
+        value = WRITE_VALUES[index % len(WRITE_VALUES)]
+        start = time.perf_counter()
+        await transport.set_water_back_temperature(value)
+        while (await transport.read_data()).water_back_temp_set != value:
+            pass
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def bench_reconnects(
+    transport: Any, simulator: HeatPumpSimulator | None, iterations: int
+) -> list[float]:
+    """Time recovery after the controller drops every connection."""
+    if simulator is None:
+        return []
+    samples = []
+    for _ in range(iterations):
+        await transport.read_data()
+        simulator.drop_connections()
+        start = time.perf_counter()
+        while True:
+            try:
+                await read_with_reconnect(transport)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug("Still reconnecting: %r", err)
+                continue
+            break
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def run_suite(
+    name: str,
+    transport: Any,
+    simulator: HeatPumpSimulator | None,
+    args: argparse.Namespace,
+) -> dict[str, dict[str, float]]:
+    """Run all measurements against one transport."""
+    if not await transport.connect():
+        raise SystemExit(f"{name}: cannot connect")
+    try:
+        return {
+            "poll": summarize(await bench_polls(transport, args.iterations)),
+            "poll_groups": summarize(
+                await bench_group_polls(transport, args.iterations)
+            ),
+            "write_visible": summarize(
+                await bench_writes(transport, max(args.iterations // 4, 1))
+                if simulator is not None or args.allow_writes
+                else []
+            ),
+            "reconnect": summarize(
+                await bench_reconnects(
+                    transport, simulator, max(args.iterations // 10, 1)
+                )
+            ),
+        }
+    finally:
+        await transport.close()
+
+
+def print_report(results: dict[str, dict[str, dict[str, float]]]) -> None:
+    """Print a human readable table."""
+    print(
+        f"{'transport':<10} {'metric':<14} {'n':>5} {'mean':>9} {'p50':>9} "
+        f"{'p90':>9} {'p99':>9} {'max':>9}  (ms)"
+    )
+    for transport, metrics in results.items():
+        for metric, stats in metrics.items():
+            if not stats:
+                continue
+            print(
+                f"{transport:<10} {metric:<14} {stats['n']:>5} {stats['mean']:>9.2f} "
+                f"{stats['p50']:>9.2f} {stats['p90']:>9.2f} {stats['p99']:>9.2f} "
+                f"{stats['max']:>9.2f}"
+            )
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    simulator = None
+    host, port = args.host, args.port
+    if host is None:
+        simulator = HeatPumpSimulator(
+            latency=args.latency, jitter=args.jitter, seed=args.seed
+        )
+        await simulator.start()
+        host, port = simulator.host, simulator.port
+
+    executor = ThreadPoolExecutor(max_workers=args.executor_workers)
+    transports: dict[str, Any] = {
+        "asyncio": AcondAsyncClient(host, port, max_in_flight=args.max_in_flight),
+        "executor": BlockingTransport(host, port, executor),
+    }
+    results = {}
+    try:
+        for name, transport in transports.items():
+            results[name] = await run_suite(name, transport, simulator, args)
+    finally:
+        executor.shutdown(wait=False)
+        if simulator is not None:
+            await simulator.stop()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results)
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", help="benchmark a real unit instead")
+    parser.add_argument("--port", type=int, default=502)
+    parser.add_argument(
+        "--allow-writes",
+        action="store_true",
+        help="also benchmark setpoint writes against a real unit",
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--executor-workers", type=int, default=1)
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=len(GROUP_SPANS),
+        help="pipeline depth of the asyncio transport",
+    )
+    parser.add_argument("--json", action="store_true")
+    asyncio.run(_async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
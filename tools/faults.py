@@ -0,0 +1,404 @@
+"""Fault-injection harness for the Acond Heat Pump connection handling.
+
+Runs the integration against the local simulator through a proxy that injects
+one failure at a time:
+
+- refuse: the controller is off; connections are reset and refused,
+- reset: every request resets the connection,
+- blackhole: TCP is accepted but requests are never answered,
+- half_open: the open connections go silent for good, without FIN or RST,
+  while new connections work, as after a NAT timeout or controller reboot,
+- slow: responses arrive after --slow-delay,
+- truncate: responses are cut off halfway and the connection stalls.
+
+The coordinator is polled every --poll-interval after the previous poll ends,
+as Home Assistant does, through the connection's retry and circuit breaker.
+Each fault is held for --fault-duration (half_open clears at once) and
+reported for both transports with:
+
+- time to detect: from the fault until a poll fails or has to reconnect, or
+  has been running for longer than the transport timeout,
+- time to recover: from clearing it until the first successful poll ends,
+- executor threads held: most threads inside the Modbus client at a time,
+  sampled every 10 ms, and the thread-seconds they were held for,
+- blocked: the longest poll from the fault until recovery, so that a poll
+  hanging through the fault and then succeeding shows up,
+- updates lost: poll slots from the fault until recovery without fresh data,
+  and the failed polls among them.
+
+Requires the Home Assistant development environment; run from the
+repository root:
+
+    python -m tools.faults --fault-duration 20 --faults blackhole half_open
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import struct
+import sys
+import tempfile
+import threading
+import time
+from typing import Any
+
+from custom_components.acond_heat_pump.client import DEFAULT_TIMEOUT
+
+from .simulator import HeatPumpSimulator
+from .startup import async_setup_heat_pump
+
+FAULTS = ("refuse", "reset", "blackhole", "half_open", "slow", "truncate")
+TRANSPORTS = ("asyncio", "executor")
+
+_MBAP_HEADER = struct.Struct(">HHHB")
+
+# Code running in a thread with any of these in its stack holds it for the
+# heat pump
+_CLIENT_FILES = ("pymodbus", "acond_heat_pump")
+
+# Polls are left to the harness
+_NO_POLLING = {
+    "scan_interval": 3600,
+    "min_scan_interval": 3600,
+    "max_scan_interval": 3600,
+}
+
+
+class _Link:
+    """A client connection and its upstream connection to the simulator."""
+
+    def __init__(
+        self, client: asyncio.StreamWriter, upstream: asyncio.StreamWriter
+    ) -> None:
+        """Initialize the link."""
+        self.client = client
+        self.upstream = upstream
+        self.frozen = False
+        """Never forwards again; set for half-open and truncated links."""
+
+    def abort(self) -> None:
+        """Reset both connections."""
+        self.client.transport.abort()
+        self.upstream.transport.abort()
+
+
+class FaultProxy:
+    """Modbus TCP proxy in front of the simulator injecting one fault at a time."""
+
+    def __init__(
+        self,
+        target_host: str,
+        target_port: int,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        slow_delay: float = 2 * DEFAULT_TIMEOUT,
+    ) -> None:
+        """Initialize the proxy; slow_delay is the delay of the slow fault [s]."""
+        self.target_host = target_host
+        self.target_port = target_port
+        self.host = host
+        self.port = port
+        self.slow_delay = slow_delay
+        self.fault: str | None = None
+        self._server: asyncio.Server | None = None
+        self._links: set[_Link] = set()
+
+    async def start(self) -> None:
+        """Start listening; the bound port is available as self.port."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop listening and reset every link."""
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        for link in list(self._links):
+            link.abort()
+
+    async def inject(self, fault: str) -> None:
+        """Start a fault."""
+        self.fault = fault
+        if fault == "refuse":
+            await self.stop()
+        elif fault == "half_open":
+            for link in self._links:
+                link.frozen = True
+
+    async def clear(self) -> None:
+        """End the fault; half-open links stay silent."""
+        if self.fault == "refuse":
+            await self.start()
+        self.fault = None
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Proxy one client connection."""
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection(
+                self.target_host, self.target_port
+            )
+        except OSError:
+            writer.transport.abort()
+            return
+        link = _Link(writer, upstream_writer)
+        self._links.add(link)
+        try:
+            await asyncio.gather(
+                self._forward_requests(link, reader),
+                self._forward_responses(link, upstream_reader),
+            )
+        except (OSError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._links.discard(link)
+            link.abort()
+
+    async def _forward_requests(
+        self, link: _Link, reader: asyncio.StreamReader
+    ) -> None:
+        """Forward requests to the simulator unless the fault swallows them."""
+        while data := await reader.read(4096):
+            if self.fault == "reset":
+                link.abort()
+                return
+            if link.frozen or self.fault in ("blackhole", "half_open"):
+                continue
+            link.upstream.write(data)
+            await link.upstream.drain()
+        link.abort()
+
+    async def _forward_responses(
+        self, link: _Link, reader: asyncio.StreamReader
+    ) -> None:
+        """Forward response frames, delayed or cut off by the fault."""
+        while True:
+            header = await reader.readexactly(_MBAP_HEADER.size)
+            _, _, length, _ = _MBAP_HEADER.unpack(header)
+            frame = header + await reader.readexactly(length - 1)
+            if link.frozen:
+                continue
+            if self.fault == "slow":
+                asyncio.get_running_loop().call_later(
+                    self.slow_delay, self._send, link, frame
+                )
+                continue
+            if self.fault == "truncate":
+                link.frozen = True
+                frame = frame[: len(frame) // 2]
+            link.client.write(frame)
+
+    @staticmethod
+    def _send(link: _Link, frame: bytes) -> None:
+        """Send a delayed response unless the link has gone away."""
+        if not link.client.is_closing():
+            link.client.write(frame)
+
+
+class ThreadSampler:
+    """Count the executor threads inside the Modbus client, sampled periodically."""
+
+    def __init__(self, interval: float = 0.01) -> None:
+        """Initialize the sampler."""
+        self.interval = interval
+        self.peak = 0
+        self.thread_seconds = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start sampling on the running loop."""
+        self._task = asyncio.create_task(self._sample())
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _sample(self) -> None:
+        """Sample the stacks of every thread but the event loop's."""
+        loop_thread = threading.get_ident()
+        while True:
+            held = 0
+            for ident, frame in sys._current_frames().items():
+                if ident == loop_thread:
+                    continue
+                while frame is not None:
+                    if any(name in frame.f_code.co_filename for name in _CLIENT_FILES):
+                        held += 1
+                        break
+                    frame = frame.f_back
+            self.peak = max(self.peak, held)
+            self.thread_seconds += held * self.interval
+            await asyncio.sleep(self.interval)
+
+
+async def measure_fault(
+    transport: str, fault: str, args: argparse.Namespace
+) -> dict[str, Any]:
+    """Inject one fault against one transport and time detection and recovery."""
+    simulator = HeatPumpSimulator(seed=1)
+    await simulator.start()
+    proxy = FaultProxy(simulator.host, simulator.port, slow_delay=args.slow_delay)
+    await proxy.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass, coordinator = await async_setup_heat_pump(
+            config_dir,
+            proxy.host,
+            proxy.port,
+            {"transport": transport, **_NO_POLLING},
+        )
+        stats = coordinator.connection.stats
+        polls: list[tuple[float, float, bool, bool]] = []
+        """Start, end, success and whether the fault was noticed, per poll."""
+        running: list[float] = []
+        """Start of the poll in progress."""
+
+        async def _async_poll_forever() -> None:
+            while True:
+                running[:] = [start := time.monotonic()]
+                attempts = stats.retries + stats.reconnects
+                await coordinator.async_refresh()
+                ok = coordinator.last_update_success
+                noticed = not ok or stats.retries + stats.reconnects > attempts
+                polls.append((start, time.monotonic(), ok, noticed))
+                running.clear()
+                await asyncio.sleep(args.poll_interval)
+
+        poller = asyncio.create_task(_async_poll_forever())
+        await asyncio.sleep(3 * args.poll_interval)
+        sampler = ThreadSampler()
+        sampler.start()
+        injected = time.monotonic()
+        await proxy.inject(fault)
+        if fault != "half_open":
+            await asyncio.sleep(args.fault_duration)
+        await proxy.clear()
+        cleared = time.monotonic()
+
+        def _detected() -> float | None:
+            # A poll blocked past the timeout is detected then, even if it
+            # succeeds once the fault clears
+            now = time.monotonic()
+            times = [
+                min(end, start + DEFAULT_TIMEOUT)
+                for start, end, _, noticed in polls
+                if noticed or end - start > DEFAULT_TIMEOUT
+            ]
+            times += [
+                start + DEFAULT_TIMEOUT
+                for start in running
+                if now - start > DEFAULT_TIMEOUT
+            ]
+            return min((time_ for time_ in times if time_ >= injected), default=None)
+
+        def _recovered() -> float | None:
+            # A poll that noticed the fault and still succeeded recovers too,
+            # as after a half-open connection
+            since = max(cleared, _detected() or cleared)
+            return next((end for _, end, ok, _ in polls if ok and end >= since), None)
+
+        while (recovered := _recovered()) is None:
+            if time.monotonic() - cleared > args.recovery_timeout:
+                break
+            await asyncio.sleep(0.05)
+        sampler.stop()
+        poller.cancel()
+        detected = _detected()
+        window_end = recovered if recovered is not None else time.monotonic()
+        fresh = sum(
+            1
+            for start, end, ok, _ in polls
+            if ok and start >= injected and end < window_end
+        )
+        failures = sum(1 for _, end, ok, _ in polls if not ok and end >= injected)
+        durations = [
+            min(end, window_end) - max(start, injected)
+            for start, end, _, _ in polls
+            if end >= injected and start < window_end
+        ]
+        durations += [window_end - max(start, injected) for start in running]
+        await hass.config_entries.async_unload(coordinator.config_entry.entry_id)
+        await hass.async_stop()
+    await proxy.stop()
+    await simulator.stop()
+    return {
+        "detect_s": None if detected is None else detected - injected,
+        "recover_s": None if recovered is None else recovered - cleared,
+        "threads_held": sampler.peak,
+        "thread_seconds": sampler.thread_seconds,
+        "blocked_s": max(durations, default=0.0),
+        "updates_lost": max(
+            int((window_end - injected) / args.poll_interval) - fresh, 0
+        ),
+        "failed_polls": failures,
+    }
+
+
+def print_report(results: dict[str, dict[str, dict[str, Any]]]) -> None:
+    """Print a human readable table."""
+    print(
+        f"{'transport':<10} {'fault':<10} {'detect':>8} {'recover':>8} "
+        f"{'blocked':>8} {'threads':>8} {'thread-s':>9} {'lost':>6} {'failed':>7}"
+    )
+    for transport, faults in results.items():
+        for fault, result in faults.items():
+            detect, recover = (
+                "-" if result[key] is None else f"{result[key]:.2f}"
+                for key in ("detect_s", "recover_s")
+            )
+            print(
+                f"{transport:<10} {fault:<10} {detect:>8} {recover:>8} "
+                f"{result['blocked_s']:>8.2f} {result['threads_held']:>8} "
+                f"{result['thread_seconds']:>9.2f} "
+                f"{result['updates_lost']:>6} {result['failed_polls']:>7}"
+            )
+    print("detect, recover and blocked in seconds; - never happened")
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Run the harness."""
+    results: dict[str, dict[str, dict[str, Any]]] = {}
+    for transport in args.transports:
+        results[transport] = {}
+        for fault in args.faults:
+            results[transport][fault] = await measure_fault(transport, fault, args)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results)
+
+
+def main() -> None:
+    """Parse arguments and run the harness."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--faults", nargs="+", choices=FAULTS, default=list(FAULTS))
+    parser.add_argument(
+        "--transports", nargs="+", choices=TRANSPORTS, default=list(TRANSPORTS)
+    )
+    parser.add_argument("--fault-duration", type=float, default=20.0, help="seconds")
+    parser.add_argument(
+        "--recovery-timeout",
+        type=float,
+        default=120.0,
+        help="give up waiting for recovery after this long [s]",
+    )
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="seconds")
+    parser.add_argument(
+        "--slow-delay",
+        type=float,
+        default=2 * DEFAULT_TIMEOUT,
+        help="response delay of the slow fault [s]",
+    )
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.CRITICAL)
+    asyncio.run(_async_main(args))
+
+
+if __name__ == "__main__":
+    main()
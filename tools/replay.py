@@ -0,0 +1,149 @@
+"""Replay a Modbus traffic log through the Acond Heat Pump integration.
+
+Sets the integration up with its replay transport serving the log, and polls
+the coordinator until the log is used up. Every response goes through the
+same frame parsing, decoding and entity updates as live traffic, so a log
+recorded at a misbehaving site reproduces its values. Reports the polls per
+second and the entity states written. With --speed 0 the coordinator is
+polled as fast as it goes; otherwise at the scan interval, with the log
+replayed at speed times the recorded pace.
+
+--record N first records N polls of the local simulator to the log, using the
+integration's own traffic recorder. Requires the Home Assistant development
+environment; run from the repository root:
+
+    python -m tools.replay acond.frames --record 1000 --drop-rate 0.01
+    python -m tools.replay acond.frames
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from .simulator import HeatPumpSimulator
+from .startup import ENTRY_ID, async_setup_heat_pump
+
+DOMAIN = "acond_heat_pump"
+
+
+async def _async_poll(coordinator: Any) -> None:
+    """Poll once, ignoring the circuit breaker; failures are part of a log."""
+    coordinator.connection.retry_at = 0.0
+    await coordinator.async_refresh()
+
+
+async def async_record(log: Path, polls: int, drop_rate: float) -> dict[str, Any]:
+    """Record polls of the simulator to log."""
+    simulator = HeatPumpSimulator(drop_rate=drop_rate, seed=1)
+    await simulator.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass, coordinator = await async_setup_heat_pump(
+            config_dir, simulator.host, simulator.port, {"traffic_log": True}
+        )
+        for _ in range(polls):
+            await _async_poll(coordinator)
+        await hass.config_entries.async_unload(ENTRY_ID)
+        await hass.async_stop()
+        shutil.copyfile(Path(config_dir) / f"{DOMAIN}.{ENTRY_ID}.frames", log)
+    await simulator.stop()
+    return {"polls": polls, "bytes": log.stat().st_size}
+
+
+async def async_replay(log: Path, speed: float) -> dict[str, Any]:
+    """Replay log through the integration until it is used up."""
+    from homeassistant.const import EVENT_STATE_CHANGED
+    from homeassistant.core import Event, callback
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass, coordinator = await async_setup_heat_pump(
+            config_dir,
+            "replay",
+            0,
+            {"replay_file": str(log.resolve()), "replay_speed": speed},
+        )
+        replay = coordinator.connection.replay
+        states = 0
+
+        @callback
+        def _async_state_changed(event: Event) -> None:
+            nonlocal states
+            states += 1
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, _async_state_changed)
+        polls = failures = 0
+        start = time.perf_counter()
+        while not replay.finished:
+            served = replay.served
+            await _async_poll(coordinator)
+            await hass.async_block_till_done()
+            polls += 1
+            failures += not coordinator.last_update_success
+            if not speed and replay.served == served:
+                # Left over requests the integration no longer makes
+                break
+            if speed:
+                interval = coordinator.update_interval.total_seconds()
+                await asyncio.sleep(interval / speed)
+        elapsed = time.perf_counter() - start
+        records = replay.records
+        await hass.config_entries.async_unload(ENTRY_ID)
+        await hass.async_stop()
+    return {
+        "records": records,
+        "polls": polls,
+        "failed_polls": failures,
+        "states_written": states,
+        "seconds": elapsed,
+        "polls_per_second": polls / elapsed if elapsed else 0.0,
+    }
+
+
+def main() -> None:
+    """Parse arguments, then record and replay."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("log", type=Path)
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0.0,
+        help="replay at this multiple of the recorded pace; 0 as fast as possible",
+    )
+    parser.add_argument(
+        "--record", type=int, metavar="N", help="first record N simulator polls"
+    )
+    parser.add_argument(
+        "--drop-rate",
+        type=float,
+        default=0.0,
+        help="probability that the simulator drops a recorded request",
+    )
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    results = {}
+    if args.record:
+        results["record"] = asyncio.run(
+            async_record(args.log, args.record, args.drop_rate)
+        )
+    results["replay"] = asyncio.run(async_replay(args.log, args.speed))
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for phase, result in results.items():
+        print(phase)
+        for key, value in result.items():
+            text = f"{value:.1f}" if isinstance(value, float) else str(value)
+            print(f"  {key:<18} {text}")
+
+
+if __name__ == "__main__":
+    main()
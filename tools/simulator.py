@@ -0,0 +1,288 @@
+"""Local Modbus TCP stand-in for an Acond heat pump.
+
+Serves the input register block behind HeatPumpResponse and the writable
+holding registers, mirroring setpoint and TC_set writes back into the input
+registers the way the real controller does. Latency, jitter and dropped
+connections can be injected to reproduce poor links. Latency is modelled as
+link delay: requests are processed on arrival and each response is sent after
+its own delay, so pipelined requests overlap and jitter can reorder them.
+
+Run standalone:
+
+    python -m tools.simulator --port 5020 --latency 0.02 --jitter 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import random
+import struct
+
+_LOGGER = logging.getLogger(__name__)
+
+_MBAP_HEADER = struct.Struct(">HHHB")
+
+READ_HOLDING_REGISTERS = 0x03
+READ_INPUT_REGISTERS = 0x04
+WRITE_SINGLE_REGISTER = 0x06
+WRITE_MULTIPLE_REGISTERS = 0x10
+
+ILLEGAL_FUNCTION = 0x01
+ILLEGAL_DATA_ADDRESS = 0x02
+
+INPUT_REGISTER_COUNT = 24
+HOLDING_REGISTER_COUNT = 13
+
+# Holding register -> input register it is reflected in
+_SETPOINT_MIRROR = {0: 0, 2: 2, 4: 4, 6: 14, 7: 7, 11: 12, 12: 18}
+
+# TC_set mode bit -> HeatPumpMode value reported in input register 13
+_MODE_BY_BIT = {0: 0, 1: 1, 2: 3, 3: 4, 4: 6, 5: 5}
+_MODE_BITS_MASK = 0b111111
+_SUMMER_MODE_BIT = 8
+
+# Status bits in input register 6
+_STATUS_ON = 1 << 0
+_STATUS_SUMMER = 1 << 10
+
+# Temperature registers that wander a little between polls
+_DRIFTING_REGISTERS = (1, 3, 5, 8, 9, 15, 17)
+
+
+def _temp(value: float) -> int:
+    """Encode a temperature as a signed, 0.1 °C scaled register."""
+    return round(value * 10) & 0xFFFF
+
+
+def default_input_registers() -> list[int]:
+    """Return a plausible input register block for a running unit."""
+    return [
+        _temp(21.0),  # indoor1_temp_set
+        _temp(20.6),  # indoor1_temp_actual
+        _temp(20.0),  # indoor2_temp_set
+        _temp(19.8),  # indoor2_temp_actual
+        _temp(48.0),  # dhw_temp_set
+        _temp(46.5),  # dhw_temp_actual
+        0b10011,  # status: on, running, pump circuit 1
+        _temp(35.0),  # water_back_temp_set
+        _temp(33.2),  # water_back_temp_actual
+        _temp(2.5),  # outdoor_temp_actual
+        _temp(12.0),  # solar_temp_actual
+        _temp(26.5),  # pool_temp_actual
+        _temp(28.0),  # pool_temp_set
+        0,  # heat_pump_mode: AUTOMATIC
+        0,  # regulation_mode: ACOND_THERM
+        _temp(3.1),  # brine_temp
+        0,  # heart_beat
+        _temp(38.0),  # water_outlet_temp_actual
+        _temp(18.0),  # water_outlet_temp_set
+        9000,  # compressor_capacity_max
+        0,  # err_number
+        0,  # err_number_SECMono
+        0,  # err_number_driver
+        4200,  # compressor_capacity_actual
+    ]
+
+
+class HeatPumpSimulator:
+    """Asyncio Modbus TCP server emulating the Acond register map."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        drop_rate: float = 0.0,
+        drift: bool = True,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the simulator.
+
+        latency and jitter are in seconds; drop_rate is the probability that a
+        request closes the connection instead of being answered.
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.drift = drift
+        self.input_registers = default_input_registers()
+        self.holding_registers = [0] * HOLDING_REGISTER_COUNT
+        self.holding_registers[5] = 1  # TC_set: AUTOMATIC
+        for holding, register in _SETPOINT_MIRROR.items():
+            self.holding_registers[holding] = self.input_registers[register]
+        self.requests = 0
+        self.connections = 0
+        self._random = random.Random(seed)
+        self._server: asyncio.Server | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> None:
+        """Start listening; the bound port is available as self.port."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        _LOGGER.info("Simulator listening on %s:%s", self.host, self.port)
+
+    async def stop(self) -> None:
+        """Stop the server and close all client connections."""
+        self.drop_connections()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def drop_connections(self) -> None:
+        """Abort every open client connection, as a controller reboot would."""
+        for writer in list(self._writers):
+            writer.transport.abort()
+        self._writers.clear()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one client connection."""
+        self.connections += 1
+        self._writers.add(writer)
+        try:
+            while True:
+                header = await reader.readexactly(_MBAP_HEADER.size)
+                transaction_id, protocol_id, length, unit_id = _MBAP_HEADER.unpack(
+                    header
+                )
+                pdu = await reader.readexactly(length - 1)
+                self.requests += 1
+                if self._random.random() < self.drop_rate:
+                    writer.transport.abort()
+                    return
+                response = self.process(pdu)
+                frame = (
+                    _MBAP_HEADER.pack(
+                        transaction_id, protocol_id, len(response) + 1, unit_id
+                    )
+                    + response
+                )
+                delay = self.latency + self._random.uniform(0, self.jitter)
+                if delay:
+                    asyncio.get_running_loop().call_later(
+                        delay, self._send, writer, frame
+                    )
+                else:
+                    writer.write(frame)
+                    await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    @staticmethod
+    def _send(writer: asyncio.StreamWriter, frame: bytes) -> None:
+        """Send a delayed response unless the connection has gone away."""
+        if not writer.is_closing():
+            writer.write(frame)
+
+    def process(self, pdu: bytes) -> bytes:
+        """Process one request PDU and return the response PDU."""
+        function_code = pdu[0]
+        if function_code in (READ_INPUT_REGISTERS, READ_HOLDING_REGISTERS):
+            address, count = struct.unpack(">HH", pdu[1:5])
+            if function_code == READ_INPUT_REGISTERS:
+                self._tick()
+                registers = self.input_registers
+            else:
+                registers = self.holding_registers
+            if address + count > len(registers):
+                return bytes((function_code | 0x80, ILLEGAL_DATA_ADDRESS))
+            values = registers[address : address + count]
+            return bytes((function_code, count * 2)) + struct.pack(
+                f">{count}H", *values
+            )
+        if function_code == WRITE_SINGLE_REGISTER:
+            address, value = struct.unpack(">HH", pdu[1:5])
+            if address >= HOLDING_REGISTER_COUNT:
+                return bytes((function_code | 0x80, ILLEGAL_DATA_ADDRESS))
+            self._write_holding(address, value)
+            return pdu[:5]
+        if function_code == WRITE_MULTIPLE_REGISTERS:
+            address, count = struct.unpack(">HH", pdu[1:5])
+            if address + count > HOLDING_REGISTER_COUNT:
+                return bytes((function_code | 0x80, ILLEGAL_DATA_ADDRESS))
+            values = struct.unpack(f">{count}H", pdu[6 : 6 + count * 2])
+            for offset, value in enumerate(values):
+                self._write_holding(address + offset, value)
+            return pdu[:5]
+        return bytes((function_code | 0x80, ILLEGAL_FUNCTION))
+
+    def _write_holding(self, address: int, value: int) -> None:
+        """Store a holding register and reflect it in the input registers."""
+        self.holding_registers[address] = value
+        if (register := _SETPOINT_MIRROR.get(address)) is not None:
+            self.input_registers[register] = value
+        elif address == 5:
+            for bit, mode in _MODE_BY_BIT.items():
+                if value & _MODE_BITS_MASK & (1 << bit):
+                    self.input_registers[13] = mode
+                    break
+            status = self.input_registers[6]
+            if self.input_registers[13] == _MODE_BY_BIT[3]:
+                status &= ~_STATUS_ON
+            else:
+                status |= _STATUS_ON
+            if value & (1 << _SUMMER_MODE_BIT):
+                status |= _STATUS_SUMMER
+            else:
+                status &= ~_STATUS_SUMMER
+            self.input_registers[6] = status
+
+    def _tick(self) -> None:
+        """Advance the heartbeat and let measurements drift."""
+        self.input_registers[16] = (self.input_registers[16] + 1) & 0xFFFF
+        if not self.drift:
+            return
+        for register in _DRIFTING_REGISTERS:
+            self.input_registers[register] = (
+                self.input_registers[register] + self._random.choice((-1, 0, 0, 1))
+            ) & 0xFFFF
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Run the simulator until interrupted."""
+    simulator = HeatPumpSimulator(
+        args.host,
+        args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        drop_rate=args.drop_rate,
+        seed=args.seed,
+    )
+    await simulator.start()
+    print(f"Acond simulator listening on {simulator.host}:{simulator.port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulator.stop()
+
+
+def main() -> None:
+    """Parse arguments and run the simulator."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5020)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_async_main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
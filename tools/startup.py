@@ -0,0 +1,329 @@
+"""Startup budget for the Acond Heat Pump integration.
+
+Measures, each in a fresh interpreter so nothing is already imported:
+
+- integration import: loading the integration and its config flow, which Home
+  Assistant does at boot for every configured integration; the device library
+  must not be imported by it,
+- runtime import: the device library, coordinator and entity platforms, which
+  load when the first heat pump is set up,
+- time to first entity: from setting up the integration against the local
+  simulator until the first entity state is written, with and without a
+  persisted snapshot.
+
+Home Assistant modules the loader has already imported at that point are
+imported before the clock starts, so only the integration's own cost is
+counted. The median of --runs runs is compared with its budget; the exit
+status is 1 if any budget is exceeded. Requires the Home Assistant development
+environment; run from the repository root:
+
+    python -m tools.startup --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import json
+import logging
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .simulator import HeatPumpSimulator, default_input_registers
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+INTEGRATION = "custom_components.acond_heat_pump"
+ENTRY_ID = "startup"
+
+# Loaded by Home Assistant before it imports an integration
+HA_PRELOADED = (
+    "homeassistant.bootstrap",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.importlib",
+    "homeassistant.helpers.selector",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+    "voluptuous",
+)
+
+# Entity components set up by Home Assistant for the integration's platforms
+HA_ENTITY_COMPONENTS = tuple(
+    f"homeassistant.components.{platform}"
+    for platform in ("binary_sensor", "climate", "number", "select", "sensor")
+)
+
+# Median budgets [ms]
+BUDGETS = {
+    "integration_import": 15.0,
+    "runtime_import": 150.0,
+    "first_entity": 300.0,
+    "first_entity_snapshot": 150.0,
+}
+
+
+def _import_all(names: tuple[str, ...]) -> None:
+    """Import modules whose cost is not the integration's."""
+    for name in names:
+        importlib.import_module(name)
+
+
+def measure_integration_import() -> dict[str, Any]:
+    """Time importing the integration and its config flow."""
+    _import_all(HA_PRELOADED)
+    start = time.perf_counter()
+    importlib.import_module(INTEGRATION)
+    importlib.import_module(f"{INTEGRATION}.config_flow")
+    return {
+        "ms": (time.perf_counter() - start) * 1000,
+        "library_imported": "acond_heat_pump" in sys.modules,
+    }
+
+
+def measure_runtime_import() -> dict[str, Any]:
+    """Time importing the device library, coordinator and entity platforms."""
+    _import_all(HA_PRELOADED + HA_ENTITY_COMPONENTS + (INTEGRATION,))
+    const = importlib.import_module(f"{INTEGRATION}.const")
+    start = time.perf_counter()
+    importlib.import_module(f"{INTEGRATION}.connection")
+    importlib.import_module(f"{INTEGRATION}.coordinator")
+    for platform in const.PLATFORMS:
+        importlib.import_module(f"{INTEGRATION}.{platform}")
+    return {"ms": (time.perf_counter() - start) * 1000}
+
+
+def write_storage(
+    config_dir: Path,
+    host: str,
+    port: int,
+    *,
+    snapshot: bool = False,
+    options: dict[str, Any] | None = None,
+) -> None:
+    """Persist a config entry for the simulator, and optionally a snapshot."""
+    storage = config_dir / ".storage"
+    storage.mkdir()
+    entry = {
+        "entry_id": ENTRY_ID,
+        "domain": "acond_heat_pump",
+        "title": "Acond Heat Pump",
+        "data": {"host": host, "port": port},
+        "options": options or {},
+        "source": "user",
+        "version": 1,
+        "minor_version": 1,
+        "unique_id": host,
+        "pref_disable_new_entities": False,
+        "pref_disable_polling": False,
+        "disabled_by": None,
+        "created_at": "2026-01-01T00:00:00+00:00",
+        "modified_at": "2026-01-01T00:00:00+00:00",
+        "discovery_keys": {},
+        "subentries": [],
+    }
+    files: dict[str, Any] = {"core.config_entries": {"entries": [entry]}}
+    if snapshot:
+        files[f"acond_heat_pump.{ENTRY_ID}"] = {
+            "registers": default_input_registers(),
+            "read_at": "2026-01-01T00:00:00+00:00",
+        }
+    for key, data in files.items():
+        (storage / key).write_text(
+            json.dumps({"version": 1, "minor_version": 1, "key": key, "data": data})
+        )
+
+
+async def async_start_hass(config_dir: str) -> HomeAssistant:
+    """Start a bare Home Assistant loading the config entries in config_dir."""
+    # Imported here so the import measurements start from a clean interpreter
+    from homeassistant import config_entries, loader
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers import area_registry as ar
+    from homeassistant.helpers import category_registry as cr
+    from homeassistant.helpers import device_registry as dr
+    from homeassistant.helpers import entity
+    from homeassistant.helpers import entity_registry as er
+    from homeassistant.helpers import floor_registry as fr
+    from homeassistant.helpers import issue_registry as ir
+    from homeassistant.helpers import label_registry as lr
+    from homeassistant.util.unit_system import METRIC_SYSTEM
+
+    hass = HomeAssistant(config_dir)
+    hass.config.units = METRIC_SYSTEM
+    hass.config.skip_pip = True
+    entity.async_setup(hass)
+    loader.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    for registry in (ar, cr, dr, er, fr, ir, lr):
+        await registry.async_load(hass)
+    await hass.config_entries.async_initialize()
+    await hass.async_start()
+    _import_all(HA_ENTITY_COMPONENTS)
+    # Only discovery in the config flow uses the network integration, and
+    # setting it up needs the HTTP server
+    hass.config.components.add("network")
+    return hass
+
+
+async def async_setup_heat_pump(
+    config_dir: str, host: str, port: int, options: dict[str, Any]
+) -> tuple[HomeAssistant, Any]:
+    """Start Home Assistant with one heat pump; return it and its coordinator."""
+    from homeassistant.setup import async_setup_component
+
+    write_storage(Path(config_dir), host, port, options=options)
+    hass = await async_start_hass(config_dir)
+    if not await async_setup_component(hass, "acond_heat_pump", {}):
+        raise SystemExit("integration setup failed")
+    await hass.async_block_till_done()
+    return hass, hass.config_entries.async_get_entry(ENTRY_ID).runtime_data
+
+
+async def _async_measure_first_entity(latency: float, snapshot: bool) -> float:
+    """Set the integration up against the simulator; return ms to first state."""
+    from homeassistant.const import EVENT_STATE_CHANGED
+    from homeassistant.core import Event, callback
+    from homeassistant.setup import async_setup_component
+
+    simulator = HeatPumpSimulator(latency=latency, seed=1)
+    await simulator.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        write_storage(
+            Path(config_dir), simulator.host, simulator.port, snapshot=snapshot
+        )
+        hass = await async_start_hass(config_dir)
+
+        first_state: list[float] = []
+
+        @callback
+        def _async_state_changed(event: Event) -> None:
+            if not first_state:
+                first_state.append(time.perf_counter())
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, _async_state_changed)
+        start = time.perf_counter()
+        if not await async_setup_component(hass, "acond_heat_pump", {}):
+            raise SystemExit("integration setup failed")
+        await hass.async_block_till_done()
+        await hass.async_stop()
+    await simulator.stop()
+    if not first_state:
+        raise SystemExit("no entity state was written")
+    return (first_state[0] - start) * 1000
+
+
+def measure_first_entity(latency: float, snapshot: bool) -> dict[str, Any]:
+    """Time from integration setup to the first entity state."""
+    return {"ms": asyncio.run(_async_measure_first_entity(latency, snapshot))}
+
+
+def _run_child(args: list[str]) -> dict[str, Any]:
+    """Run one measurement in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-m", "tools.startup", "--child", *args],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def run_budget(args: argparse.Namespace) -> dict[str, dict[str, Any]]:
+    """Run every measurement --runs times and compare medians with budgets."""
+    latency = str(args.latency)
+    children = {
+        "integration_import": ["integration_import"],
+        "runtime_import": ["runtime_import"],
+        "first_entity": ["first_entity", "--latency", latency],
+        "first_entity_snapshot": [
+            "first_entity",
+            "--latency",
+            latency,
+            "--snapshot",
+        ],
+    }
+    results = {}
+    for metric, child_args in children.items():
+        runs = [_run_child(child_args) for _ in range(args.runs)]
+        median = statistics.median(run["ms"] for run in runs)
+        budget = BUDGETS[metric] * args.budget_scale
+        results[metric] = {
+            "median_ms": median,
+            "max_ms": max(run["ms"] for run in runs),
+            "budget_ms": budget,
+            "ok": median <= budget,
+        }
+        if metric == "integration_import":
+            imported = any(run["library_imported"] for run in runs)
+            results[metric]["library_imported"] = imported
+            results[metric]["ok"] &= not imported
+    return results
+
+
+def print_report(results: dict[str, dict[str, Any]]) -> None:
+    """Print a human readable table."""
+    print(f"{'metric':<22} {'median':>9} {'max':>9} {'budget':>9}  (ms)")
+    for metric, result in results.items():
+        status = "ok" if result["ok"] else "OVER BUDGET"
+        if result.get("library_imported"):
+            status = "LIBRARY IMPORTED"
+        print(
+            f"{metric:<22} {result['median_ms']:>9.1f} {result['max_ms']:>9.1f} "
+            f"{result['budget_ms']:>9.1f}  {status}"
+        )
+
+
+def main() -> None:
+    """Parse arguments and check the startup budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.05,
+        help="simulator link delay in seconds for the first entity measurements",
+    )
+    parser.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="multiply every budget, e.g. 3 on slow hardware",
+    )
+    parser.add_argument("--json", action="store_true")
+    parser.add_argument(
+        "--child",
+        choices=("integration_import", "runtime_import", "first_entity"),
+        help=argparse.SUPPRESS,
+    )
+    parser.add_argument("--snapshot", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        logging.basicConfig(level=logging.ERROR)
+        if args.child == "integration_import":
+            result = measure_integration_import()
+        elif args.child == "runtime_import":
+            result = measure_runtime_import()
+        else:
+            result = measure_first_entity(args.latency, args.snapshot)
+        print(json.dumps(result))
+        return
+
+    results = run_budget(args)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results)
+    if not all(result["ok"] for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()